@@ -0,0 +1,44 @@
+import argparse
+import os
+import sys
+
+from benchmarks.benchmark_suite import BenchmarkSuite
+from common.config import *
+
+
+def parse_size(size: str) -> tuple:
+    rows, columns = size.lower().split('x')
+    return int(rows), int(columns)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the fitness calculator, the operators and the evolution "
+                                                 "on synthetic grids.")
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[(20, 20), (100, 100), (1000, 1000)],
+                        help="grid sizes as ROWSxCOLUMNS")
+    parser.add_argument('--towers', nargs='+', type=int, default=[10, 100], help="tower counts")
+    parser.add_argument('--repeats', type=int, default=3, help="timed repetitions of each benchmark")
+    parser.add_argument('--generations', type=int, default=5, help="generations of the full run benchmark")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory measurements")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the grids and benchmarks")
+    parser.add_argument('--output', default=os.path.join(BENCHMARKS_DIR, 'latest.json'),
+                        help="the results file to write")
+    parser.add_argument('--baseline', help="a results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.1, help="accepted relative throughput loss")
+    arguments = parser.parse_args()
+
+    suite = BenchmarkSuite(sizes=arguments.sizes, tower_counts=arguments.towers, repeats=arguments.repeats,
+                           run_generations=arguments.generations, measure_memory=not arguments.no_memory,
+                           seed=arguments.seed)
+    results = suite.run()
+    BenchmarkSuite.write(results, arguments.output)
+
+    for name, result in results['benchmarks'].items():
+        print(f"{name}: {result['throughput']:.2f} {result['unit']}")
+
+    if arguments.baseline:
+        regressions = BenchmarkSuite.compare(results, BenchmarkSuite.read(arguments.baseline), arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression {regression['name']}: {regression['baseline_throughput']:.2f} -> "
+                  f"{regression['throughput']:.2f} ({regression['change']:+.1%})")
+        sys.exit(1 if regressions else 0)
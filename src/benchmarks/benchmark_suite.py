@@ -0,0 +1,310 @@
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.synthetic_grid import SyntheticGridGenerator
+from common.config import *
+from core.algorithm import EvolutionaryAlgorithm
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.population import Population
+from core.tower_chromosome import TowerChromosome
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.initialization.clustering_initializer import ClusteringInitializer
+from operators.mutation.gaussian_mutation_operator import GaussianMutationOperator
+from operators.mutation.swap_mutation_operator import SwapMutationOperator
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+from operators.selection.fitness_proportionate_operator import FitnessProportionateOperator
+from operators.selection.mu_plus_lambda_operator import MuPlusLambdaOperator
+from operators.selection.stochastic_universal_sampling_operator import StochasticUniversalSamplingOperator
+from operators.selection.tournament_operator import TournamentOperator
+
+
+class BenchmarkSuite:
+    """
+    Times the fitness calculator, the operators, one generation and a short run on synthetic problems of several sizes.
+
+    Every benchmark is repeated and reports its best wall time, the matching throughput and, optionally, the peak
+    memory allocated during one extra traced repetition. Benchmarks on the gene representation scale with the number
+    of cities in pure Python and are only run on grids of at most max_gene_cells cities; short runs are limited to
+    max_run_cells cities.
+    """
+
+    def __init__(self, sizes=((20, 20), (100, 100), (1000, 1000)), tower_counts=(10, 100), repeats: int = 3,
+                 run_generations: int = 5, max_gene_cells: int = 2_500, max_run_cells: int = 10_000,
+                 measure_memory: bool = True, seed: int = 0):
+        """
+        Initializes the suite.
+
+        Args:
+            sizes (tuple): The (rows, columns) grid sizes to benchmark.
+            tower_counts (tuple): The number of towers of the benchmarked chromosomes.
+            repeats (int): The number of timed repetitions of each benchmark.
+            run_generations (int): The number of generations of the full run benchmark.
+            max_gene_cells (int): The largest grid, in cities, on which the gene representation is benchmarked.
+            max_run_cells (int): The largest grid, in cities, on which full runs are benchmarked.
+            measure_memory (bool): Whether to trace the peak memory of each benchmark in an extra repetition.
+            seed (int): The seed of the synthetic grids and of every benchmark.
+        """
+        self.sizes = sizes
+        self.tower_counts = tower_counts
+        self.repeats = repeats
+        self.run_generations = run_generations
+        self.max_gene_cells = max_gene_cells
+        self.max_run_cells = max_run_cells
+        self.measure_memory = measure_memory
+        self.seed = seed
+        self.grid_generator = SyntheticGridGenerator()
+        self.results = {}
+
+    def run(self) -> dict:
+        """
+        Runs every benchmark on every grid size and tower count.
+
+        Returns:
+            dict: The environment and the results of each benchmark, keyed by benchmark name.
+        """
+        self.results = {}
+        for rows, columns in self.sizes:
+            for tower_count in self.tower_counts:
+                config = self.grid_generator.generate(rows, columns, self.seed, towers_min=tower_count,
+                                                      towers_max=tower_count)
+                self.__run_problem(f'{rows}x{columns},towers={tower_count}', config, tower_count)
+
+        return {'environment': self.environment(), 'benchmarks': self.results}
+
+    def measure(self, name: str, function, operations: int, unit: str, setup=None) -> dict:
+        """
+        Times a benchmark and records its result.
+
+        Args:
+            name (str): The name of the benchmark.
+            function (callable): The benchmarked function, called with the value returned by setup.
+            operations (int): The number of operations performed by one call, e.g. the evaluated chromosomes.
+            unit (str): The unit of the throughput, e.g. 'evaluations/s'.
+            setup (callable): Builds the argument of each call outside of the timed section. Defaults to None.
+
+        Returns:
+            dict: The best time, the mean time, the throughput and the peak memory of the benchmark.
+        """
+        times = []
+        for repeat in range(self.repeats):
+            self.__seed(repeat)
+            argument = setup() if setup else None
+            start = time.perf_counter()
+            function(argument)
+            times.append(time.perf_counter() - start)
+
+        best_time = min(times)
+        result = {
+            'seconds': best_time,
+            'mean_seconds': sum(times) / len(times),
+            'operations': operations,
+            'throughput': operations / best_time if best_time > 0 else float('inf'),
+            'unit': unit,
+            'peak_memory_bytes': self.__peak_memory(function, setup) if self.measure_memory else None
+        }
+        self.results[name] = result
+        return result
+
+    @staticmethod
+    def environment() -> dict:
+        """
+        Describes the machine running the benchmarks.
+        """
+        return {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        }
+
+    @staticmethod
+    def compare(results: dict, baseline: dict, tolerance: float = 0.1) -> list:
+        """
+        Finds the benchmarks whose throughput dropped by more than the tolerance relative to a baseline.
+
+        Args:
+            results (dict): The results of the current run, as returned by run.
+            baseline (dict): The results of the baseline run, as returned by run.
+            tolerance (float): The accepted relative throughput loss.
+
+        Returns:
+            list: One dictionary per regression with the benchmark name, both throughputs and the relative change.
+        """
+        regressions = []
+        for name, result in results['benchmarks'].items():
+            baseline_result = baseline['benchmarks'].get(name)
+            if baseline_result is None:
+                continue
+
+            change = result['throughput'] / baseline_result['throughput'] - 1
+            if change < -tolerance:
+                regressions.append({
+                    'name': name,
+                    'baseline_throughput': baseline_result['throughput'],
+                    'throughput': result['throughput'],
+                    'change': change
+                })
+        return regressions
+
+    @staticmethod
+    def write(results: dict, path: str) -> None:
+        """
+        Writes benchmark results to a JSON file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump(results, file, indent=4)
+
+    @staticmethod
+    def read(path: str) -> dict:
+        """
+        Reads benchmark results from a JSON file.
+        """
+        with open(path, 'r') as file:
+            return json.load(file)
+
+    def __run_problem(self, problem, config, tower_count):
+        """
+        Runs the benchmarks of one problem instance.
+        """
+        self.__seed(0)
+        fitness_calculator = FitnessCalculator(config=config)
+        population_arrays = [self.__random_arrays(config, tower_count) for _ in range(POPULATION_SIZE)]
+        towers, towers_count, assignments = fitness_calculator.pack(population_arrays)
+        gene_benchmarks = config.cities_count <= self.max_gene_cells
+
+        self.measure(f'fitness.evaluate_population[{problem}]',
+                     lambda _: fitness_calculator.evaluate_population(towers, towers_count, assignments),
+                     POPULATION_SIZE, 'evaluations/s')
+        self.measure(f'fitness.calculate_fitness_vectorized[{problem}]',
+                     lambda _: fitness_calculator.calculate_fitness_vectorized(*population_arrays[0]),
+                     1, 'evaluations/s')
+
+        self.measure(f'fitness.calc_best_covering_towers[{problem}]',
+                     lambda _: fitness_calculator.calc_best_covering_towers(population_arrays[0][0]),
+                     1, 'decodings/s')
+
+        if gene_benchmarks:
+            genes = Chromosome.from_arrays(*population_arrays[0], config).genes
+            other_genes = Chromosome.from_arrays(*population_arrays[1], config).genes
+            self.measure(f'fitness.calculate_fitness[{problem}]',
+                         lambda _: fitness_calculator.calculate_fitness(genes), 1, 'evaluations/s')
+            self.measure(f'operators.gaussian_mutation[{problem}]',
+                         lambda copied_genes: GaussianMutationOperator(config=config).mutate(copied_genes,
+                                                                                             MUTATION_RATE),
+                         1, 'chromosomes/s', setup=lambda: MultiPointsCrossoverOperator.copy(genes))
+            self.measure(f'operators.swap_mutation[{problem}]',
+                         lambda copied_genes: SwapMutationOperator().mutate(copied_genes, MUTATION_RATE),
+                         1, 'chromosomes/s', setup=lambda: list(genes))
+            self.measure(f'operators.multi_point_crossover[{problem}]',
+                         lambda _: MultiPointsCrossoverOperator().crossover(genes, other_genes, 1.0),
+                         1, 'crossovers/s')
+
+        self.measure(f'operators.mutate_towers[{problem}]',
+                     lambda arrays: GaussianMutationOperator(config=config).mutate_towers(arrays[0], MUTATION_RATE),
+                     1, 'chromosomes/s', setup=lambda: self.__copy_arrays(population_arrays[0]))
+        self.measure(f'operators.mutate_assignment[{problem}]',
+                     lambda arrays: SwapMutationOperator().mutate_assignment(arrays[1], MUTATION_RATE),
+                     1, 'chromosomes/s', setup=lambda: self.__copy_arrays(population_arrays[0]))
+        self.measure(f'operators.crossover_arrays[{problem}]',
+                     lambda _: MultiPointsCrossoverOperator().crossover_arrays(population_arrays[0],
+                                                                               population_arrays[1], 1.0),
+                     1, 'crossovers/s')
+        self.measure(f'operators.crossover_batch[{problem}]',
+                     lambda _: MultiPointsCrossoverOperator().crossover_batch(population_arrays[::2],
+                                                                              population_arrays[1::2], 1.0),
+                     POPULATION_SIZE // 2, 'crossovers/s')
+
+        chromosomes = [CompactChromosome.from_arrays(*arrays, config) for arrays in population_arrays]
+        for chromosome, fitness in zip(chromosomes, fitness_calculator.evaluate_population(towers, towers_count,
+                                                                                          assignments)[0]):
+            chromosome.fitness = float(fitness)
+        self.measure(f'operators.fitness_proportionate_selection[{problem}]',
+                     lambda _: FitnessProportionateOperator().select(chromosomes, POPULATION_SIZE),
+                     POPULATION_SIZE, 'selections/s')
+        self.measure(f'operators.tournament_selection[{problem}]',
+                     lambda _: TournamentOperator().select(chromosomes, POPULATION_SIZE),
+                     POPULATION_SIZE, 'selections/s')
+        self.measure(f'operators.stochastic_universal_sampling[{problem}]',
+                     lambda _: StochasticUniversalSamplingOperator().select(chromosomes, POPULATION_SIZE),
+                     POPULATION_SIZE, 'selections/s')
+        self.measure(f'operators.mu_plus_lambda[{problem}]',
+                     lambda _: MuPlusLambdaOperator().select(chromosomes, chromosomes[::-1]),
+                     2 * POPULATION_SIZE, 'chromosomes/s')
+
+        if config.cities_count <= self.max_run_cells:
+            self.measure(f'operators.clustering_initialization[{problem}]',
+                         lambda _: ClusteringInitializer(config=config).initialize(CompactChromosome, POPULATION_SIZE),
+                         POPULATION_SIZE, 'chromosomes/s')
+
+        chromosome_types = [CompactChromosome, TowerChromosome] + ([Chromosome] if gene_benchmarks else [])
+        for chromosome_type in chromosome_types:
+            algorithm = EvolutionaryAlgorithm(1, chromosome_type, fitness_workers=0, evolution_workers=1,
+                                              config=config)
+            self.measure(f'evolution.generation.{chromosome_type.__name__}[{problem}]',
+                         lambda population: algorithm.evolve_generation(population), 1, 'generations/s',
+                         setup=lambda: self.__evaluated_population(chromosome_type, config))
+
+            if config.cities_count <= self.max_run_cells:
+                algorithm = EvolutionaryAlgorithm(self.run_generations, chromosome_type, fitness_workers=0,
+                                                  evolution_workers=1, config=config)
+                self.measure(f'evolution.run.{chromosome_type.__name__}[{problem}]',
+                             lambda _: self.__quiet(algorithm.evolve_replicate, self.seed),
+                             self.run_generations, 'generations/s')
+
+    def __seed(self, repeat):
+        random.seed(self.seed + repeat)
+        np.random.seed(self.seed + repeat)
+
+    def __peak_memory(self, function, setup):
+        """
+        Returns the peak memory in bytes allocated by one call of a benchmarked function.
+        """
+        self.__seed(self.repeats)
+        argument = setup() if setup else None
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            function(argument)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def __random_arrays(config, tower_count):
+        """
+        Returns a random (towers, assignment) genome using every one of tower_count towers.
+        """
+        towers = np.empty((tower_count, 3), dtype=np.float64)
+        towers[:, 0] = np.random.uniform(config.location_min_x, config.location_max_x, tower_count)
+        towers[:, 1] = np.random.uniform(config.location_min_y, config.location_max_y, tower_count)
+        towers[:, 2] = np.random.uniform(config.bandwidth_min, config.bandwidth_max, tower_count)
+        assignment = np.random.randint(0, tower_count, config.cities_count).astype(np.int32)
+        return MultiPointsCrossoverOperator.compact(towers, assignment)
+
+    @staticmethod
+    def __copy_arrays(arrays):
+        return tuple(array.copy() for array in arrays)
+
+    @staticmethod
+    def __evaluated_population(chromosome_type, config):
+        population = Population.initialize(chromosome_type, config)
+        population.evaluate_fitness()
+        return population
+
+    @staticmethod
+    def __quiet(function, *args):
+        """
+        Calls a function with its standard output discarded.
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function(*args)
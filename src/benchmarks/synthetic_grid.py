@@ -0,0 +1,77 @@
+import numpy as np
+
+from common.config import *
+from common.helper import Helper
+from common.problem_config import ProblemConfig
+
+
+class SyntheticGridGenerator:
+    """
+    Generates random problem instances of any size for benchmarks.
+
+    Block populations are drawn uniformly like the ones of the bundled resource grid, and the costs and user
+    satisfaction tables are those of the bundled problem configuration unless given.
+    """
+
+    def __init__(self, population_min: int = 0, population_max: int = 1000, problem_config: dict = None):
+        """
+        Initializes the generator.
+
+        Args:
+            population_min (int): The smallest block population.
+            population_max (int): The largest block population.
+            problem_config (dict): The costs and user satisfaction tables. Defaults to the bundled problem
+                                   configuration.
+        """
+        self.population_min = population_min
+        self.population_max = population_max
+        self.problem_config = problem_config or Helper.read_problem_config(PROBLEM_CONFIG_FILE)
+
+    def generate_grid(self, rows: int, columns: int, seed: int = None) -> np.ndarray:
+        """
+        Generates a random blocks population grid.
+
+        Args:
+            rows (int): The number of grid rows.
+            columns (int): The number of grid columns.
+            seed (int): The seed of the grid. Defaults to fresh entropy.
+
+        Returns:
+            numpy.ndarray: A (rows, columns) int64 array of block populations.
+        """
+        generator = np.random.default_rng(seed)
+        return generator.integers(self.population_min, self.population_max, size=(rows, columns), endpoint=True)
+
+    def generate(self, rows: int, columns: int, seed: int = None, **kwargs) -> ProblemConfig:
+        """
+        Generates a random problem instance.
+
+        Args:
+            rows (int): The number of grid rows.
+            columns (int): The number of grid columns.
+            seed (int): The seed of the grid. Defaults to fresh entropy.
+            **kwargs: Further arguments of the ProblemConfig constructor, e.g. towers_min and towers_max.
+
+        Returns:
+            ProblemConfig: The generated problem configuration.
+        """
+        return ProblemConfig(self.generate_grid(rows, columns, seed), self.problem_config, **kwargs)
+
+    def write(self, path: str, rows: int, columns: int, seed: int = None) -> str:
+        """
+        Generates a random blocks population grid and saves it in the memory-mappable .npy format.
+
+        Args:
+            path (str): The .npy file to write.
+            rows (int): The number of grid rows.
+            columns (int): The number of grid columns.
+            seed (int): The seed of the grid. Defaults to fresh entropy.
+
+        Returns:
+            str: The path of the written file.
+        """
+        if not path.endswith('.npy'):
+            raise ValueError(f"Binary blocks population files must end with .npy, got '{path}'")
+
+        np.save(path, self.generate_grid(rows, columns, seed))
+        return path
@@ -1,30 +1,84 @@
-from common.helper import Helper
+import os
 
-BLOCKS_POPULATION_FILE = '../resources/blocks_population.txt'
-PROBLEM_CONFIG_FILE = '../resources/problem_config.txt'
-BLOCKS_POPULATION = Helper.read_blocks_population(BLOCKS_POPULATION_FILE)
-PROBLEM_CONFIG = Helper.read_problem_config(PROBLEM_CONFIG_FILE)
-CITIES_POPULATION = [col for row in BLOCKS_POPULATION for col in row]
-CITIES_LOCATION = [(i, j) for i in range(len(BLOCKS_POPULATION)) for j in range(len(BLOCKS_POPULATION[0]))]
-CITIES_COUNT = len(CITIES_LOCATION)
-TOWER_CONSTRUCTION_COST = PROBLEM_CONFIG['tower_construction_cost']
-TOWER_MAINTENANCE_COST = PROBLEM_CONFIG['tower_maintenance_cost']
-USER_SATISFACTION_LEVELS = PROBLEM_CONFIG['user_satisfaction_levels']
-USER_SATISFACTIONS_SCORES = PROBLEM_CONFIG['user_satisfaction_scores']
+RESOURCES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'resources'))
+BLOCKS_POPULATION_FILE = os.path.join(RESOURCES_DIR, 'blocks_population.txt')
+PROBLEM_CONFIG_FILE = os.path.join(RESOURCES_DIR, 'problem_config.txt')
 POPULATION_SIZE = 50
+CLUSTERED_INITIALIZATION_RATIO = 0.0
+CLUSTERED_TOWERS_MAX = None
+KMEANS_ITERATIONS = 5
 MAX_GENERATIONS = 200
+STAGNATION_GENERATIONS = 0
+STAGNATION_TOLERANCE = 0.0
+TARGET_FITNESS = None
+MAX_EVALUATIONS = 0
+TIME_BUDGET_SECONDS = 0
 CROSSOVER_RATE = 0.9
+CROSSOVER_METHOD = 'multi_point'
+CROSSOVER_POINTS = 2
 MUTATION_RATE = 0.1
+# The batched mutation shuffles the selected cities instead of swapping them pairwise and mutates every distinct Gene
+# of a gene-based Chromosome once, so it is a different operator from the per-chromosome mutate and is opt-in.
+BATCHED_MUTATION = False
+BANDWIDTH_WEIGHTED_DECODING = False
+LOCAL_SEARCH_TOP_K = 0
+LOCAL_SEARCH_FINAL = False
+LOCAL_SEARCH_SWEEPS = 3
+BANDWIDTH_REPAIR = False
+BANDWIDTH_FINAL = False
+SELECTION_OPERATOR = 'fitness_proportionate'
+TOURNAMENT_SIZE = 3
 LOCATION_MUTATION_STD = 1.0
 BANDWIDTH_MUTATION_STD = 500.0
 LOCATION_MIN_X = 0
-LOCATION_MAX_X = len(BLOCKS_POPULATION)
 LOCATION_MIN_Y = 0
-LOCATION_MAX_Y = len(BLOCKS_POPULATION[0])
 BANDWIDTH_MIN = 1
 BANDWIDTH_MAX = 5000
 TOWERS_MIN = 1
-TOWERS_MAX = len(CITIES_LOCATION)
 TOTAL_SATISFACTION_RATIO = 0.2
 TOTAL_COST_RATIO = 0.1
 EVOLUTION_TIMES = 10
+INCREMENTAL_FITNESS_CHECK = False
+FITNESS_CACHE_SIZE = 10000
+PARALLEL_FITNESS_WORKERS = 0
+PARALLEL_FITNESS_CHUNK_SIZE = 8
+EVOLUTION_WORKERS = 1
+ISLANDS = 4
+MIGRATION_INTERVAL = 10
+MIGRANTS = 2
+MIGRATION_TOPOLOGY = 'ring'
+COVERAGE_TOLERANCE = None
+PROFILE_EVOLUTION = False
+TRACE_MEMORY = False
+CHECKPOINT_INTERVAL = 0
+CHECKPOINT_DIR = os.path.join(RESOURCES_DIR, 'checkpoints')
+HEADLESS = False
+PROGRESS_DIR = os.path.join(RESOURCES_DIR, 'progress')
+PROGRESS_FLUSH_INTERVAL = 50
+PLOTS_DIR = os.path.join(RESOURCES_DIR, 'plots')
+RESULTS_DIR = os.path.join(RESOURCES_DIR, 'results')
+BENCHMARKS_DIR = os.path.join(RESOURCES_DIR, 'benchmarks')
+
+# Constants derived from the resource files. They are read from the default ProblemConfig on first access, so
+# importing this module does not parse any file; new code should take a ProblemConfig instead.
+PROBLEM_CONSTANTS = {
+    'BLOCKS_POPULATION': 'blocks_population',
+    'PROBLEM_CONFIG': 'problem_config',
+    'CITIES_POPULATION': 'cities_population',
+    'CITIES_LOCATION': 'cities_location',
+    'CITIES_COUNT': 'cities_count',
+    'TOWER_CONSTRUCTION_COST': 'tower_construction_cost',
+    'TOWER_MAINTENANCE_COST': 'tower_maintenance_cost',
+    'USER_SATISFACTION_LEVELS': 'user_satisfaction_levels',
+    'USER_SATISFACTIONS_SCORES': 'user_satisfaction_scores',
+    'LOCATION_MAX_X': 'location_max_x',
+    'LOCATION_MAX_Y': 'location_max_y',
+    'TOWERS_MAX': 'towers_max',
+}
+
+
+def __getattr__(name):
+    if name in PROBLEM_CONSTANTS:
+        from common.problem_config import ProblemConfig
+        return getattr(ProblemConfig.default(), PROBLEM_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,8 @@
 import json
 import os
-import time
 from random import randint
 
-from matplotlib import pyplot as plt
+import numpy as np
 
 
 class Helper:
@@ -28,6 +27,43 @@ class Helper:
             matrix = [list(map(int, line.strip().split(','))) for line in file]
         return matrix
 
+    @staticmethod
+    def load_blocks_population(path: str) -> np.ndarray:
+        """
+        Loads the blocks population data as a 2D array.
+
+        A .npy file is memory-mapped read-only, so even very large grids are paged in on demand instead of being read
+        up front. Any other file is parsed as the comma-separated text format of read_blocks_population.
+
+        Args:
+            path (str): File containing the blocks population data.
+
+        Returns:
+            numpy.ndarray: A (rows, columns) array of the blocks population.
+        """
+        if path.endswith('.npy'):
+            return np.load(path, mmap_mode='r')
+        return np.loadtxt(path, delimiter=',', dtype=np.int64, ndmin=2)
+
+    @staticmethod
+    def convert_blocks_population(source_path: str, target_path: str) -> str:
+        """
+        Converts a blocks population text file into the binary .npy format read by load_blocks_population.
+
+        Args:
+            source_path (str): The comma-separated text file to convert.
+            target_path (str): The .npy file to write.
+
+        Returns:
+            str: The path of the written file.
+        """
+        if not target_path.endswith('.npy'):
+            raise ValueError(f"Binary blocks population files must end with .npy, got '{target_path}'")
+
+        os.makedirs(os.path.dirname(os.path.abspath(target_path)), exist_ok=True)
+        np.save(target_path, Helper.load_blocks_population(source_path))
+        return target_path
+
     @staticmethod
     def read_problem_config(path: str) -> dict:
         """
@@ -73,6 +109,8 @@ class Helper:
         Returns:
         None
         """
+        from matplotlib import pyplot as plt
+
         plt.fill_between(x, y_min, y_max, alpha=0.3)
         plt.plot(x, y)
 
@@ -83,21 +121,39 @@ class Helper:
         plt.show()
 
     @staticmethod
-    def write_dict_to_json(dictionary):
+    def save_plot(x, y, y_min, y_max, x_label, y_label, title, path: str) -> str:
         """
-        Write a dictionary to a JSON file with indentation for pretty formatting.
+        Save a plot of the given data to an image file without opening a window.
+
+        The figure is rendered with the non-interactive Agg canvas, so this works on machines without a display and
+        leaves the pyplot backend untouched.
 
         Args:
-            dictionary (dict): The dictionary to be written to JSON.
+        - x (list): A list of x-coordinates for the plot.
+        - y (list): A list of y-coordinates for the plot.
+        - y_min (list): A list of minimum y-coordinates for shading the area between the minimum and maximum values.
+        - y_max (list): A list of maximum y-coordinates for shading the area between the minimum and maximum values.
+        - x_label (str): The label for the x-axis.
+        - y_label (str): The label for the y-axis.
+        - title (str): The title of the plot.
+        - path (str): The image file to write, e.g. a .png file.
 
         Returns:
-            None
+        str: The path of the written file.
         """
-        current_time_millis = int(round(time.time() * 1000))
-        log_file_name = f"../resources/solutions/{current_time_millis}.json"
-
-        # Create parent directories if they do not exist
-        os.makedirs(os.path.dirname(log_file_name), exist_ok=True)
-
-        with open(log_file_name, 'w') as file:
-            json.dump(dictionary, file, indent=4)
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.fill_between(x, y_min, y_max, alpha=0.3)
+        axes.plot(x, y)
+
+        axes.set_xlabel(x_label)
+        axes.set_ylabel(y_label)
+        axes.set_title(title)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        figure.savefig(path)
+        return path
@@ -0,0 +1,92 @@
+import numpy as np
+
+from common.config import *
+from common.helper import Helper
+
+
+class ProblemConfig:
+    """
+    Holds the data of one problem instance: the blocks population grid, the costs and the user satisfaction tables,
+    together with the values derived from them.
+
+    Instances are passed to the fitness calculator, the operators, the populations and the algorithm, so several
+    problem instances can coexist in one process. The default instance is read from the resource files the first time
+    it is needed.
+
+    The per-city data is kept in flat arrays in row-major grid order: cities_population is a view of the grid, so a
+    memory-mapped grid stays memory-mapped, and cities_location is a (cities, 2) float array of (row, column) pairs.
+    """
+    default_instance = None
+
+    def __init__(self, blocks_population, problem_config: dict,
+                 bandwidth_min: float = BANDWIDTH_MIN,
+                 bandwidth_max: float = BANDWIDTH_MAX,
+                 towers_min: int = TOWERS_MIN,
+                 towers_max: int = None,
+                 total_satisfaction_ratio: float = TOTAL_SATISFACTION_RATIO,
+                 total_cost_ratio: float = TOTAL_COST_RATIO):
+        """
+        Initializes the problem configuration.
+
+        Args:
+            blocks_population (numpy.ndarray): A (rows, columns) array or matrix of the blocks population.
+            problem_config (dict): The costs and user satisfaction tables as read by Helper.read_problem_config.
+            bandwidth_min (float): Minimum value for the bandwidth of a tower.
+            bandwidth_max (float): Maximum value for the bandwidth of a tower.
+            towers_min (int): Minimum number of towers of a random solution.
+            towers_max (int): Maximum number of towers of a random solution. Defaults to the number of cities.
+            total_satisfaction_ratio (float): The weight of the total user satisfaction in the fitness.
+            total_cost_ratio (float): The weight of the total cost in the fitness.
+        """
+        self.blocks_population = np.asanyarray(blocks_population)
+        rows, columns = self.blocks_population.shape
+        self.problem_config = problem_config
+        self.tower_construction_cost = problem_config['tower_construction_cost']
+        self.tower_maintenance_cost = problem_config['tower_maintenance_cost']
+        self.user_satisfaction_levels = problem_config['user_satisfaction_levels']
+        self.user_satisfaction_scores = problem_config['user_satisfaction_scores']
+        self.cities_population = self.blocks_population.reshape(-1)
+        self.cities_location = np.empty((rows * columns, 2), dtype=np.float64)
+        self.cities_location[:, 0] = np.repeat(np.arange(rows), columns)
+        self.cities_location[:, 1] = np.tile(np.arange(columns), rows)
+        self.cities_count = rows * columns
+        self.location_min_x = LOCATION_MIN_X
+        self.location_max_x = rows
+        self.location_min_y = LOCATION_MIN_Y
+        self.location_max_y = columns
+        self.bandwidth_min = bandwidth_min
+        self.bandwidth_max = bandwidth_max
+        self.towers_min = towers_min
+        self.towers_max = towers_max if towers_max is not None else self.cities_count
+        self.total_satisfaction_ratio = total_satisfaction_ratio
+        self.total_cost_ratio = total_cost_ratio
+
+    @staticmethod
+    def from_files(blocks_population_file: str = BLOCKS_POPULATION_FILE,
+                   problem_config_file: str = PROBLEM_CONFIG_FILE, **kwargs) -> 'ProblemConfig':
+        """
+        Reads a problem configuration from a blocks population file and a problem configuration file.
+
+        Args:
+            blocks_population_file (str): File containing the blocks population data, either a .npy file, which is
+                                          memory-mapped, or the comma-separated text format.
+            problem_config_file (str): File containing the problem configuration data.
+            **kwargs: Further arguments of the ProblemConfig constructor.
+
+        Returns:
+            ProblemConfig: The problem configuration read from the files.
+        """
+        return ProblemConfig(Helper.load_blocks_population(blocks_population_file),
+                             Helper.read_problem_config(problem_config_file), **kwargs)
+
+    @staticmethod
+    def default() -> 'ProblemConfig':
+        """
+        Returns the problem configuration of the default resource files, reading them on the first call.
+
+        Returns:
+            ProblemConfig: The default problem configuration.
+        """
+        if ProblemConfig.default_instance is None:
+            ProblemConfig.default_instance = ProblemConfig.from_files()
+        return ProblemConfig.default_instance
@@ -0,0 +1,52 @@
+import json
+import os
+
+
+class ProgressLog:
+    """
+    Appends one JSON record per line to a progress file, buffering the records in memory and writing them in batches.
+    """
+
+    def __init__(self, path: str, flush_interval: int = 50):
+        """
+        Opens the progress file for appending.
+
+        Args:
+            path (str): The JSONL file to append to. Parent directories are created if needed.
+            flush_interval (int): The number of records buffered before they are written.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.lines = []
+        self.file = open(path, 'a')
+
+    def write(self, record: dict) -> None:
+        """
+        Buffers a record, writing the buffer once it holds flush_interval records.
+        """
+        self.lines.append(json.dumps(record))
+        if len(self.lines) >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file.
+        """
+        if self.lines:
+            self.file.write('\n'.join(self.lines) + '\n')
+            self.lines = []
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Writes the buffered records and closes the file.
+        """
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
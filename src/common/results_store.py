@@ -0,0 +1,98 @@
+import json
+import os
+import time
+import uuid
+
+from common.config import *
+
+
+class ResultsStore:
+    """
+    An append-only store of run results.
+
+    results.jsonl holds one record per run with its solution and metrics. index.jsonl holds one small entry per run
+    with the run id, the summary fields of the solution and the byte range of the record, so queries only read the
+    index and then seek to the records they return.
+    """
+    INDEX_FIELDS = ('fitness', 'total_cost', 'total_satisfaction', 'num_of_towers', 'seed', 'generations',
+                    'stop_reason')
+
+    def __init__(self, directory: str = RESULTS_DIR):
+        """
+        Initializes the store. The files are created on the first append.
+
+        Args:
+            directory (str): The directory of results.jsonl and index.jsonl.
+        """
+        self.directory = directory
+        self.results_path = os.path.join(directory, 'results.jsonl')
+        self.index_path = os.path.join(directory, 'index.jsonl')
+
+    def append(self, solution_info: dict, metrics: dict = None) -> str:
+        """
+        Appends the result of a run.
+
+        Args:
+            solution_info (dict): The best solution of the run.
+            metrics (dict, optional): The phase metrics of the run.
+
+        Returns:
+            str: The unique id of the run.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        run_id = f'{int(round(time.time() * 1000))}-{uuid.uuid4().hex[:8]}'
+        record = (json.dumps({'run_id': run_id, 'solution': solution_info, 'metrics': metrics}) + '\n').encode()
+
+        with open(self.results_path, 'ab') as file:
+            file.seek(0, os.SEEK_END)
+            offset = file.tell()
+            file.write(record)
+
+        entry = {'run_id': run_id, 'offset': offset, 'length': len(record)}
+        entry.update({field: solution_info[field] for field in self.INDEX_FIELDS if field in solution_info})
+        with open(self.index_path, 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+
+        return run_id
+
+    def index(self) -> list:
+        """
+        Returns the index entries of all runs in the order they were appended.
+        """
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path, 'r') as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def best(self, count: int = 1, key: str = 'fitness') -> list:
+        """
+        Returns the records of the runs with the highest value of an index field.
+
+        Args:
+            count (int): The number of records to return.
+            key (str): The index field to rank the runs by.
+
+        Returns:
+            list: The records, best first.
+        """
+        entries = sorted((entry for entry in self.index() if entry.get(key) is not None),
+                         key=lambda entry: entry[key], reverse=True)
+        return self.read(entries[:count])
+
+    def get(self, run_id: str) -> dict:
+        """
+        Returns the record of the run with the given id, or None if there is no such run.
+        """
+        entries = [entry for entry in self.index() if entry['run_id'] == run_id]
+        return self.read(entries)[0] if entries else None
+
+    def read(self, entries) -> list:
+        """
+        Reads the records of the given index entries.
+        """
+        records = []
+        with open(self.results_path, 'rb') as file:
+            for entry in entries:
+                file.seek(entry['offset'])
+                records.append(json.loads(file.read(entry['length'])))
+        return records
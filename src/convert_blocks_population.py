@@ -0,0 +1,14 @@
+import argparse
+
+from common.config import *
+from common.helper import Helper
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert a blocks population text file into the memory-mappable "
+                                                 ".npy format.")
+    parser.add_argument('source', nargs='?', default=BLOCKS_POPULATION_FILE,
+                        help="the comma-separated blocks population file")
+    parser.add_argument('target', help="the .npy file to write")
+    arguments = parser.parse_args()
+
+    print(Helper.convert_blocks_population(arguments.source, arguments.target))
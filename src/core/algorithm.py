@@ -1,9 +1,51 @@
+import contextlib
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 
 from common.config import *
+from common.helper import Helper
+from common.progress_log import ProgressLog
+from common.results_store import ResultsStore
+from common.problem_config import ProblemConfig
+from core.checkpoint import Checkpoint, CheckpointWriter
 from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.evolution_metrics import EvolutionMetrics
+from core.island_model import IslandModel
 from core.population import Population
+from core.stopping_criteria import StoppingCriteria
+from core.tower_chromosome import TowerChromosome
+from operators.fitness.fitness_cache import FitnessCache
 from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.fitness.parallel_fitness_evaluator import ParallelFitnessEvaluator
+from operators.local_search.bandwidth_optimizer import BandwidthOptimizer
+from operators.local_search.greedy_reassignment_operator import GreedyReassignmentOperator
+
+
+CHROMOSOME_TYPES = {chromosome_type.__name__: chromosome_type
+                    for chromosome_type in (Chromosome, CompactChromosome, TowerChromosome)}
+
+
+def _evolve_replicate(generation_count, chromosome_type, config, profile, trace_memory, checkpoint_interval,
+                      checkpoint_dir, headless, stopping_criteria, local_search_top_k, local_search_final,
+                      bandwidth_repair, bandwidth_final, clustered_ratio, seed):
+    """
+    Runs one independent evolution in a worker process of run_evolve.
+    """
+    algorithm = EvolutionaryAlgorithm(generation_count, chromosome_type, fitness_workers=0, evolution_workers=1,
+                                      config=config, profile=profile, trace_memory=trace_memory,
+                                      checkpoint_interval=checkpoint_interval, checkpoint_dir=checkpoint_dir,
+                                      headless=headless, stopping_criteria=stopping_criteria,
+                                      local_search_top_k=local_search_top_k, local_search_final=local_search_final,
+                                      bandwidth_repair=bandwidth_repair, bandwidth_final=bandwidth_final,
+                                      clustered_ratio=clustered_ratio)
+    return algorithm.evolve_replicate(seed)
 
 
 class EvolutionaryAlgorithm:
@@ -13,16 +55,73 @@ class EvolutionaryAlgorithm:
     construction cost and maintenance cost based on the bandwidth.
     """
 
-    def __init__(self, generation_count: int):
+    def __init__(self, generation_count: int, chromosome_type=Chromosome,
+                 fitness_workers: int = PARALLEL_FITNESS_WORKERS, evolution_workers: int = EVOLUTION_WORKERS,
+                 seed: int = None, config: ProblemConfig = None, profile: bool = PROFILE_EVOLUTION,
+                 trace_memory: bool = TRACE_MEMORY, checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                 checkpoint_dir: str = CHECKPOINT_DIR, headless: bool = HEADLESS,
+                 results_store: ResultsStore = None, stopping_criteria: StoppingCriteria = None,
+                 local_search_top_k: int = LOCAL_SEARCH_TOP_K, local_search_final: bool = LOCAL_SEARCH_FINAL,
+                 bandwidth_repair: bool = BANDWIDTH_REPAIR, bandwidth_final: bool = BANDWIDTH_FINAL,
+                 clustered_ratio: float = CLUSTERED_INITIALIZATION_RATIO):
         """
         Initializes the genetic algorithm with the specified number of generations to evolve.
 
         Args:
-            generation_count (int): The number of generations to evolve.
+            generation_count (int): The largest number of generations to evolve. None evolves until a stopping
+                                    criterion is met, which requires an evaluation or time budget.
+            chromosome_type (type): The chromosome representation to evolve, e.g. Chromosome, CompactChromosome or
+                                    TowerChromosome.
+            fitness_workers (int): The number of worker processes used to evaluate fitness. 0 evaluates in-process.
+            evolution_workers (int): The number of worker processes running independent evolutions in run_evolve.
+            seed (int): The seed from which the per-run seeds are derived. Defaults to fresh entropy.
+            config (ProblemConfig): The problem to solve. Defaults to ProblemConfig.default().
+            profile (bool): Whether to profile each evolution with cProfile.
+            trace_memory (bool): Whether to trace the memory allocated by each evolution with tracemalloc.
+            checkpoint_interval (int): The number of generations between two checkpoints of a run. 0 disables
+                                       checkpoints.
+            checkpoint_dir (str): The directory of the checkpoint files, one per run seed.
+            headless (bool): Whether to log the progress of each run to PROGRESS_DIR/run-<seed>.jsonl instead of
+                             printing it, and to save the plot to PLOTS_DIR instead of showing it.
+            results_store (ResultsStore): The store the result of every run is appended to. Defaults to the store in
+                                          RESULTS_DIR.
+            stopping_criteria (StoppingCriteria): Ends a run before generation_count generations. Defaults to the
+                                                  configured criteria.
+            local_search_top_k (int): The number of best chromosomes improved by greedy city reassignment after every
+                                      generation. 0 disables the local search.
+            local_search_final (bool): Whether to improve the best chromosome of every run by greedy city
+                                       reassignment.
+            bandwidth_repair (bool): Whether to set the best bandwidths of every offspring after its evaluation.
+            bandwidth_final (bool): Whether to set the best bandwidths of the best chromosome of every run, after the
+                                    final greedy city reassignment.
+            clustered_ratio (float): The share of the initial population seeded by population-weighted k-means
+                                     clustering instead of at random.
 
         Attributes:
-            - generation_count (int): The number of generations to evolve.
-            - generations (numpy.ndarray): An array containing the indices of each generation.
+            - generation_count (int): The largest number of generations to evolve, None for no limit.
+            - chromosome_type (type): The chromosome representation to evolve.
+            - fitness_workers (int): The number of worker processes used to evaluate fitness.
+            - fitness_evaluator (ParallelFitnessEvaluator): The worker pool used during run_evolve, if any.
+            - evolution_workers (int): The number of worker processes running independent evolutions.
+            - seed (int): The seed from which the per-run seeds are derived.
+            - config (ProblemConfig): The problem to solve.
+            - profile (bool): Whether to profile each evolution with cProfile.
+            - trace_memory (bool): Whether to trace the memory allocated by each evolution with tracemalloc.
+            - checkpoint_interval (int): The number of generations between two checkpoints of a run.
+            - checkpoint_dir (str): The directory of the checkpoint files.
+            - headless (bool): Whether progress goes to JSONL files and the plot to an image file.
+            - results_store (ResultsStore): The store the result of every run is appended to.
+            - stopping_criteria (StoppingCriteria): Ends a run before generation_count generations.
+            - local_search_top_k (int): The number of best chromosomes improved after every generation.
+            - local_search_final (bool): Whether to improve the best chromosome of every run.
+            - reassignment_operator (GreedyReassignmentOperator): The local search moving cities between towers.
+            - bandwidth_repair (bool): Whether to set the best bandwidths of every offspring.
+            - bandwidth_final (bool): Whether to set the best bandwidths of the best chromosome of every run.
+            - bandwidth_optimizer (BandwidthOptimizer): The solver of the best bandwidth of every tower.
+            - clustered_ratio (float): The share of the initial population seeded by k-means clustering.
+            - fitness_cache_stats (list): The fitness cache counters of each finished run.
+            - generations (numpy.ndarray): An array containing the indices of each generation reached by a run.
+            - runs_of_generation (numpy.ndarray): An array containing the number of runs that reached each generation.
             - sum_of_avg_fitness (numpy.ndarray): An array containing the sum of the average fitness value for each
              generation.
             - min_of_avg_fitness (numpy.ndarray): An array containing the minimum average fitness value for each
@@ -30,100 +129,370 @@ class EvolutionaryAlgorithm:
             - max_of_avg_fitness (numpy.ndarray): An array containing the maximum average fitness value for each
             generation.
         """
+        stopping_criteria = stopping_criteria or StoppingCriteria()
+        if generation_count is None and not stopping_criteria.is_bounded():
+            raise ValueError("A run without a generation limit needs an evaluation or time budget")
 
         self.generation_count = generation_count
-        self.generations = np.arange(self.generation_count)
-        self.sum_of_avg_fitness = np.zeros(generation_count, dtype=np.float64)
-        self.min_of_avg_fitness = np.full(generation_count, np.finfo(np.float64).max)
-        self.max_of_avg_fitness = np.full(generation_count, np.finfo(np.float64).min)
+        self.chromosome_type = chromosome_type
+        self.fitness_workers = fitness_workers
+        self.fitness_evaluator = None
+        self.evolution_workers = evolution_workers
+        self.seed = seed
+        self.config = config or ProblemConfig.default()
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_dir = checkpoint_dir
+        self.headless = headless
+        self.results_store = results_store or ResultsStore()
+        self.stopping_criteria = stopping_criteria
+        self.local_search_top_k = local_search_top_k
+        self.local_search_final = local_search_final
+        self.reassignment_operator = GreedyReassignmentOperator(config=self.config)
+        self.bandwidth_repair = bandwidth_repair
+        self.bandwidth_final = bandwidth_final
+        self.bandwidth_optimizer = BandwidthOptimizer(config=self.config)
+        self.clustered_ratio = clustered_ratio
+        self.fitness_cache_stats = []
+        self.generations = np.arange(0)
+        self.runs_of_generation = np.zeros(0, dtype=np.int64)
+        self.sum_of_avg_fitness = np.zeros(0, dtype=np.float64)
+        self.min_of_avg_fitness = np.full(0, np.finfo(np.float64).max)
+        self.max_of_avg_fitness = np.full(0, np.finfo(np.float64).min)
 
     def run_evolve(self, times: int = 1):
-        for _ in range(times):
-            best_sol = self.__evolve()
-            Helper.write_dict_to_json(self.__get_best_solution_info(best_sol))
+        """
+        Runs several independent evolutions, appends the best solution and the phase metrics of each to the results
+        store as soon as it finishes and plots the average fitness per generation.
+
+        Every run gets its own seed derived from the algorithm's seed, so a run's result does not depend on whether
+        it executes in this process or in a worker process. With more than one evolution worker the runs are
+        dispatched to a process pool and their statistics merged here.
+
+        Args:
+            times (int): The number of independent evolutions.
+        """
+        seeds = [int(seed) for seed in np.random.SeedSequence(self.seed).generate_state(times)]
+
+        if self.evolution_workers > 1 and times > 1:
+            with ProcessPoolExecutor(max_workers=min(self.evolution_workers, times)) as executor:
+                futures = [executor.submit(_evolve_replicate, self.generation_count, self.chromosome_type,
+                                           self.config, self.profile, self.trace_memory,
+                                           self.checkpoint_interval, self.checkpoint_dir, self.headless,
+                                           self.stopping_criteria, self.local_search_top_k,
+                                           self.local_search_final, self.bandwidth_repair, self.bandwidth_final,
+                                           self.clustered_ratio, seed)
+                           for seed in seeds]
+                for future in as_completed(futures):
+                    self.__collect_replicate(*future.result())
+        else:
+            if self.fitness_workers > 0:
+                self.fitness_evaluator = ParallelFitnessEvaluator(
+                    workers=self.fitness_workers, fitness_calculator=FitnessCalculator.shared(self.config))
+
+            try:
+                for seed in seeds:
+                    self.__collect_replicate(*self.evolve_replicate(seed))
+            finally:
+                if self.fitness_evaluator is not None:
+                    self.fitness_evaluator.close()
+                    self.fitness_evaluator = None
+
+        self.__print_fitness_cache_stats()
+        self.__plot("Evolutionary algorithm")
+
+    def run_islands(self, island_model: IslandModel = None):
+        """
+        Runs one island-model evolution, appends its best solution and the phase metrics of every island to the
+        results store and plots the average fitness per generation.
+
+        The islands exchange migrants in lockstep, so they always evolve generation_count generations and the
+        stopping criteria are not applied.
+
+        Args:
+            island_model (IslandModel): The islands, migration interval, migrant count and topology to use. Defaults
+                                        to the configured island model.
+        """
+        if self.generation_count is None:
+            raise ValueError("The island model needs a generation limit")
+
+        island_model = island_model or IslandModel()
+        best_chromosome, avg_fitness, fitness_cache_stats, metrics = island_model.evolve(self, self.seed)
+
+        solution_info = self.__get_best_solution_info(best_chromosome)
+        solution_info['generations'] = self.generation_count
+        solution_info['stop_reason'] = 'generations'
+        self.__collect_replicate(solution_info, avg_fitness, FitnessCache.merge_stats(fitness_cache_stats),
+                                 {'islands': metrics})
+        self.__print_fitness_cache_stats()
+        self.__plot("Island model evolutionary algorithm")
+
+    def run_resume(self, checkpoint_file: str):
+        """
+        Resumes an interrupted run from its checkpoint, appends its best solution and phase metrics to the results
+        store and plots the average fitness per generation.
 
-        Helper.show_plot(x=self.generations, y=self.__get_average_of_avg_fitness(times),
-                         y_min=self.min_of_avg_fitness, y_max=self.max_of_avg_fitness,
-                         x_label="generation", y_label="fitness", title="Evolutionary algorithm")
+        The algorithm must have the generation count and chromosome type of the interrupted run, see from_checkpoint.
 
-    def __evolve(self):
+        Args:
+            checkpoint_file (str): The checkpoint file of the run.
+        """
+        self.__collect_replicate(*self.evolve_replicate(checkpoint=Checkpoint.load(checkpoint_file)))
+        self.__print_fitness_cache_stats()
+        self.__plot("Evolutionary algorithm")
+
+    @staticmethod
+    def from_checkpoint(checkpoint_file: str, **kwargs) -> 'EvolutionaryAlgorithm':
+        """
+        Creates an algorithm with the generation count and chromosome type of a checkpointed run.
+
+        Args:
+            checkpoint_file (str): The checkpoint file of the run.
+            **kwargs: Further arguments of the EvolutionaryAlgorithm constructor.
+
+        Returns:
+            EvolutionaryAlgorithm: An algorithm able to resume the run.
+        """
+        checkpoint = Checkpoint.load(checkpoint_file)
+        return EvolutionaryAlgorithm(checkpoint.generation_count, CHROMOSOME_TYPES[checkpoint.chromosome_type],
+                                     **kwargs)
+
+    def evolve_replicate(self, seed: int = None, checkpoint: Checkpoint = None):
+        """
+        Runs one independent evolution from the given seed, or resumes one from a checkpoint.
+
+        Args:
+            seed (int): The seed of the random and numpy.random generators for this run.
+            checkpoint (Checkpoint, optional): The checkpoint of an interrupted run to resume instead.
+
+        Returns:
+            tuple: The best solution info (including the seed, the number of generations and the stop reason), the
+                   average fitness of each generation, the fitness cache counters and the phase metrics of the run.
+        """
+        if checkpoint is None:
+            random.seed(seed)
+            np.random.seed(seed)
+        else:
+            seed = checkpoint.seed
+        FitnessCache.shared(self.config).clear()
+
+        metrics = EvolutionMetrics(self.generation_count, profile=self.profile, trace_memory=self.trace_memory)
+        metrics.start()
+        with CheckpointWriter(self.checkpoint_dir, self.checkpoint_interval) as checkpoint_writer, \
+                self.__progress_log(seed) as progress_log:
+            best_chromosome, avg_fitness, stop_reason = self.__evolve(metrics, seed, checkpoint_writer, progress_log,
+                                                                      checkpoint)
+        metrics.stop()
+
+        solution_info = self.__get_best_solution_info(best_chromosome)
+        solution_info['seed'] = seed
+        solution_info['generations'] = len(avg_fitness)
+        solution_info['stop_reason'] = stop_reason
+        return solution_info, avg_fitness, FitnessCache.shared(self.config).stats(), metrics.to_dict()
+
+    def __collect_replicate(self, solution_info, avg_fitness, fitness_cache_stats, metrics):
+        """
+        Appends the best solution and the phase metrics of a finished run to the results store and merges its
+        statistics. Runs may stop after different numbers of generations, so each generation only merges the runs
+        that reached it.
+        """
+        self.results_store.append(solution_info, metrics)
+
+        generations = len(avg_fitness)
+        if generations > len(self.generations):
+            added_generations = generations - len(self.generations)
+            self.generations = np.arange(generations)
+            self.runs_of_generation = np.concatenate((self.runs_of_generation,
+                                                      np.zeros(added_generations, dtype=np.int64)))
+            self.sum_of_avg_fitness = np.concatenate((self.sum_of_avg_fitness, np.zeros(added_generations)))
+            self.min_of_avg_fitness = np.concatenate((self.min_of_avg_fitness,
+                                                      np.full(added_generations, np.finfo(np.float64).max)))
+            self.max_of_avg_fitness = np.concatenate((self.max_of_avg_fitness,
+                                                      np.full(added_generations, np.finfo(np.float64).min)))
+
+        self.runs_of_generation[:generations] += 1
+        self.sum_of_avg_fitness[:generations] += avg_fitness
+        self.max_of_avg_fitness[:generations] = np.maximum(self.max_of_avg_fitness[:generations], avg_fitness)
+        self.min_of_avg_fitness[:generations] = np.minimum(self.min_of_avg_fitness[:generations], avg_fitness)
+        self.fitness_cache_stats.append(fitness_cache_stats)
+
+    def __evolve(self, metrics: EvolutionMetrics, seed: int, checkpoint_writer: CheckpointWriter, progress_log,
+                 checkpoint: Checkpoint = None):
         """
         Evolves the population for a certain number of generations or until a stopping criterion is met.
 
+        Args:
+        - metrics (EvolutionMetrics): Records the time spent in each phase.
+        - seed (int): The seed of the run, which names its checkpoint file.
+        - checkpoint_writer (CheckpointWriter): Writes a checkpoint every checkpoint_interval generations.
+        - progress_log (ProgressLog): Receives the statistics of every generation in headless mode, None otherwise.
+        - checkpoint (Checkpoint, optional): The checkpoint to resume from instead of a random population.
+
         Returns:
-        - The best chromosome from the final generation.
+        - The best chromosome from the final generation, improved by the final local searches if enabled, the
+          average fitness of each generation and the stop reason, one of STOP_REASONS.
         """
-        population = Population.initialize()
-        population.evaluate_fitness()
+        self.stopping_criteria.start()
+        if checkpoint is None:
+            first_generation = 0
+            avg_fitness, best_fitness = [], []
+            population = Population.initialize(self.chromosome_type, self.config, self.clustered_ratio)
+            with metrics.phase('evaluation'):
+                population.evaluate_fitness(self.fitness_evaluator)
+        else:
+            first_generation = checkpoint.generation
+            avg_fitness, best_fitness = checkpoint.avg_fitness.tolist(), checkpoint.best_fitness.tolist()
+            population = Population(checkpoint.chromosomes(self.chromosome_type, self.config), self.config)
+            population.evaluations = checkpoint.evaluations
+            checkpoint.restore_random_state()
+
+        if self.generation_count is None:
+            generations = itertools.count(first_generation)
+        else:
+            generations = range(first_generation, self.generation_count)
+
+        stop_reason = None
+        for generation in generations:
+            metrics.next_generation()
+            self.evolve_generation(population, metrics)
+
+            with metrics.phase('reporting'):
+                statistics = population.statistics()
+                self.__report_progress(progress_log, seed, generation, statistics)
+
+                avg_fitness.append(statistics['mean_fitness'])
+                best_fitness.append(statistics['best_fitness'])
+                stop_reason = self.stopping_criteria.stop_reason(best_fitness, population.evaluations)
+
+                if stop_reason is None and checkpoint_writer.is_due(generation + 1, self.generation_count):
+                    checkpoint_writer.write(Checkpoint.capture(seed, generation + 1, self.generation_count,
+                                                               population, avg_fitness, best_fitness))
 
-        for generation in range(self.generation_count):
+            if stop_reason is not None:
+                break
+
+        best_chromosome = population.get_best_chromosome()
+        if self.local_search_final or self.bandwidth_final:
+            with metrics.phase('local_search'):
+                if self.local_search_final:
+                    best_chromosome, _ = self.reassignment_operator.improve(best_chromosome)
+                if self.bandwidth_final:
+                    best_chromosome, _ = self.bandwidth_optimizer.improve(best_chromosome)
+
+        return best_chromosome, np.array(avg_fitness, dtype=np.float64), stop_reason or 'generations'
+
+    def evolve_generation(self, population, metrics: EvolutionMetrics = None):
+        """
+        Evolves the population by one generation in place: selection, pairing, crossover, mutation, evaluation and, if
+        enabled, bandwidth repair of the offspring, replacement and, if enabled, the local search of the best
+        chromosomes.
+
+        Args:
+        - population (Population): The evaluated population to evolve.
+        - metrics (EvolutionMetrics, optional): Records the time spent in each phase.
+
+        Returns:
+        - The same population, now holding the next generation.
+        """
+        phase = metrics.phase if metrics is not None else lambda name: contextlib.nullcontext()
+
+        with phase('selection'):
             selected_chromosomes = population.select_chromosomes()
 
-            new_generation = Population(selected_chromosomes)
+            new_generation = Population(selected_chromosomes, self.config)
+
+        with phase('pairing'):
+            pairs = new_generation.pair_chromosomes()
 
-            new_generation = new_generation.crossover(CROSSOVER_RATE)
+        with phase('crossover'):
+            new_generation = new_generation.crossover_pairs(pairs, CROSSOVER_RATE)
 
+        with phase('mutation'):
             new_generation.mutate(MUTATION_RATE)
 
-            new_generation.evaluate_fitness()
+        with phase('evaluation'):
+            new_generation.evaluate_fitness(self.fitness_evaluator)
+            if self.bandwidth_repair:
+                new_generation.local_search(self.bandwidth_optimizer, len(new_generation.chromosomes))
+            population.evaluations += new_generation.evaluations
 
+        with phase('replacement'):
             population.replace(new_generation)
 
-            self.__print_max_fitness(population)
+        with phase('local_search'):
+            if self.local_search_top_k > 0:
+                population.local_search(self.reassignment_operator, self.local_search_top_k)
 
-            self.__update_avg_fitness(generation, population)
+        return population
 
-        return population.get_best_chromosome()
+    def __progress_log(self, seed):
+        if not self.headless:
+            return contextlib.nullcontext()
+        return ProgressLog(os.path.join(PROGRESS_DIR, f'run-{seed}.jsonl'), PROGRESS_FLUSH_INTERVAL)
 
-    def __print_max_fitness(self, population):
-        max_fitness = max(population.chromosomes, key=lambda x: x.fitness).fitness
-        print(max_fitness)
+    @staticmethod
+    def __report_progress(progress_log, seed, generation, statistics):
+        if progress_log is None:
+            print(statistics['best_fitness'])
+        else:
+            progress_log.write({'seed': seed, 'generation': generation, **statistics})
 
-    def __update_avg_fitness(self, generation, population):
-        average = sum([chromosome.fitness for chromosome in population.chromosomes]) / len(population.chromosomes)
-        self.sum_of_avg_fitness[generation] += average
-        self.max_of_avg_fitness[generation] = max(average, self.max_of_avg_fitness[generation])
-        self.min_of_avg_fitness[generation] = min(average, self.min_of_avg_fitness[generation])
+    def __plot(self, title):
+        plot_arguments = dict(x=self.generations, y=self.__get_average_of_avg_fitness(),
+                              y_min=self.min_of_avg_fitness, y_max=self.max_of_avg_fitness,
+                              x_label="generation", y_label="fitness", title=title)
+        if self.headless:
+            current_time_millis = int(round(time.time() * 1000))
+            print(Helper.save_plot(**plot_arguments, path=os.path.join(PLOTS_DIR, f'{current_time_millis}.png')))
+        else:
+            Helper.show_plot(**plot_arguments)
 
-    @staticmethod
-    def __get_best_solution_info(chromosome: 'Chromosome'):
-        fitness_calc = FitnessCalculator()
-        allocations = fitness_calc.group_by(chromosome.genes)
-
-        fitness = fitness_calc.calculate_fitness(chromosome.genes)
-        total_cost = fitness_calc.calc_total_cost(chromosome.genes)
-        total_satisfaction = fitness_calc.calc_total_satisfaction(chromosome.genes)
-        num_of_towers = len(set(chromosome.genes))
-
-        towers = []
-        for tower, cities in allocations.items():
-            tower_info = {
-                'loc': tower.location,
-                'bw': tower.bandwidth,
-                'cities': []
-            }
-            for city_num in cities:
-                city_location = CITIES_LOCATION[city_num]
-                city_population = CITIES_POPULATION[city_num]
-                total_population = sum([CITIES_POPULATION[c] for c in cities])
-                bandwidth = fitness_calc.calc_bandwidth(tower, city_location, city_population, total_population)
-                city_satisfaction = fitness_calc.calc_city_satisfaction_score(bandwidth, city_population)
-                city_info = {
-                    'location': city_location,
-                    'population': city_population,
-                    'bw': bandwidth,
-                    'satisfaction': city_satisfaction
-                }
-                tower_info['cities'].append({city_num: city_info})
-            towers.append(tower_info)
+    def __print_fitness_cache_stats(self):
+        print(f"Fitness cache: {FitnessCache.merge_stats(self.fitness_cache_stats)}")
+
+    def __get_best_solution_info(self, chromosome: 'Chromosome'):
+        """
+        Builds the report of a solution from a single vectorized evaluation of its towers and assignment.
+        """
+        fitness_calc = FitnessCalculator.shared(self.config)
+        towers, assignment = chromosome.encode()
+        towers_population, cities_bandwidth, cities_satisfaction = fitness_calc.calc_cities_satisfaction(towers,
+                                                                                                       assignment)
+        towers_satisfaction = np.bincount(assignment,
+                                          weights=cities_satisfaction * fitness_calc.cities_population_array,
+                                          minlength=len(towers))
+
+        # Cities grouped by tower, in increasing city order within each tower.
+        cities = np.argsort(assignment, kind='stable')
+        tower_ends = np.cumsum(np.bincount(assignment, minlength=len(towers)))
+        cities_location = self.config.cities_location[cities].astype(np.int64).tolist()
+        cities_population = self.config.cities_population[cities].tolist()
+        cities_bandwidth = cities_bandwidth[cities].tolist()
+        cities_satisfaction = cities_satisfaction[cities].tolist()
+        cities = cities.tolist()
+
+        towers_info = []
+        for tower_index, (x, y, bandwidth) in enumerate(towers.tolist()):
+            tower_cities = range(tower_ends[tower_index - 1] if tower_index > 0 else 0, tower_ends[tower_index])
+            towers_info.append({
+                'loc': (x, y),
+                'bw': bandwidth,
+                'cities': [{cities[i]: {
+                    'location': tuple(cities_location[i]),
+                    'population': cities_population[i],
+                    'bw': cities_bandwidth[i],
+                    'satisfaction': cities_satisfaction[i]
+                }} for i in tower_cities]
+            })
 
         return {
-            'fitness': fitness,
-            'total_cost': total_cost,
-            'total_satisfaction': total_satisfaction,
-            'num_of_towers': num_of_towers,
-            'towers': towers
+            'fitness': fitness_calc.calc_fitness_from_towers_satisfaction(towers, towers_satisfaction),
+            'total_cost': fitness_calc.calc_total_cost_vectorized(towers),
+            'total_satisfaction': math.fsum(towers_satisfaction),
+            'num_of_towers': len(towers),
+            'towers': towers_info
         }
 
-    def __get_average_of_avg_fitness(self, times):
-        return self.sum_of_avg_fitness / times
+    def __get_average_of_avg_fitness(self):
+        return self.sum_of_avg_fitness / self.runs_of_generation
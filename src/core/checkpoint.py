@@ -0,0 +1,231 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from operators.fitness.fitness_calculator import FitnessCalculator
+
+
+class Checkpoint:
+    """
+    A snapshot of one evolution between two generations: the population arrays and fitness values, the average and
+    best fitness of the finished generations, the number of fitness evaluations and the state of the random and
+    numpy.random generators.
+
+    Restoring a checkpoint and evolving the remaining generations gives exactly the same result as the uninterrupted
+    run.
+    """
+
+    def __init__(self, seed: int, generation: int, generation_count: int, chromosome_type: str, towers, towers_count,
+                 assignments, fitness, avg_fitness, python_random_state, numpy_random_state, best_fitness=None,
+                 evaluations: int = 0):
+        """
+        Initializes the checkpoint.
+
+        Args:
+            seed (int): The seed of the run.
+            generation (int): The number of finished generations, i.e. the index of the next generation.
+            generation_count (int): The total number of generations of the run, None for no limit.
+            chromosome_type (str): The class name of the chromosome representation.
+            towers (numpy.ndarray): A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows padded with zeros.
+            towers_count (numpy.ndarray): The number of towers of each chromosome.
+            assignments (numpy.ndarray): A (chromosomes, cities) array with the tower index of each city.
+            fitness (numpy.ndarray): The fitness value of each chromosome.
+            avg_fitness (numpy.ndarray): The average fitness of each finished generation.
+            python_random_state (tuple): The state of the random module, as returned by random.getstate.
+            numpy_random_state (tuple): The state of numpy.random, as returned by numpy.random.get_state.
+            best_fitness (numpy.ndarray): The best fitness of each finished generation. Defaults to an empty array.
+            evaluations (int): The number of fitness evaluations performed so far.
+        """
+        self.seed = seed
+        self.generation = generation
+        self.generation_count = generation_count
+        self.chromosome_type = chromosome_type
+        self.towers = towers
+        self.towers_count = towers_count
+        self.assignments = assignments
+        self.fitness = fitness
+        self.avg_fitness = avg_fitness
+        self.python_random_state = python_random_state
+        self.numpy_random_state = numpy_random_state
+        self.best_fitness = best_fitness if best_fitness is not None else np.empty(0, dtype=np.float64)
+        self.evaluations = evaluations
+
+    @staticmethod
+    def capture(seed: int, generation: int, generation_count: int, population, avg_fitness,
+                best_fitness) -> 'Checkpoint':
+        """
+        Takes a checkpoint of an evaluated population after the given number of finished generations.
+
+        All arrays are copies, so the population can keep evolving while the checkpoint is written.
+
+        Args:
+            seed (int): The seed of the run.
+            generation (int): The number of finished generations.
+            generation_count (int): The total number of generations of the run, None for no limit.
+            population (Population): The evaluated population, with the number of fitness evaluations of the run.
+            avg_fitness (list): The average fitness of each finished generation.
+            best_fitness (list): The best fitness of each finished generation.
+
+        Returns:
+            Checkpoint: The checkpoint.
+        """
+        chromosomes = population.chromosomes
+        towers, towers_count, assignments = FitnessCalculator.pack([chromosome.encode() for chromosome in chromosomes])
+        return Checkpoint(seed, generation, generation_count, type(chromosomes[0]).__name__, towers, towers_count,
+                          assignments, np.array([chromosome.fitness for chromosome in chromosomes], dtype=np.float64),
+                          np.array(avg_fitness[:generation], dtype=np.float64), random.getstate(),
+                          np.random.get_state(), np.array(best_fitness[:generation], dtype=np.float64),
+                          population.evaluations)
+
+    def chromosomes(self, chromosome_type, config=None) -> list:
+        """
+        Rebuilds the evaluated chromosomes of the checkpoint.
+
+        Args:
+            chromosome_type (type): The chromosome representation to build.
+            config (ProblemConfig): The problem the chromosomes solve. Defaults to ProblemConfig.default().
+
+        Returns:
+            list: The chromosomes with their fitness set.
+        """
+        chromosomes = []
+        for towers, towers_count, assignment, fitness in zip(self.towers, self.towers_count, self.assignments,
+                                                            self.fitness):
+            chromosome = chromosome_type.from_arrays(towers[:towers_count], assignment, config)
+            chromosome.fitness = float(fitness)
+            chromosomes.append(chromosome)
+        return chromosomes
+
+    def restore_random_state(self) -> None:
+        """
+        Restores the random and numpy.random generators to their state at the checkpoint.
+        """
+        random.setstate(self.python_random_state)
+        np.random.set_state(self.numpy_random_state)
+
+    def save(self, path: str) -> str:
+        """
+        Writes the checkpoint to an uncompressed .npz archive.
+
+        The archive is first written to a temporary file next to path and then renamed over it, so path always holds
+        a complete checkpoint even if the process dies while writing.
+
+        Args:
+            path (str): The .npz file to write.
+
+        Returns:
+            str: The path of the written file.
+        """
+        version, mersenne_state, gauss_next = self.python_random_state
+        bit_generator, keys, position, has_gauss, cached_gaussian = self.numpy_random_state
+        temporary_path = f'{path}.tmp'
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(temporary_path, 'wb') as file:
+            np.savez(file, seed=self.seed, generation=self.generation, generation_count=self.generation_count or 0,
+                     chromosome_type=self.chromosome_type, towers=self.towers, towers_count=self.towers_count,
+                     assignments=self.assignments, fitness=self.fitness, avg_fitness=self.avg_fitness,
+                     best_fitness=self.best_fitness, evaluations=self.evaluations,
+                     python_random_version=version, python_random_state=np.array(mersenne_state, dtype=np.uint64),
+                     python_gauss_next=np.nan if gauss_next is None else gauss_next,
+                     numpy_bit_generator=bit_generator, numpy_random_keys=keys,
+                     numpy_random_position=position, numpy_has_gauss=has_gauss,
+                     numpy_cached_gaussian=cached_gaussian)
+        os.replace(temporary_path, path)
+        return path
+
+    @staticmethod
+    def load(path: str) -> 'Checkpoint':
+        """
+        Reads a checkpoint written by save. Checkpoints written before the best fitness and the evaluation count
+        were recorded are read with an empty best fitness history and no evaluations.
+
+        Args:
+            path (str): The .npz file to read.
+
+        Returns:
+            Checkpoint: The checkpoint.
+        """
+        with np.load(path) as archive:
+            gauss_next = float(archive['python_gauss_next'])
+            python_random_state = (int(archive['python_random_version']),
+                                   tuple(int(value) for value in archive['python_random_state']),
+                                   None if np.isnan(gauss_next) else gauss_next)
+            numpy_random_state = (str(archive['numpy_bit_generator']), archive['numpy_random_keys'],
+                                  int(archive['numpy_random_position']), int(archive['numpy_has_gauss']),
+                                  float(archive['numpy_cached_gaussian']))
+            return Checkpoint(int(archive['seed']), int(archive['generation']),
+                              int(archive['generation_count']) or None, str(archive['chromosome_type']),
+                              archive['towers'], archive['towers_count'], archive['assignments'], archive['fitness'],
+                              archive['avg_fitness'], python_random_state, numpy_random_state,
+                              archive['best_fitness'] if 'best_fitness' in archive.files else None,
+                              int(archive['evaluations']) if 'evaluations' in archive.files else 0)
+
+
+class CheckpointWriter:
+    """
+    Writes checkpoints on a background thread so the generation loop does not wait for the disk.
+
+    At most one write is in flight: writing a checkpoint first waits for the previous one, which bounds the memory
+    held by pending checkpoints.
+    """
+
+    def __init__(self, directory: str, interval: int):
+        """
+        Initializes the writer.
+
+        Args:
+            directory (str): The directory of the checkpoint files.
+            interval (int): The number of generations between two checkpoints. 0 disables checkpoints.
+        """
+        self.directory = directory
+        self.interval = interval
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_write = None
+
+    def path(self, seed: int) -> str:
+        """
+        Returns the checkpoint file of the run with the given seed. Every checkpoint of a run replaces the previous
+        one.
+        """
+        return os.path.join(self.directory, f'run-{seed}.npz')
+
+    def is_due(self, generation: int, generation_count: int) -> bool:
+        """
+        Whether a checkpoint is due after the given number of finished generations. Finished runs are not
+        checkpointed. A generation_count of None means the run has no generation limit.
+        """
+        return self.interval > 0 and generation % self.interval == 0 and \
+            (generation_count is None or generation < generation_count)
+
+    def write(self, checkpoint: Checkpoint) -> None:
+        """
+        Schedules a checkpoint to be written to the file of its run.
+        """
+        self.wait()
+        self.pending_write = self.executor.submit(checkpoint.save, self.path(checkpoint.seed))
+
+    def wait(self) -> None:
+        """
+        Waits for the pending write, if any, and raises its error.
+        """
+        if self.pending_write is not None:
+            pending_write, self.pending_write = self.pending_write, None
+            pending_write.result()
+
+    def close(self) -> None:
+        """
+        Waits for the pending write and stops the background thread.
+        """
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
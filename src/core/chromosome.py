@@ -1,8 +1,12 @@
 import random
 from random import randint
 
+import numpy as np
+
 from common.config import *
+from common.problem_config import ProblemConfig
 from core.gene import Gene
+from operators.fitness.fitness_cache import FitnessCache
 from operators.fitness.fitness_calculator import FitnessCalculator
 from operators.mutation.gaussian_mutation_operator import GaussianMutationOperator
 from operators.mutation.swap_mutation_operator import SwapMutationOperator
@@ -10,36 +14,58 @@ from operators.recombination.two_point_crossover import MultiPointsCrossoverOper
 
 
 class Chromosome:
-    def __init__(self, genes=None):
+    swap_mutation_operator = SwapMutationOperator()
+    multi_point_crossover_operator = MultiPointsCrossoverOperator()
+
+    def __init__(self, genes=None, config: ProblemConfig = None):
         """
         Initialize a new Individual object with a list of genes.
 
+        The fitness calculator, the fitness cache and the operators are shared by all chromosomes of the same problem
+        configuration.
+
         Args:
             genes (list): A list of genes representing the individual's genetic information. Defaults to an empty list
             if not provided.
+            config (ProblemConfig): The problem the chromosome solves. Defaults to ProblemConfig.default().
         """
         self.genes = genes or []
+        self.config = config or ProblemConfig.default()
         self.fitness = None
-        self.fitness_calculator = FitnessCalculator()
-        self.swap_mutation_operator = SwapMutationOperator()
-        self.gaussian_mutation_operator = GaussianMutationOperator()
-        self.multi_point_crossover_operator = MultiPointsCrossoverOperator()
+        self.genome_key = None
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    @property
+    def gaussian_mutation_operator(self) -> GaussianMutationOperator:
+        return GaussianMutationOperator.shared(self.config)
+
+    @property
+    def fitness_cache(self) -> FitnessCache:
+        return FitnessCache.shared(self.config)
 
     @staticmethod
-    def initialize():
+    def initialize(config: ProblemConfig = None):
         """
        Static method that creates a new Chromosome object with randomly initialized genes.
 
+       The fitness is left unset so that the whole population can be evaluated in one batch.
+
+       Args:
+           config (ProblemConfig, optional): The problem to initialize the chromosome for. Defaults to
+                                             ProblemConfig.default().
+
        Returns:
            Chromosome: A new Chromosome object with randomly initialized genes.
         """
-        chromosome = Chromosome()
+        chromosome = Chromosome(config=config)
 
-        tower_count = randint(TOWERS_MIN, TOWERS_MAX)
-        towers = [Gene.initialize() for _ in range(tower_count)]
+        tower_count = randint(chromosome.config.towers_min, chromosome.config.towers_max)
+        towers = [Gene.initialize(chromosome.config) for _ in range(tower_count)]
 
-        chromosome.genes = [random.choice(towers) for _ in range(CITIES_COUNT)]
-        chromosome.fitness = chromosome.calculate_fitness()
+        chromosome.genes = [random.choice(towers) for _ in range(chromosome.config.cities_count)]
 
         return chromosome
 
@@ -57,8 +83,8 @@ class Chromosome:
         offspring1_genes, offspring2_genes = self.multi_point_crossover_operator.crossover(self.genes, other.genes,
                                                                                            crossover_rate)
 
-        offspring1 = Chromosome(offspring1_genes)
-        offspring2 = Chromosome(offspring2_genes)
+        offspring1 = Chromosome(offspring1_genes, self.config)
+        offspring2 = Chromosome(offspring2_genes, self.config)
 
         return offspring1, offspring2
 
@@ -74,6 +100,44 @@ class Chromosome:
         """
         self.gaussian_mutation_operator.mutate(genes=self.genes, mutation_rate=mutation_rate)
         self.swap_mutation_operator.mutate(genes=self.genes, mutation_rate=mutation_rate)
+        self.genome_key = None
+
+    @staticmethod
+    def mutate_population(chromosomes, mutation_rate: float, random_generator) -> None:
+        """
+        Mutate the genes of a whole population in one batch.
+
+        The distinct Gene objects of all chromosomes are stacked into one tower array, so every tower is mutated at
+        most once however many cities share it, and the swaps of all chromosomes are drawn together.
+
+        Args:
+        - chromosomes (list): The Chromosome objects to mutate in place.
+        - mutation_rate (float): The probability of mutation for each tower and each city.
+        - random_generator (numpy.random.Generator): The generator of the mutation masks and noise.
+
+        Returns:
+        None
+        """
+        if not chromosomes:
+            return
+
+        distinct_genes = list(dict.fromkeys(gene for chromosome in chromosomes for gene in chromosome.genes))
+        towers = np.array([(*gene.location, gene.bandwidth) for gene in distinct_genes], dtype=np.float64)
+        mutated_towers = chromosomes[0].gaussian_mutation_operator.mutate_towers(towers, mutation_rate,
+                                                                                random_generator=random_generator)
+        for tower_index in mutated_towers.tolist():
+            x, y, bandwidth = towers[tower_index].tolist()
+            distinct_genes[tower_index].location = (x, y)
+            distinct_genes[tower_index].bandwidth = bandwidth
+
+        rows, cities, source_cities = Chromosome.swap_mutation_operator.shuffle_positions(
+            (len(chromosomes), len(chromosomes[0].genes)), mutation_rate, random_generator)
+        genes = [chromosome.genes[:] for chromosome in chromosomes]
+        for row, city, source_city in zip(rows.tolist(), cities.tolist(), source_cities.tolist()):
+            chromosomes[row].genes[city] = genes[row][source_city]
+
+        for chromosome in chromosomes:
+            chromosome.genome_key = None
 
     def calculate_fitness(self) -> float:
         """
@@ -82,9 +146,83 @@ class Chromosome:
         Returns:
         - float: The fitness value of the chromosome.
         """
-        self.fitness = self.fitness_calculator.calculate_fitness(self.genes)
+        if not self.load_cached_fitness():
+            self.store_evaluation(self.fitness_calculator.calculate_fitness(self.genes))
         return self.fitness
 
+    def genome_hash(self) -> bytes:
+        """
+        Return the content hash of the chromosome, computing it if the genes changed since the last call.
+
+        Returns:
+        - bytes: The genome hash as computed by FitnessCache.genome_hash.
+        """
+        if self.genome_key is None:
+            self.genome_key = self.fitness_cache.genome_hash(*self.encode())
+        return self.genome_key
+
+    def load_cached_fitness(self) -> bool:
+        """
+        Look up the fitness of the chromosome in the shared fitness cache.
+
+        Returns:
+        - bool: True if the fitness was found and set on the chromosome.
+        """
+        fitness = self.fitness_cache.get(self.genome_hash())
+        if fitness is None:
+            return False
+
+        self.fitness = fitness
+        return True
+
+    def can_update_fitness(self) -> bool:
+        """
+        Whether the fitness can be updated incrementally instead of being recomputed from scratch.
+
+        Gene-based chromosomes do not track their changes, so they always need a full evaluation.
+
+        Returns:
+        - bool: Always False.
+        """
+        return False
+
+    def store_evaluation(self, fitness, towers_population=None, towers_satisfaction=None) -> None:
+        """
+        Store the result of a batch evaluation on the chromosome.
+
+        Args:
+        - fitness (float): The fitness value of the chromosome.
+        - towers_population (numpy.ndarray, optional): The population associated with each tower. Unused.
+        - towers_satisfaction (numpy.ndarray, optional): The user satisfaction subtotal of each tower. Unused.
+        """
+        self.fitness = fitness
+        self.fitness_cache.put(self.genome_hash(), fitness)
+
+    @staticmethod
+    def from_arrays(towers, assignment, config: ProblemConfig = None):
+        """
+        Static method that creates a new Chromosome object from a tower array and a city assignment.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+            config (ProblemConfig, optional): The problem the chromosome solves. Defaults to ProblemConfig.default().
+
+        Returns:
+            Chromosome: A new Chromosome object whose cities share one Gene object per tower.
+        """
+        genes = [Gene((float(x), float(y)), float(bandwidth)) for x, y, bandwidth in towers]
+        return Chromosome([genes[tower_index] for tower_index in assignment], config)
+
+    def encode(self):
+        """
+        Encode the chromosome as arrays for the vectorized fitness path.
+
+        Returns:
+        - tuple: A (towers, assignment) tuple as returned by FitnessCalculator.encode.
+        """
+        return self.fitness_calculator.encode(self.genes)
+
     def __str__(self):
         genes_str = ", \n".join(str(gene) for gene in self.genes)
         return f"Chromosome: genes=[\n{genes_str}\n],\nfitness={self.fitness}"
@@ -0,0 +1,354 @@
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from core.gene import Gene
+from operators.fitness.fitness_cache import FitnessCache
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.mutation.gaussian_mutation_operator import GaussianMutationOperator
+from operators.mutation.swap_mutation_operator import SwapMutationOperator
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+
+
+class CompactChromosome:
+    """
+    An array-backed alternative to Chromosome.
+
+    Instead of one Gene reference per city, the chromosome stores a small (towers, 3) float array of
+    (x, y, bandwidth) rows and an int32 array with the tower index of each city. Copy, crossover and mutation are
+    plain array operations and the operators are shared by all chromosomes.
+
+    After an evaluation the chromosome caches the population and the satisfaction subtotal of every tower and marks
+    the towers touched by mutation as dirty, so the next evaluation only recomputes the cities of dirty towers.
+    """
+    __slots__ = ('towers', 'assignment', 'fitness', 'towers_population', 'towers_satisfaction', 'dirty_towers',
+                 'genome_key', 'config')
+
+    swap_mutation_operator = SwapMutationOperator()
+    multi_point_crossover_operator = MultiPointsCrossoverOperator()
+
+    def __init__(self, towers=None, assignment=None, config: ProblemConfig = None):
+        """
+        Initialize a new CompactChromosome object with a tower array and a city assignment.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows. Defaults to an empty array.
+            assignment (numpy.ndarray): The tower index of each city. Defaults to an empty array.
+            config (ProblemConfig): The problem the chromosome solves. Defaults to ProblemConfig.default().
+        """
+        self.config = config or ProblemConfig.default()
+        self.towers = towers if towers is not None else np.empty((0, 3), dtype=np.float64)
+        self.assignment = assignment if assignment is not None else np.empty(0, dtype=np.int32)
+        self.fitness = None
+        self.towers_population = None
+        self.towers_satisfaction = None
+        self.dirty_towers = None
+        self.genome_key = None
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    @property
+    def gaussian_mutation_operator(self) -> GaussianMutationOperator:
+        return GaussianMutationOperator.shared(self.config)
+
+    @property
+    def fitness_cache(self) -> FitnessCache:
+        return FitnessCache.shared(self.config)
+
+    @staticmethod
+    def initialize(config: ProblemConfig = None):
+        """
+        Static method that creates a new CompactChromosome object with randomly initialized towers and assignment.
+
+        Args:
+            config (ProblemConfig, optional): The problem to initialize the chromosome for. Defaults to
+                                              ProblemConfig.default().
+
+        Returns:
+            CompactChromosome: A new CompactChromosome object with randomly initialized towers and assignment.
+        """
+        config = config or ProblemConfig.default()
+        tower_count = np.random.randint(config.towers_min, config.towers_max + 1)
+
+        towers = np.empty((tower_count, 3), dtype=np.float64)
+        towers[:, 0] = np.random.uniform(config.location_min_x, config.location_max_x, tower_count)
+        towers[:, 1] = np.random.uniform(config.location_min_y, config.location_max_y, tower_count)
+        towers[:, 2] = np.random.uniform(config.bandwidth_min, config.bandwidth_max, tower_count)
+        assignment = np.random.randint(0, tower_count, config.cities_count).astype(np.int32)
+
+        return CompactChromosome(*MultiPointsCrossoverOperator.compact(towers, assignment), config=config)
+
+    @staticmethod
+    def from_arrays(towers, assignment, config: ProblemConfig = None):
+        """
+        Static method that creates a new CompactChromosome object from a tower array and a city assignment.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+            config (ProblemConfig, optional): The problem the chromosome solves. Defaults to ProblemConfig.default().
+
+        Returns:
+            CompactChromosome: A new CompactChromosome object holding copies of the arrays.
+        """
+        return CompactChromosome(np.array(towers, dtype=np.float64), np.array(assignment, dtype=np.int32), config)
+
+    @staticmethod
+    def from_genes(genes, config: ProblemConfig = None):
+        """
+        Static method that converts a list of genes into a CompactChromosome object.
+
+        Args:
+            genes (list): A list of genes representing the tower assigned to each city.
+            config (ProblemConfig, optional): The problem the chromosome solves. Defaults to ProblemConfig.default().
+
+        Returns:
+            CompactChromosome: A new CompactChromosome object with the same towers and assignment.
+        """
+        return CompactChromosome(*FitnessCalculator.encode(genes), config=config)
+
+    @property
+    def genes(self):
+        """
+        Decode the chromosome into a list of genes, one shared Gene object per tower.
+
+        Returns:
+            list: A list of genes representing the tower assigned to each city.
+        """
+        towers = [Gene((float(x), float(y)), float(bandwidth)) for x, y, bandwidth in self.towers]
+        return [towers[tower_index] for tower_index in self.assignment]
+
+    def copy(self):
+        """
+        Creates a copy of the current CompactChromosome object.
+
+        Returns:
+            CompactChromosome: A new CompactChromosome object with copies of the arrays and the same fitness.
+        """
+        chromosome = CompactChromosome(self.towers.copy(), self.assignment.copy(), self.config)
+        chromosome.genome_key = self.genome_key
+        if self.can_update_fitness():
+            chromosome.fitness = self.fitness
+            chromosome.towers_population = self.towers_population.copy()
+            chromosome.towers_satisfaction = self.towers_satisfaction.copy()
+            chromosome.dirty_towers = self.dirty_towers.copy()
+        return chromosome
+
+    def crossover(self, other, crossover_rate):
+        """
+        Performs crossover between two parent chromosomes to create two offspring chromosomes.
+
+        Offspring that are plain copies of their parents keep the cached per-tower contributions, so they can be
+        re-evaluated incrementally after mutation.
+
+        Args:
+            other (CompactChromosome): The other parent chromosome to cross with.
+            crossover_rate (float): The probability of performing crossover.
+
+        Returns:
+            tuple: A tuple containing two new offspring CompactChromosome objects.
+        """
+        if np.random.random() > crossover_rate:
+            return self.copy(), other.copy()
+
+        offspring1_arrays, offspring2_arrays = self.multi_point_crossover_operator.crossover_arrays(
+            self.encode(), other.encode(), crossover_rate=1.0)
+
+        return (CompactChromosome(*offspring1_arrays, config=self.config),
+                CompactChromosome(*offspring2_arrays, config=self.config))
+
+    @staticmethod
+    def crossover_pairs(pairs, crossover_rate):
+        """
+        Crosses all pairs of parent chromosomes of a generation in one batch.
+
+        Args:
+            pairs (list): The pairs of parent CompactChromosome objects.
+            crossover_rate (float): The probability of performing crossover on each pair.
+
+        Returns:
+            list: The two offspring of each pair, in pair order.
+        """
+        children = CompactChromosome.multi_point_crossover_operator.crossover_batch(
+            [parent1.encode() for parent1, _ in pairs], [parent2.encode() for _, parent2 in pairs], crossover_rate)
+
+        offspring_chromosomes = []
+        for (parent1, parent2), pair_children in zip(pairs, children):
+            if pair_children is None:
+                offspring_chromosomes += [parent1.copy(), parent2.copy()]
+            else:
+                offspring_chromosomes += [CompactChromosome(*arrays, config=parent1.config) for arrays in pair_children]
+        return offspring_chromosomes
+
+    def mutate(self, mutation_rate: float) -> None:
+        """
+        Perform mutation on the chromosome's towers and assignment in place.
+
+        Mutated towers are marked dirty, as are the towers of swapped cities. Swaps only permute towers among the
+        swapped cities, so their towers after the swap are exactly the towers that lost or gained cities.
+
+        Args:
+        - mutation_rate (float): The probability of mutation for each tower and each city.
+
+        Returns:
+        None
+        """
+        mutated_towers = self.gaussian_mutation_operator.mutate_towers(self.towers, mutation_rate=mutation_rate)
+        swapped_cities = self.swap_mutation_operator.mutate_assignment(self.assignment, mutation_rate=mutation_rate)
+        self.genome_key = None
+
+        if self.dirty_towers is not None:
+            self.dirty_towers[mutated_towers] = True
+            self.dirty_towers[self.assignment[swapped_cities]] = True
+
+    @staticmethod
+    def mutate_population(chromosomes, mutation_rate: float, random_generator) -> None:
+        """
+        Mutate the towers and assignments of a whole population in one batch.
+
+        The towers of all chromosomes are stacked into one array and the assignments into one (chromosomes, cities)
+        array, so the masks, the noise and the clipping are drawn and applied once per generation. The dirty towers
+        are marked as in mutate.
+
+        Args:
+        - chromosomes (list): The CompactChromosome objects to mutate in place.
+        - mutation_rate (float): The probability of mutation for each tower and each city.
+        - random_generator (numpy.random.Generator): The generator of the mutation masks and noise.
+
+        Returns:
+        None
+        """
+        if not chromosomes:
+            return
+
+        offsets = np.cumsum([0] + [len(chromosome.towers) for chromosome in chromosomes])
+        towers = np.concatenate([chromosome.towers for chromosome in chromosomes])
+        mutated_towers = chromosomes[0].gaussian_mutation_operator.mutate_towers(towers, mutation_rate,
+                                                                                random_generator=random_generator)
+        assignments = np.stack([chromosome.assignment for chromosome in chromosomes])
+        rows, cities = CompactChromosome.swap_mutation_operator.mutate_assignments(assignments, mutation_rate,
+                                                                                   random_generator)
+
+        dirty_towers = np.zeros(len(towers), dtype=bool)
+        dirty_towers[mutated_towers] = True
+        dirty_towers[offsets[rows] + assignments[rows, cities]] = True
+
+        for i, chromosome in enumerate(chromosomes):
+            chromosome.towers[:] = towers[offsets[i]:offsets[i + 1]]
+            chromosome.assignment[:] = assignments[i]
+            chromosome.genome_key = None
+            if chromosome.dirty_towers is not None:
+                chromosome.dirty_towers |= dirty_towers[offsets[i]:offsets[i + 1]]
+
+    def can_update_fitness(self) -> bool:
+        """
+        Whether the fitness can be updated incrementally instead of being recomputed from scratch.
+
+        Returns:
+        - bool: True if the per-tower contributions of a previous evaluation are cached.
+        """
+        return self.towers_satisfaction is not None
+
+    def update_fitness(self) -> float:
+        """
+        Recompute the contributions of the dirty towers only and update the fitness value.
+
+        If INCREMENTAL_FITNESS_CHECK is enabled, the result is cross-checked against a full evaluation.
+
+        Returns:
+        - float: The fitness value of the chromosome.
+        """
+        dirty_cities = np.flatnonzero(self.dirty_towers[self.assignment])
+        if len(dirty_cities) > 0:
+            towers_population, towers_satisfaction = self.fitness_calculator.calc_towers_satisfaction(
+                self.towers, self.assignment, dirty_cities)
+            self.towers_population[self.dirty_towers] = towers_population[self.dirty_towers]
+            self.towers_satisfaction[self.dirty_towers] = towers_satisfaction[self.dirty_towers]
+            self.dirty_towers[:] = False
+
+        self.fitness = self.fitness_calculator.calc_fitness_from_towers_satisfaction(self.towers,
+                                                                                     self.towers_satisfaction)
+
+        if INCREMENTAL_FITNESS_CHECK:
+            expected_fitness = self.fitness_calculator.calculate_fitness_vectorized(self.towers, self.assignment)
+            if expected_fitness != self.fitness:
+                raise RuntimeError(f"Incremental fitness {self.fitness} differs from full evaluation "
+                                   f"{expected_fitness}")
+
+        self.fitness_cache.put(self.genome_hash(), self.fitness)
+        return self.fitness
+
+    def store_evaluation(self, fitness, towers_population, towers_satisfaction) -> None:
+        """
+        Store the result of a full evaluation and reset the dirty towers.
+
+        Args:
+        - fitness (float): The fitness value of the chromosome.
+        - towers_population (numpy.ndarray): The population associated with each tower.
+        - towers_satisfaction (numpy.ndarray): The user satisfaction subtotal of each tower.
+        """
+        self.fitness = fitness
+        self.towers_population = np.array(towers_population, dtype=np.float64)
+        self.towers_satisfaction = np.array(towers_satisfaction, dtype=np.float64)
+        self.dirty_towers = np.zeros(len(self.towers), dtype=bool)
+        self.fitness_cache.put(self.genome_hash(), fitness)
+
+    def calculate_fitness(self) -> float:
+        """
+        Calculate the fitness value of the chromosome based on the objective function.
+
+        Returns:
+        - float: The fitness value of the chromosome.
+        """
+        if self.load_cached_fitness():
+            return self.fitness
+
+        if self.can_update_fitness():
+            return self.update_fitness()
+
+        towers_population, towers_satisfaction = self.fitness_calculator.calc_towers_satisfaction(self.towers,
+                                                                                                  self.assignment)
+        fitness = self.fitness_calculator.calc_fitness_from_towers_satisfaction(self.towers, towers_satisfaction)
+        self.store_evaluation(fitness, towers_population, towers_satisfaction)
+        return self.fitness
+
+    def genome_hash(self) -> bytes:
+        """
+        Return the content hash of the chromosome, computing it if the arrays changed since the last call.
+
+        Returns:
+        - bytes: The genome hash as computed by FitnessCache.genome_hash.
+        """
+        if self.genome_key is None:
+            self.genome_key = self.fitness_cache.genome_hash(self.towers, self.assignment)
+        return self.genome_key
+
+    def load_cached_fitness(self) -> bool:
+        """
+        Look up the fitness of the chromosome in the shared fitness cache.
+
+        Returns:
+        - bool: True if the fitness was found and set on the chromosome.
+        """
+        fitness = self.fitness_cache.get(self.genome_hash())
+        if fitness is None:
+            return False
+
+        self.fitness = fitness
+        return True
+
+    def encode(self):
+        """
+        Return the chromosome's arrays for the vectorized fitness path.
+
+        Returns:
+        - tuple: The (towers, assignment) arrays of the chromosome.
+        """
+        return self.towers, self.assignment
+
+    def __str__(self):
+        towers_str = ", \n".join(f"Tower: location=({x}, {y}), bandwidth={bandwidth}"
+                                 for x, y, bandwidth in self.towers)
+        return f"CompactChromosome: towers=[\n{towers_str}\n],\nassignment={self.assignment},\nfitness={self.fitness}"
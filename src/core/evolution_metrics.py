@@ -0,0 +1,155 @@
+import cProfile
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+PHASES = ('selection', 'pairing', 'crossover', 'mutation', 'evaluation', 'replacement', 'local_search', 'reporting')
+
+
+class EvolutionMetrics:
+    """
+    Records the wall time and the call count of every phase of every generation of one evolution.
+
+    Phases entered before the first generation, i.e. while the initial population is built and evaluated, are
+    recorded as initialization. A cProfile profile and a tracemalloc trace of the whole evolution can optionally be
+    captured between start and stop.
+    """
+
+    def __init__(self, generation_count: int = None, profile: bool = False, trace_memory: bool = False,
+                 profile_functions: int = 30, memory_sites: int = 10):
+        """
+        Initializes empty metrics.
+
+        Args:
+            generation_count (int): The expected number of generations. The arrays grow if more generations are
+                                    recorded, e.g. in runs without a generation limit.
+            profile (bool): Whether to profile the evolution with cProfile.
+            trace_memory (bool): Whether to trace the memory allocated during the evolution with tracemalloc.
+            profile_functions (int): The number of functions with the highest cumulative time to export.
+            memory_sites (int): The number of source lines with the largest allocations to export.
+
+        Attributes:
+            - seconds (numpy.ndarray): A (generations, phases) array with the wall time of each phase.
+            - calls (numpy.ndarray): A (generations, phases) array with the number of times each phase was entered.
+            - initialization_seconds (dict): The wall time of each phase before the first generation.
+            - generation (int): The index of the generation being recorded, -1 during initialization.
+        """
+        self.seconds = np.zeros((generation_count or 0, len(PHASES)), dtype=np.float64)
+        self.calls = np.zeros((generation_count or 0, len(PHASES)), dtype=np.int64)
+        self.initialization_seconds = dict.fromkeys(PHASES, 0.0)
+        self.generation = -1
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_functions = profile_functions
+        self.memory_sites = memory_sites
+        self.profiler = None
+        self.total_seconds = 0.0
+        self.start_time = None
+        self.profile_stats = None
+        self.memory_stats = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times the enclosed block as one call of the given phase of the current generation.
+
+        Args:
+            name (str): One of PHASES.
+        """
+        phase_index = PHASES.index(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.generation < 0:
+                self.initialization_seconds[name] += elapsed
+            else:
+                self.seconds[self.generation, phase_index] += elapsed
+                self.calls[self.generation, phase_index] += 1
+
+    def next_generation(self) -> None:
+        """
+        Starts recording the next generation.
+        """
+        self.generation += 1
+        if self.generation >= len(self.seconds):
+            added_generations = max(len(self.seconds), 64)
+            self.seconds = np.concatenate((self.seconds, np.zeros((added_generations, len(PHASES)), dtype=np.float64)))
+            self.calls = np.concatenate((self.calls, np.zeros((added_generations, len(PHASES)), dtype=np.int64)))
+
+    def start(self) -> None:
+        """
+        Starts the wall clock of the evolution and, if enabled, the profiler and the memory trace.
+        """
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.start_time = time.perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stops the wall clock of the evolution and collects the profile and the memory trace.
+        """
+        self.total_seconds = time.perf_counter() - self.start_time
+
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profile_stats = self.__profile_stats(self.profiler)
+            self.profiler = None
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self.memory_stats = {
+                'current_bytes': current,
+                'peak_bytes': peak,
+                'top_sites': [{'site': str(statistic.traceback), 'bytes': statistic.size, 'blocks': statistic.count}
+                              for statistic in snapshot.statistics('lineno')[:self.memory_sites]]
+            }
+
+    def to_dict(self) -> dict:
+        """
+        Exports the metrics as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The total time, the initialization time, the per-phase totals and call counts, the per-generation
+                  times and, if captured, the profile and the memory trace.
+        """
+        recorded = self.generation + 1
+        return {
+            'generations': recorded,
+            'total_seconds': self.total_seconds,
+            'initialization_seconds': self.initialization_seconds,
+            'phases': {
+                name: {
+                    'seconds': float(self.seconds[:recorded, phase_index].sum()),
+                    'calls': int(self.calls[:recorded, phase_index].sum())
+                } for phase_index, name in enumerate(PHASES)
+            },
+            'generation_seconds': {name: self.seconds[:recorded, phase_index].tolist()
+                                   for phase_index, name in enumerate(PHASES)},
+            'profile': self.profile_stats,
+            'memory': self.memory_stats
+        }
+
+    def __profile_stats(self, profiler):
+        """
+        Returns the functions with the highest cumulative time of a profile.
+        """
+        stats = pstats.Stats(profiler)
+        functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:self.profile_functions]
+        return [{
+            'function': f'{file_name}:{line}({function_name})',
+            'calls': primitive_calls,
+            'total_calls': total_calls,
+            'total_seconds': total_time,
+            'cumulative_seconds': cumulative_time
+        } for (file_name, line, function_name), (primitive_calls, total_calls, total_time, cumulative_time, _)
+            in functions]
@@ -1,9 +1,11 @@
 import random
 
-from common.config import *
+from common.problem_config import ProblemConfig
 
 
 class Gene:
+    __slots__ = ('location', 'bandwidth')
+
     def __init__(self, location: tuple = None, bandwidth: float = None):
         """
         Initializes a new Gene object with the given location and bandwidth.
@@ -16,17 +18,23 @@ class Gene:
         self.bandwidth = bandwidth
 
     @staticmethod
-    def initialize():
+    def initialize(config: ProblemConfig = None):
         """
         Static method that creates a new Gene object with randomly initialized location and bandwidth.
 
+        Args:
+            config (ProblemConfig, optional): The problem configuration providing the bounds. Defaults to
+                                              ProblemConfig.default().
+
         Returns:
             Gene: A new Gene object with randomly initialized location and bandwidth.
         """
+        config = config or ProblemConfig.default()
         gene = Gene()
 
-        gene.location = (random.uniform(LOCATION_MIN_X, LOCATION_MAX_X), random.uniform(LOCATION_MIN_Y, LOCATION_MAX_Y))
-        gene.bandwidth = random.uniform(BANDWIDTH_MIN, BANDWIDTH_MAX)
+        gene.location = (random.uniform(config.location_min_x, config.location_max_x),
+                         random.uniform(config.location_min_y, config.location_max_y))
+        gene.bandwidth = random.uniform(config.bandwidth_min, config.bandwidth_max)
 
         return gene
 
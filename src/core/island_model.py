@@ -0,0 +1,282 @@
+import multiprocessing
+import queue
+import random
+import struct
+import traceback
+
+import numpy as np
+
+from common.config import *
+from core.evolution_metrics import EvolutionMetrics
+from core.population import Population
+from operators.fitness.fitness_cache import FitnessCache
+
+TOPOLOGIES = ('ring', 'full')
+
+# Wire header: number of migrants and number of cities; per migrant: fitness, number of towers and the byte width of
+# the assignment entries.
+_MIGRANTS_HEADER = struct.Struct('<II')
+_MIGRANT_HEADER = struct.Struct('<dIB')
+
+# The seconds between two checks that the other processes are alive while waiting for a message.
+_POLL_SECONDS = 0.5
+
+
+def _run_island(algorithm, island_model, index, seed, inboxes, results):
+    """
+    Evolves one island in a worker process and reports its best chromosome, average fitness per generation, fitness
+    cache counters and phase metrics. An error is reported with its traceback and raised again.
+    """
+    try:
+        _evolve_island(algorithm, island_model, index, seed, inboxes, results)
+    except BaseException:
+        results.put((index, None, traceback.format_exc()))
+        raise
+
+
+def _evolve_island(algorithm, island_model, index, seed, inboxes, results):
+    """
+    Evolves one island of _run_island.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    fitness_cache = FitnessCache.shared(algorithm.config)
+    fitness_cache.clear()
+
+    metrics = EvolutionMetrics(algorithm.generation_count, profile=algorithm.profile,
+                               trace_memory=algorithm.trace_memory)
+    metrics.start()
+    population = Population.initialize(algorithm.chromosome_type, algorithm.config, algorithm.clustered_ratio)
+    with metrics.phase('evaluation'):
+        population.evaluate_fitness()
+    avg_fitness = np.zeros(algorithm.generation_count, dtype=np.float64)
+    pending_migrants = {}
+
+    for generation in range(algorithm.generation_count):
+        metrics.next_generation()
+        algorithm.evolve_generation(population, metrics)
+
+        if (generation + 1) % island_model.migration_interval == 0:
+            migrants = island_model.encode_migrants(population.get_best_chromosomes(island_model.migrants))
+            for target in island_model.targets(index):
+                inboxes[target].put((generation, index, migrants))
+
+            migrants = island_model.receive_migrants(index, generation, inboxes[index], pending_migrants,
+                                                     algorithm.chromosome_type, algorithm.config)
+            with metrics.phase('replacement'):
+                population.replace_worst(migrants)
+
+        with metrics.phase('reporting'):
+            avg_fitness[generation] = np.mean([chromosome.fitness for chromosome in population.chromosomes])
+
+    metrics.stop()
+    best_chromosome = population.get_best_chromosome()
+    results.put((index, island_model.encode_migrants([best_chromosome]),
+                 (avg_fitness, fitness_cache.stats(), metrics.to_dict())))
+
+
+class IslandModel:
+    """
+    Evolves several populations in separate processes that periodically exchange their best chromosomes.
+
+    Migration is synchronous: every migration_interval generations each island sends its best chromosomes to its
+    targets and waits for the migrants of all its sources, which replace its worst chromosomes. Migrants travel in a
+    compact binary format holding only the tower arrays, the assignment and the fitness.
+
+    If an island raises or dies, the other islands are terminated and the error is raised in the calling process, so
+    neither the caller nor the islands waiting for its migrants block forever.
+    """
+
+    def __init__(self, islands: int = ISLANDS, migration_interval: int = MIGRATION_INTERVAL,
+                 migrants: int = MIGRANTS, topology: str = MIGRATION_TOPOLOGY):
+        """
+        Initializes the island model.
+
+        Args:
+            islands (int): The number of islands, each evolved in its own process.
+            migration_interval (int): The number of generations between migrations.
+            migrants (int): The number of best chromosomes each island sends per migration.
+            topology (str): 'ring' to send to the next island only, 'full' to send to all other islands.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology '{topology}', expected one of {TOPOLOGIES}")
+
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+
+    def targets(self, index: int) -> list:
+        """
+        Returns the islands that receive the migrants of the given island.
+        """
+        if self.topology == 'ring':
+            return [(index + 1) % self.islands] if self.islands > 1 else []
+        return [target for target in range(self.islands) if target != index]
+
+    def sources(self, index: int) -> list:
+        """
+        Returns the islands that send migrants to the given island.
+        """
+        return [source for source in range(self.islands) if index in self.targets(source)]
+
+    def evolve(self, algorithm, seed: int = None):
+        """
+        Evolves all islands in parallel.
+
+        Args:
+            algorithm (EvolutionaryAlgorithm): The algorithm whose generation count, chromosome type and generation
+                                               step are used on every island.
+            seed (int): The seed from which the per-island seeds are derived. Defaults to fresh entropy.
+
+        Returns:
+            tuple: The best chromosome over all islands, the average fitness of each generation averaged over the
+                   islands, the fitness cache counters and the phase metrics of every island.
+
+        Raises:
+            RuntimeError: If an island raised an error or exited without reporting its result.
+        """
+        seeds = [int(island_seed) for island_seed in np.random.SeedSequence(seed).generate_state(self.islands)]
+        inboxes = [multiprocessing.Queue() for _ in range(self.islands)]
+        results = multiprocessing.Queue()
+
+        processes = [multiprocessing.Process(target=_run_island, name=f'island-{index}',
+                                             args=(algorithm, self, index, seeds[index], inboxes, results))
+                     for index in range(self.islands)]
+        for process in processes:
+            process.start()
+
+        try:
+            island_results = self.collect_results(processes, results)
+        except BaseException:
+            for process in processes:
+                process.terminate()
+            raise
+        finally:
+            for process in processes:
+                process.join()
+
+        best_chromosomes = [self.decode_migrants(wire, algorithm.chromosome_type, algorithm.config)[0]
+                            for _, wire, _ in island_results]
+        avg_fitness = np.mean([island_avg_fitness for _, _, (island_avg_fitness, _, _) in island_results], axis=0)
+        fitness_cache_stats = [island_cache_stats for _, _, (_, island_cache_stats, _) in island_results]
+        metrics = [island_metrics for _, _, (_, _, island_metrics) in island_results]
+        return (max(best_chromosomes, key=lambda chromosome: chromosome.fitness), avg_fitness, fitness_cache_stats,
+                metrics)
+
+    def collect_results(self, processes, results) -> list:
+        """
+        Waits for the result of every island, checking that the islands still running are alive.
+
+        An island that exits without a result is given one more poll interval for its result to arrive, since a result
+        may still be in transit when its process has already exited.
+
+        Args:
+            processes (list): The process of each island.
+            results (multiprocessing.Queue): The queue the islands report to.
+
+        Returns:
+            list: The (index, wire, statistics) result of every island, ordered by island.
+
+        Raises:
+            RuntimeError: If an island raised an error or exited without reporting its result.
+        """
+        island_results = {}
+        exited = set()
+        while len(island_results) < len(processes):
+            try:
+                index, wire, payload = results.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                for index, process in enumerate(processes):
+                    if index in island_results or process.is_alive():
+                        continue
+                    if index in exited or process.exitcode != 0:
+                        raise RuntimeError(f"Island {index} exited with code {process.exitcode} without a result")
+                    exited.add(index)
+                continue
+
+            if wire is None:
+                raise RuntimeError(f"Island {index} failed:\n{payload}")
+            island_results[index] = (index, wire, payload)
+        return [island_results[index] for index in range(len(processes))]
+
+    def receive_migrants(self, index, generation, inbox, pending_migrants, chromosome_type, config=None) -> list:
+        """
+        Waits for the migrants sent to an island at the given generation.
+
+        Migrants of later migrations that arrive early are kept in pending_migrants. The result is ordered by source
+        island so that a run does not depend on message timing. The calling process terminates the islands if one of
+        them fails; an island whose calling process is gone stops waiting.
+
+        Returns:
+            list: The decoded migrants of this migration.
+
+        Raises:
+            RuntimeError: If the calling process of the islands exited.
+        """
+        sources = self.sources(index)
+        while len(pending_migrants.get(generation, {})) < len(sources):
+            try:
+                sent_generation, source, wire = inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                parent_process = multiprocessing.parent_process()
+                if parent_process is not None and not parent_process.is_alive():
+                    raise RuntimeError(f"Island {index} lost its calling process while waiting for migrants")
+                continue
+            pending_migrants.setdefault(sent_generation, {})[source] = wire
+
+        received = pending_migrants.pop(generation, {})
+        return [migrant for source in sorted(received)
+                for migrant in self.decode_migrants(received[source], chromosome_type, config)]
+
+    @staticmethod
+    def encode_migrants(chromosomes) -> bytes:
+        """
+        Encodes evaluated chromosomes into the migrant wire format.
+
+        The assignment is stored with the smallest unsigned integer type able to index the chromosome's towers.
+
+        Args:
+            chromosomes (list): The chromosomes to encode.
+
+        Returns:
+            bytes: The encoded migrants.
+        """
+        cities_count = len(chromosomes[0].encode()[1]) if chromosomes else 0
+        parts = [_MIGRANTS_HEADER.pack(len(chromosomes), cities_count)]
+        for chromosome in chromosomes:
+            towers, assignment = chromosome.encode()
+            assignment_dtype = np.min_scalar_type(max(len(towers) - 1, 0))
+            parts.append(_MIGRANT_HEADER.pack(chromosome.fitness, len(towers), assignment_dtype.itemsize))
+            parts.append(np.ascontiguousarray(towers, dtype='<f8').tobytes())
+            parts.append(assignment.astype(assignment_dtype.newbyteorder('<')).tobytes())
+        return b''.join(parts)
+
+    @staticmethod
+    def decode_migrants(wire: bytes, chromosome_type, config=None) -> list:
+        """
+        Decodes migrants from the wire format into evaluated chromosomes.
+
+        Args:
+            wire (bytes): The encoded migrants.
+            chromosome_type (type): The chromosome representation to build.
+            config (ProblemConfig): The problem the migrants solve. Defaults to ProblemConfig.default().
+
+        Returns:
+            list: The decoded chromosomes with their fitness set.
+        """
+        count, cities_count = _MIGRANTS_HEADER.unpack_from(wire)
+        offset = _MIGRANTS_HEADER.size
+        chromosomes = []
+        for _ in range(count):
+            fitness, towers_count, assignment_width = _MIGRANT_HEADER.unpack_from(wire, offset)
+            offset += _MIGRANT_HEADER.size
+            towers = np.frombuffer(wire, dtype='<f8', count=towers_count * 3, offset=offset).reshape(-1, 3)
+            offset += towers.nbytes
+            assignment = np.frombuffer(wire, dtype=f'<u{assignment_width}', count=cities_count, offset=offset)
+            offset += assignment.nbytes
+
+            chromosome = chromosome_type.from_arrays(towers, assignment.astype(np.int32), config)
+            chromosome.fitness = fitness
+            chromosomes.append(chromosome)
+        return chromosomes
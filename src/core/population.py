@@ -1,34 +1,69 @@
+from operators.initialization.clustering_initializer import ClusteringInitializer
 from operators.selection.fitness_proportionate_operator import FitnessProportionateOperator
 from operators.selection.mu_plus_lambda_operator import MuPlusLambdaOperator
+from operators.selection.stochastic_universal_sampling_operator import StochasticUniversalSamplingOperator
+from operators.selection.tournament_operator import TournamentOperator
 from core.chromosome import Chromosome
+import numpy as np
+
 from common.config import *
+from common.problem_config import ProblemConfig
+from operators.fitness.fitness_calculator import FitnessCalculator
+
+SELECTION_OPERATORS = {
+    'fitness_proportionate': FitnessProportionateOperator,
+    'tournament': TournamentOperator,
+    'stochastic_universal_sampling': StochasticUniversalSamplingOperator
+}
 
 
 class Population:
-    def __init__(self, chromosomes=None):
+    def __init__(self, chromosomes=None, config: ProblemConfig = None, selection: str = SELECTION_OPERATOR):
         """
         Initialize a population with a given list of chromosomes.
 
         Args:
         - chromosomes (list): List of chromosomes representing the initial population.
+        - config (ProblemConfig): The problem the chromosomes solve. Defaults to ProblemConfig.default().
+        - selection (str): The parent selection operator, one of SELECTION_OPERATORS.
         """
+        if selection not in SELECTION_OPERATORS:
+            raise ValueError(f"Unknown selection operator '{selection}', expected one of {tuple(SELECTION_OPERATORS)}")
+
         self.chromosomes = chromosomes or []
-        self.selection_operator = FitnessProportionateOperator()
+        self.fitness_values = None
+        self.evaluations = 0
+        self.config = config or ProblemConfig.default()
+        self.selection_operator = SELECTION_OPERATORS[selection]()
         self.mu_plus_lambda_operator = MuPlusLambdaOperator()
+        self.fitness_calculator = FitnessCalculator.shared(self.config)
 
     @staticmethod
-    def initialize():
+    def initialize(chromosome_type=Chromosome, config: ProblemConfig = None,
+                   clustered_ratio: float = CLUSTERED_INITIALIZATION_RATIO):
         """
         Static method that creates a new Population object with randomly initialized chromosomes.
 
+        Args:
+            chromosome_type (type): The chromosome representation to use, e.g. Chromosome, CompactChromosome or
+                                    TowerChromosome.
+            config (ProblemConfig, optional): The problem to initialize the chromosomes for. Defaults to
+                                              ProblemConfig.default().
+            clustered_ratio (float): The share of the chromosomes seeded by population-weighted k-means clustering
+                                     instead of at random. The random chromosomes keep the population diverse.
+
         Returns:
             Population: A new Population object with randomly initialized chromosomes.
         """
-        population = Population()
+        population = Population(config=config)
 
+        clustered_count = round(clustered_ratio * POPULATION_SIZE)
         population.chromosomes = []
-        for _ in range(POPULATION_SIZE):
-            chromosome = Chromosome.initialize()
+        if clustered_count > 0:
+            population.chromosomes += ClusteringInitializer(config=population.config).initialize(chromosome_type,
+                                                                                                 clustered_count)
+        for _ in range(POPULATION_SIZE - clustered_count):
+            chromosome = chromosome_type.initialize(population.config)
             population.chromosomes.append(chromosome)
 
         return population
@@ -53,13 +88,40 @@ class Population:
         Returns:
             Population: A new population object containing the offspring chromosomes created by crossover.
         """
-        offspring_chromosomes = []
+        return self.crossover_pairs(self.pair_chromosomes(), crossover_rate)
 
-        for parent1, parent2 in self.__random_pairing(self.chromosomes):
-            offspring1, offspring2 = parent1.crossover(parent2, crossover_rate)
-            offspring_chromosomes += [offspring1, offspring2]
+    def pair_chromosomes(self) -> list:
+        """
+        Pairs up the chromosomes of the population for crossover.
 
-        return Population(chromosomes=offspring_chromosomes)
+        Returns:
+            list: List of pairs of chromosomes for crossover.
+        """
+        return self.__random_pairing(self.chromosomes)
+
+    def crossover_pairs(self, pairs, crossover_rate):
+        """
+        Performs crossover on the given pairs of chromosomes and returns a new population with the offspring.
+
+        Chromosome types with a crossover_pairs method, such as CompactChromosome, cross all pairs in one batch.
+
+        Args:
+            pairs (list): The pairs of parent chromosomes, as returned by pair_chromosomes.
+            crossover_rate (float): The probability that a crossover will occur between two parent chromosomes.
+
+        Returns:
+            Population: A new population object containing the offspring chromosomes created by crossover.
+        """
+        chromosome_type = type(pairs[0][0]) if pairs else None
+        if hasattr(chromosome_type, 'crossover_pairs'):
+            offspring_chromosomes = chromosome_type.crossover_pairs(pairs, crossover_rate)
+        else:
+            offspring_chromosomes = []
+            for parent1, parent2 in pairs:
+                offspring1, offspring2 = parent1.crossover(parent2, crossover_rate)
+                offspring_chromosomes += [offspring1, offspring2]
+
+        return Population(chromosomes=offspring_chromosomes, config=self.config)
 
     @staticmethod
     def __random_pairing(chromosomes):
@@ -81,29 +143,70 @@ class Population:
 
         return pairs
 
-    def mutate(self, mutation_rate: float) -> None:
+    def mutate(self, mutation_rate: float, random_generator=None) -> None:
         """
         Apply the mutation operator to introduce small changes in the chromosomes.
 
+        With BATCHED_MUTATION, the whole population is mutated in one batch by the chromosome type's mutate_population,
+        drawing its masks and noise from random_generator. The default generator is seeded from numpy.random, so runs
+        and resumed checkpoints stay reproducible.
+
         Args:
         - mutation_rate (float): The mutation rate, which determines the probability of each gene in a chromosome
                               being mutated.
+        - random_generator (numpy.random.Generator, optional): The generator of a batched mutation.
 
         Returns:
         - None: This method mutates the chromosomes in-place and does not return any value.
         """
+        if BATCHED_MUTATION and self.chromosomes:
+            random_generator = random_generator or np.random.default_rng(np.random.randint(np.iinfo(np.int64).max))
+            type(self.chromosomes[0]).mutate_population(self.chromosomes, mutation_rate, random_generator)
+            return
+
         for chromosome in self.chromosomes:
             chromosome.mutate(mutation_rate)
 
-    def evaluate_fitness(self):
+    def evaluate_fitness(self, fitness_evaluator=None):
         """
         Evaluate the fitness of each chromosome in the population.
 
+        Chromosomes found in the fitness cache are not evaluated again. Chromosomes that track their changes since the
+        last evaluation are updated incrementally; all the others are packed into padded arrays and scored in a single
+        vectorized pass.
+
+        Args:
+        - fitness_evaluator: An object with an evaluate_population method, such as a ParallelFitnessEvaluator, used to
+                             score the packed chromosomes. Defaults to the population's FitnessCalculator.
+
         Modifies:
-        - Updates the fitness values of the chromosomes in the population.
+        - Updates the fitness values of the chromosomes in the population and adds the number of chromosomes not
+          found in the fitness cache to evaluations.
         """
+        pending_chromosomes = []
+        evaluated_count = 0
         for chromosome in self.chromosomes:
-            chromosome.calculate_fitness()
+            if chromosome.load_cached_fitness():
+                continue
+            evaluated_count += 1
+            if chromosome.can_update_fitness():
+                chromosome.update_fitness()
+            else:
+                pending_chromosomes.append(chromosome)
+        self.evaluations += evaluated_count
+
+        if not pending_chromosomes:
+            return
+
+        towers, towers_count, assignments = self.fitness_calculator.pack(
+            [chromosome.encode() for chromosome in pending_chromosomes])
+        fitness_evaluator = fitness_evaluator or self.fitness_calculator
+        fitness, towers_population, towers_satisfaction = fitness_evaluator.evaluate_population(
+            towers, towers_count, assignments)
+
+        for i, chromosome in enumerate(pending_chromosomes):
+            chromosome.store_evaluation(float(fitness[i]), towers_population[i, :towers_count[i]],
+                                        towers_satisfaction[i, :towers_count[i]])
 
     def replace(self, other: 'Population'):
         """
@@ -116,6 +219,43 @@ class Population:
         - Updates the population with the offspring chromosomes, replacing the least fit individuals.
         """
         self.chromosomes = self.mu_plus_lambda_operator.select(self.chromosomes, other.chromosomes)
+        self.fitness_values = np.array([chromosome.fitness for chromosome in self.chromosomes], dtype=np.float64)
+
+    def local_search(self, local_search_operator, count: int) -> None:
+        """
+        Improve the best chromosomes of the evaluated population with a local search.
+
+        Args:
+        - local_search_operator: An object whose improve method returns an improved chromosome and the number of
+                                 fitness evaluations it performed, such as a GreedyReassignmentOperator. Operators
+                                 with an improve_all method, such as a BandwidthOptimizer, improve all chromosomes in
+                                 one batch.
+        - count (int): The number of best chromosomes to improve.
+
+        Modifies:
+        - Replaces the improved chromosomes and adds the evaluations of the local search to evaluations.
+        """
+        fitness = self.fitness_values
+        if fitness is None:
+            fitness = np.array([chromosome.fitness for chromosome in self.chromosomes], dtype=np.float64)
+
+        count = min(count, len(self.chromosomes))
+        indices = np.argpartition(-fitness, count - 1)[:count].tolist()
+        if hasattr(local_search_operator, 'improve_all'):
+            improved_chromosomes, evaluations = local_search_operator.improve_all(
+                [self.chromosomes[index] for index in indices])
+        else:
+            improved_chromosomes, evaluations = [], 0
+            for index in indices:
+                improved_chromosome, chromosome_evaluations = local_search_operator.improve(self.chromosomes[index])
+                improved_chromosomes.append(improved_chromosome)
+                evaluations += chromosome_evaluations
+
+        for index, improved_chromosome in zip(indices, improved_chromosomes):
+            self.chromosomes[index] = improved_chromosome
+            fitness[index] = improved_chromosome.fitness
+        self.evaluations += evaluations
+        self.fitness_values = fitness
 
     def get_best_chromosome(self):
         """
@@ -125,3 +265,53 @@ class Population:
             Chromosome: The chromosome in the population with the highest fitness value.
         """
         return max(self.chromosomes, key=lambda chromosome: chromosome.fitness)
+
+    def statistics(self) -> dict:
+        """
+        Summarizes the evaluated population.
+
+        Reuses the fitness values gathered by the last replacement when they are still current.
+
+        Returns:
+            dict: The best, mean and minimum fitness and the fitness standard deviation, the number of towers of the
+                  best chromosome and the diversity, i.e. the fraction of distinct genomes in the population.
+        """
+        fitness = self.fitness_values
+        if fitness is None:
+            fitness = np.array([chromosome.fitness for chromosome in self.chromosomes], dtype=np.float64)
+
+        best_chromosome = self.chromosomes[int(np.argmax(fitness))]
+        return {
+            'best_fitness': float(fitness.max()),
+            'mean_fitness': float(fitness.mean()),
+            'min_fitness': float(fitness.min()),
+            'fitness_std': float(fitness.std()),
+            'towers_count': len(best_chromosome.encode()[0]),
+            'diversity': len({chromosome.genome_hash() for chromosome in self.chromosomes}) / len(self.chromosomes)
+        }
+
+    def get_best_chromosomes(self, count: int):
+        """
+        Returns the best chromosomes in the population based on fitness.
+
+        Args:
+            count (int): The number of chromosomes to return.
+
+        Returns:
+            list: The count chromosomes with the highest fitness values, best first.
+        """
+        return sorted(self.chromosomes, key=lambda chromosome: chromosome.fitness, reverse=True)[:count]
+
+    def replace_worst(self, chromosomes: list):
+        """
+        Replace the least fit chromosomes of the population with the given evaluated chromosomes.
+
+        Args:
+            chromosomes (list): The chromosomes to insert, e.g. migrants from another island.
+
+        Modifies:
+        - Updates the population, keeping its size unchanged.
+        """
+        survivors = self.get_best_chromosomes(max(0, len(self.chromosomes) - len(chromosomes)))
+        self.chromosomes = survivors + list(chromosomes)
+        self.fitness_values = None
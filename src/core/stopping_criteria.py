@@ -0,0 +1,78 @@
+import time
+
+from common.config import *
+
+STOP_REASONS = ('generations', 'stagnation', 'target_fitness', 'max_evaluations', 'time_budget')
+
+
+class StoppingCriteria:
+    """
+    Decides after every generation whether an evolution should stop before its last generation.
+
+    Every criterion is disabled by default. The generation limit itself is enforced by the evolution loop and reported
+    as 'generations'.
+    """
+
+    def __init__(self, stagnation_generations: int = STAGNATION_GENERATIONS,
+                 stagnation_tolerance: float = STAGNATION_TOLERANCE, target_fitness: float = TARGET_FITNESS,
+                 max_evaluations: int = MAX_EVALUATIONS, time_budget: float = TIME_BUDGET_SECONDS):
+        """
+        Initializes the stopping criteria.
+
+        Args:
+            stagnation_generations (int): Stop when the best fitness improved by at most stagnation_tolerance over
+                                          this many generations. 0 disables the criterion.
+            stagnation_tolerance (float): The largest best fitness improvement still counted as stagnation.
+            target_fitness (float): Stop as soon as the best fitness reaches this value. None disables the criterion.
+            max_evaluations (int): Stop once this many fitness evaluations were performed. Fitness values served by
+                                   the fitness cache are not counted. 0 disables the criterion.
+            time_budget (float): Stop once the evolution ran for this many seconds of wall time. 0 disables the
+                                 criterion.
+        """
+        self.stagnation_generations = stagnation_generations
+        self.stagnation_tolerance = stagnation_tolerance
+        self.target_fitness = target_fitness
+        self.max_evaluations = max_evaluations
+        self.time_budget = time_budget
+        self.start_time = None
+
+    def is_bounded(self) -> bool:
+        """
+        Whether an evolution without a generation limit is guaranteed to stop.
+        """
+        return self.max_evaluations > 0 or self.time_budget > 0
+
+    def start(self) -> None:
+        """
+        Starts the wall clock of the time budget. A resumed evolution gets the full budget again.
+        """
+        self.start_time = time.perf_counter()
+
+    def stop_reason(self, best_fitness, evaluations: int):
+        """
+        Checks the stopping criteria after a generation.
+
+        Mu+lambda replacement never loses the best chromosome, so the best fitness never decreases and stagnation is
+        measured between the last generation and the generation stagnation_generations before it.
+
+        Args:
+            best_fitness (list): The best fitness of every finished generation.
+            evaluations (int): The number of fitness evaluations performed so far.
+
+        Returns:
+            str: The first met criterion, one of STOP_REASONS, or None to continue.
+        """
+        if self.target_fitness is not None and best_fitness[-1] >= self.target_fitness:
+            return 'target_fitness'
+
+        if 0 < self.max_evaluations <= evaluations:
+            return 'max_evaluations'
+
+        if 0 < self.stagnation_generations < len(best_fitness) and \
+                best_fitness[-1] - best_fitness[-1 - self.stagnation_generations] <= self.stagnation_tolerance:
+            return 'stagnation'
+
+        if self.time_budget > 0 and time.perf_counter() - self.start_time >= self.time_budget:
+            return 'time_budget'
+
+        return None
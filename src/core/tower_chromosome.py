@@ -0,0 +1,262 @@
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from core.gene import Gene
+from operators.fitness.fitness_cache import FitnessCache
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.mutation.tower_mutation_operator import TowerMutationOperator
+from operators.recombination.tower_crossover_operator import TowerCrossoverOperator
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+
+
+class TowerChromosome:
+    """
+    A chromosome made of towers only.
+
+    The genome is a variable-length (towers, 3) float array of (x, y, bandwidth) rows, so its size and the cost of
+    the operators grow with the number of towers rather than with the grid. The city assignment is decoded by
+    assigning every city to its best-covering tower, optionally weighing the coverage by the bandwidth, and towers
+    left without cities are dropped, since they would only add cost. The decoded assignment is kept until the towers
+    change, so a chromosome built from arrays keeps the given assignment, e.g. one improved by a local search.
+
+    The fitness is the objective of the FitnessCalculator on the decoded (towers, assignment) arrays.
+    """
+    __slots__ = ('towers', 'assignment', 'fitness', 'genome_key', 'config')
+
+    bandwidth_weighted = BANDWIDTH_WEIGHTED_DECODING
+
+    def __init__(self, towers=None, assignment=None, config: ProblemConfig = None):
+        """
+        Initialize a new TowerChromosome object with a tower array.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows. Defaults to an empty array.
+            assignment (numpy.ndarray): The tower index of each city, or None to decode it from the towers.
+            config (ProblemConfig): The problem the chromosome solves. Defaults to ProblemConfig.default().
+        """
+        self.config = config or ProblemConfig.default()
+        self.towers = towers if towers is not None else np.empty((0, 3), dtype=np.float64)
+        self.assignment = assignment
+        self.fitness = None
+        self.genome_key = None
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    @property
+    def tower_mutation_operator(self) -> TowerMutationOperator:
+        return TowerMutationOperator.shared(self.config)
+
+    @property
+    def tower_crossover_operator(self) -> TowerCrossoverOperator:
+        return TowerCrossoverOperator.shared(self.config)
+
+    @property
+    def fitness_cache(self) -> FitnessCache:
+        return FitnessCache.shared(self.config)
+
+    @staticmethod
+    def initialize(config: ProblemConfig = None):
+        """
+        Static method that creates a new TowerChromosome object with randomly initialized towers.
+
+        Args:
+            config (ProblemConfig, optional): The problem to initialize the chromosome for. Defaults to
+                                              ProblemConfig.default().
+
+        Returns:
+            TowerChromosome: A new TowerChromosome object with randomly initialized towers.
+        """
+        config = config or ProblemConfig.default()
+        tower_count = np.random.randint(config.towers_min, config.towers_max + 1)
+
+        towers = np.empty((tower_count, 3), dtype=np.float64)
+        towers[:, 0] = np.random.uniform(config.location_min_x, config.location_max_x, tower_count)
+        towers[:, 1] = np.random.uniform(config.location_min_y, config.location_max_y, tower_count)
+        towers[:, 2] = np.random.uniform(config.bandwidth_min, config.bandwidth_max, tower_count)
+
+        return TowerChromosome(towers, config=config)
+
+    @staticmethod
+    def from_arrays(towers, assignment, config: ProblemConfig = None):
+        """
+        Static method that creates a new TowerChromosome object from a tower array and a city assignment.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city, kept until the towers change.
+            config (ProblemConfig, optional): The problem the chromosome solves. Defaults to ProblemConfig.default().
+
+        Returns:
+            TowerChromosome: A new TowerChromosome object holding copies of the arrays without unused towers.
+        """
+        return TowerChromosome(*MultiPointsCrossoverOperator.compact(np.array(towers, dtype=np.float64),
+                                                                     np.array(assignment, dtype=np.int32)), config)
+
+    @property
+    def genes(self):
+        """
+        Decode the chromosome into a list of genes, one shared Gene object per tower.
+
+        Returns:
+            list: A list of genes representing the tower assigned to each city.
+        """
+        towers, assignment = self.encode()
+        genes = [Gene((float(x), float(y)), float(bandwidth)) for x, y, bandwidth in towers]
+        return [genes[tower_index] for tower_index in assignment]
+
+    def copy(self):
+        """
+        Creates a copy of the current TowerChromosome object.
+
+        Returns:
+            TowerChromosome: A new TowerChromosome object with copies of the arrays and the same fitness.
+        """
+        chromosome = TowerChromosome(self.towers.copy(),
+                                     self.assignment.copy() if self.assignment is not None else None, self.config)
+        chromosome.fitness = self.fitness
+        chromosome.genome_key = self.genome_key
+        return chromosome
+
+    def crossover(self, other, crossover_rate):
+        """
+        Performs crossover between two parent chromosomes to create two offspring chromosomes.
+
+        Args:
+            other (TowerChromosome): The other parent chromosome to cross with.
+            crossover_rate (float): The probability of performing crossover.
+
+        Returns:
+            tuple: A tuple containing two new offspring TowerChromosome objects.
+        """
+        offspring = self.tower_crossover_operator.crossover(self.towers, other.towers, crossover_rate)
+        if offspring is None:
+            return self.copy(), other.copy()
+
+        offspring1_towers, offspring2_towers = offspring
+        return TowerChromosome(offspring1_towers, config=self.config), TowerChromosome(offspring2_towers,
+                                                                                       config=self.config)
+
+    def mutate(self, mutation_rate: float) -> None:
+        """
+        Perform mutation on the chromosome's towers: move, remove and add towers.
+
+        Args:
+        - mutation_rate (float): The probability of moving each tower and of removing and adding a tower.
+
+        Returns:
+        None
+        """
+        self.towers = self.tower_mutation_operator.mutate(self.towers, mutation_rate)
+        self.assignment = None
+        self.genome_key = None
+
+    @staticmethod
+    def mutate_population(chromosomes, mutation_rate: float, random_generator) -> None:
+        """
+        Mutate the towers of a whole population in one batch.
+
+        Args:
+        - chromosomes (list): The TowerChromosome objects to mutate in place.
+        - mutation_rate (float): The probability of moving each tower and of removing and adding a tower.
+        - random_generator (numpy.random.Generator): The generator of the mutations.
+
+        Returns:
+        None
+        """
+        if not chromosomes:
+            return
+
+        towers_list = chromosomes[0].tower_mutation_operator.mutate_population(
+            [chromosome.towers for chromosome in chromosomes], mutation_rate, random_generator)
+        for chromosome, towers in zip(chromosomes, towers_list):
+            chromosome.towers = towers
+            chromosome.assignment = None
+            chromosome.genome_key = None
+
+    def decode(self) -> None:
+        """
+        Assign every city to its best-covering tower and drop the towers left without cities, unless the assignment
+        is already known.
+        """
+        if self.assignment is not None:
+            return
+
+        assignment = self.fitness_calculator.calc_best_covering_towers(self.towers, self.bandwidth_weighted)
+        self.towers, self.assignment = MultiPointsCrossoverOperator.compact(self.towers, assignment)
+
+    def can_update_fitness(self) -> bool:
+        """
+        Whether the fitness can be updated incrementally. The tower genome is always evaluated in full.
+
+        Returns:
+        - bool: False.
+        """
+        return False
+
+    def store_evaluation(self, fitness, towers_population=None, towers_satisfaction=None) -> None:
+        """
+        Store the result of an evaluation of the decoded arrays.
+
+        Args:
+        - fitness (float): The fitness value of the chromosome.
+        - towers_population (numpy.ndarray): Unused; part of the interface shared with CompactChromosome.
+        - towers_satisfaction (numpy.ndarray): Unused; part of the interface shared with CompactChromosome.
+        """
+        self.fitness = fitness
+        self.fitness_cache.put(self.genome_hash(), fitness)
+
+    def calculate_fitness(self) -> float:
+        """
+        Calculate the fitness value of the chromosome based on the objective function.
+
+        Returns:
+        - float: The fitness value of the chromosome.
+        """
+        if self.load_cached_fitness():
+            return self.fitness
+
+        self.store_evaluation(self.fitness_calculator.calculate_fitness_vectorized(*self.encode()))
+        return self.fitness
+
+    def genome_hash(self) -> bytes:
+        """
+        Return the content hash of the decoded chromosome, computing it if the towers changed since the last call.
+
+        Returns:
+        - bytes: The genome hash as computed by FitnessCache.genome_hash.
+        """
+        if self.genome_key is None:
+            self.genome_key = self.fitness_cache.genome_hash(*self.encode())
+        return self.genome_key
+
+    def load_cached_fitness(self) -> bool:
+        """
+        Look up the fitness of the chromosome in the shared fitness cache.
+
+        Returns:
+        - bool: True if the fitness was found and set on the chromosome.
+        """
+        fitness = self.fitness_cache.get(self.genome_hash())
+        if fitness is None:
+            return False
+
+        self.fitness = fitness
+        return True
+
+    def encode(self):
+        """
+        Return the chromosome's decoded arrays for the vectorized fitness path.
+
+        Returns:
+        - tuple: The (towers, assignment) arrays of the chromosome.
+        """
+        self.decode()
+        return self.towers, self.assignment
+
+    def __str__(self):
+        towers_str = ", \n".join(f"Tower: location=({x}, {y}), bandwidth={bandwidth}"
+                                 for x, y, bandwidth in self.towers)
+        return f"TowerChromosome: towers=[\n{towers_str}\n],\nfitness={self.fitness}"
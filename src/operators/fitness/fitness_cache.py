@@ -0,0 +1,155 @@
+import hashlib
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+
+
+class FitnessCache:
+    """
+    A bounded least-recently-used cache of fitness values keyed by a content hash of the genome.
+    """
+    shared_instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, max_size: int):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): The maximum number of fitness values kept. A size of 0 disables the cache.
+
+        Attributes:
+            - max_size (int): The maximum number of fitness values kept.
+            - hits (int): The number of lookups that found a fitness value.
+            - misses (int): The number of lookups that did not find a fitness value.
+            - evictions (int): The number of fitness values dropped to respect max_size.
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def shared(config: ProblemConfig = None) -> 'FitnessCache':
+        """
+        Returns the fitness cache shared by all chromosomes of the given problem configuration.
+
+        Args:
+            config (ProblemConfig): The problem configuration. Defaults to ProblemConfig.default().
+
+        Returns:
+            FitnessCache: The shared fitness cache of the configuration, bounded by FITNESS_CACHE_SIZE.
+        """
+        config = config or ProblemConfig.default()
+        if config not in FitnessCache.shared_instances:
+            FitnessCache.shared_instances[config] = FitnessCache(FITNESS_CACHE_SIZE)
+        return FitnessCache.shared_instances[config]
+
+    @staticmethod
+    def genome_hash(towers, assignment) -> bytes:
+        """
+        Computes a content hash of a genome given as a tower array and a city assignment.
+
+        Towers are renumbered in order of their first appearance in the assignment, so the hash does not depend on
+        how a representation happens to order its towers.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+
+        Returns:
+            bytes: A 16-byte digest of the genome.
+        """
+        used_towers, first_cities = np.unique(assignment, return_index=True)
+        order = used_towers[np.argsort(first_cities)]
+        new_indices = np.empty(len(towers), dtype=np.int32)
+        new_indices[order] = np.arange(len(order), dtype=np.int32)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(towers[order], dtype=np.float64).tobytes())
+        digest.update(new_indices[assignment].tobytes())
+        return digest.digest()
+
+    def get(self, key):
+        """
+        Looks up the fitness value of a genome and marks it as recently used.
+
+        Args:
+            key (bytes): The genome hash.
+
+        Returns:
+            float: The cached fitness value, or None if the genome is not cached.
+        """
+        if self.max_size <= 0:
+            return None
+
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return fitness
+
+    def put(self, key, fitness: float) -> None:
+        """
+        Stores the fitness value of a genome, evicting the least recently used values if the cache is full.
+
+        Args:
+            key (bytes): The genome hash.
+            fitness (float): The fitness value of the genome.
+        """
+        if self.max_size <= 0:
+            return
+
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drops all cached fitness values and resets the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: The size, hits, misses, evictions and hit rate of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    @staticmethod
+    def merge_stats(stats_list) -> dict:
+        """
+        Merges the counters of several caches, e.g. one per independent run.
+
+        Args:
+            stats_list (list): A list of dictionaries as returned by stats.
+
+        Returns:
+            dict: The summed size, hits, misses and evictions with the overall hit rate.
+        """
+        merged = {key: sum(stats[key] for stats in stats_list) for key in ('size', 'hits', 'misses', 'evictions')}
+        lookups = merged['hits'] + merged['misses']
+        merged['hit_rate'] = merged['hits'] / lookups if lookups else 0.0
+        return merged
@@ -1,22 +1,32 @@
+import math
+import weakref
 from collections import defaultdict
 
 import numpy as np
 
 from common.config import *
+from common.problem_config import ProblemConfig
+from operators.fitness.spatial_index import SpatialGridIndex
 
 
 class FitnessCalculator:
-    def __init__(self, tower_construction_cost=TOWER_CONSTRUCTION_COST,
-                 tower_maintenance_cost=TOWER_MAINTENANCE_COST,
-                 user_satisfaction_levels=USER_SATISFACTION_LEVELS,
-                 user_satisfaction_scores=USER_SATISFACTIONS_SCORES,
-                 cities_location=CITIES_LOCATION,
-                 cities_population=CITIES_POPULATION,
-                 total_satisfaction_ratio=TOTAL_SATISFACTION_RATIO,
-                 total_cost_ratio=TOTAL_COST_RATIO):
+    shared_instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, tower_construction_cost=None,
+                 tower_maintenance_cost=None,
+                 user_satisfaction_levels=None,
+                 user_satisfaction_scores=None,
+                 cities_location=None,
+                 cities_population=None,
+                 total_satisfaction_ratio=None,
+                 total_cost_ratio=None,
+                 coverage_tolerance=COVERAGE_TOLERANCE,
+                 config: ProblemConfig = None):
         """
         Constructor method for the FitnessCalculator class.
 
+        Problem values left as None are taken from config, which defaults to ProblemConfig.default().
+
         Initializes the following instance variables:
             - sigma: The covariance matrix used to calculate the coverage of a tower.
             - sigma_inv: The inverse of the covariance matrix.
@@ -24,13 +34,43 @@ class FitnessCalculator:
             - tower_maintenance_cost: The cost of maintaining a tower per unit of bandwidth.
             - user_satisfaction_levels: The levels of user satisfaction for different levels of bandwidth.
             - user_satisfaction_scores: The satisfaction scores corresponding to each user satisfaction level.
-            - cities_location: The location of each city as a tuple of (latitude, longitude).
+            - cities_location: The location of each city as an (x, y) pair, e.g. a (cities, 2) array.
             - cities_population: The population of each city.
             - total_satisfaction_ratio: The ratio by which the total user satisfaction should be multiplied in
                                          the final fitness calculation.
             - total_cost_ratio: The ratio by which the total cost should be multiplied in the final fitness
                                  calculation.
+            - cities_location_array: The city locations as a (cities, 2) float array for the vectorized path.
+            - cities_population_array: The city populations as a float array for the vectorized path.
+            - satisfaction_levels_array: The user satisfaction levels as a sorted float array.
+            - satisfaction_scores_array: The satisfaction scores prefixed with 0 for levels below the first one.
+            - diagonal_sigma: Whether the covariance matrix is diagonal, so the coverage kernel factorizes per axis.
+            - grid_x, grid_y: The distinct x and y coordinates of the cities.
+            - grid_rows, grid_cols: The index of each city's x and y coordinate in grid_x and grid_y.
+            - separable_coverage: Whether coverage matrices over all cities can be computed from per-axis kernels,
+                                  i.e. the covariance is diagonal and the cities form a regular grid.
+            - coverage_tolerance: Coverage values below this tolerance are truncated to 0. None keeps the exact
+                                  kernel.
+            - coverage_radius: The distance beyond which the kernel is below coverage_tolerance in every direction,
+                               or None without a tolerance.
+            - coverage_exponent_cutoff: The exponent below which the kernel is below coverage_tolerance, with a small
+                                        margin, or None without a tolerance.
+            - spatial_index: The SpatialGridIndex over the cities, built on the first sparse coverage query.
         """
+        problem_values = (tower_construction_cost, tower_maintenance_cost, user_satisfaction_levels,
+                          user_satisfaction_scores, cities_location, cities_population, total_satisfaction_ratio,
+                          total_cost_ratio)
+        if any(value is None for value in problem_values):
+            config = config or ProblemConfig.default()
+            tower_construction_cost = self.__or_default(tower_construction_cost, config.tower_construction_cost)
+            tower_maintenance_cost = self.__or_default(tower_maintenance_cost, config.tower_maintenance_cost)
+            user_satisfaction_levels = self.__or_default(user_satisfaction_levels, config.user_satisfaction_levels)
+            user_satisfaction_scores = self.__or_default(user_satisfaction_scores, config.user_satisfaction_scores)
+            cities_location = self.__or_default(cities_location, config.cities_location)
+            cities_population = self.__or_default(cities_population, config.cities_population)
+            total_satisfaction_ratio = self.__or_default(total_satisfaction_ratio, config.total_satisfaction_ratio)
+            total_cost_ratio = self.__or_default(total_cost_ratio, config.total_cost_ratio)
+
         self.sigma = np.array([[8, 0], [0, 8]])
         self.sigma_inv = np.linalg.inv(self.sigma)
         self.tower_construction_cost = tower_construction_cost
@@ -41,6 +81,46 @@ class FitnessCalculator:
         self.cities_population = cities_population
         self.total_satisfaction_ratio = total_satisfaction_ratio
         self.total_cost_ratio = total_cost_ratio
+        self.cities_location_array = np.asarray(cities_location, dtype=np.float64).reshape(-1, 2)
+        self.cities_population_array = np.asarray(cities_population, dtype=np.float64)
+        self.satisfaction_levels_array = np.asarray(user_satisfaction_levels, dtype=np.float64)
+        self.satisfaction_scores_array = np.concatenate(([0.0], np.asarray(user_satisfaction_scores,
+                                                                            dtype=np.float64)))
+        self.diagonal_sigma = self.sigma_inv[0, 1] == 0 and self.sigma_inv[1, 0] == 0
+        self.grid_x, self.grid_rows = np.unique(self.cities_location_array[:, 0], return_inverse=True)
+        self.grid_y, self.grid_cols = np.unique(self.cities_location_array[:, 1], return_inverse=True)
+        grid_cells = self.grid_rows * len(self.grid_y) + self.grid_cols
+        regular_grid = (len(self.grid_x) * len(self.grid_y) == len(self.cities_location_array) and
+                        np.all(np.bincount(grid_cells, minlength=1) <= 1))
+        self.separable_coverage = bool(self.diagonal_sigma and regular_grid)
+        self.coverage_tolerance = coverage_tolerance
+        self.coverage_radius = None
+        self.coverage_exponent_cutoff = None
+        if coverage_tolerance is not None:
+            max_variance = np.max(np.linalg.eigvalsh(self.sigma))
+            self.coverage_radius = float(np.sqrt(-2 * np.log(coverage_tolerance) * max_variance))
+            self.coverage_exponent_cutoff = float(np.log(coverage_tolerance)) - 1e-9
+        self.spatial_index = None
+
+    @staticmethod
+    def shared(config: ProblemConfig = None) -> 'FitnessCalculator':
+        """
+        Returns the fitness calculator shared by everything working on the given problem configuration.
+
+        Args:
+            config (ProblemConfig): The problem configuration. Defaults to ProblemConfig.default().
+
+        Returns:
+            FitnessCalculator: The shared fitness calculator of the configuration.
+        """
+        config = config or ProblemConfig.default()
+        if config not in FitnessCalculator.shared_instances:
+            FitnessCalculator.shared_instances[config] = FitnessCalculator(config=config)
+        return FitnessCalculator.shared_instances[config]
+
+    @staticmethod
+    def __or_default(value, default):
+        return default if value is None else value
 
     @staticmethod
     def calc_bw_prime(tower_bandwidth, city_population, associated_cities_population):
@@ -106,6 +186,170 @@ class FitnessCalculator:
                 return self.user_satisfaction_scores[i - 1] * city_population
         return self.user_satisfaction_scores[-1] * city_population
 
+    def calc_coverages(self, tower_locations, cities_location):
+        """
+        Vectorized version of calc_coverage for many tower-city pairs at once.
+
+        With a coverage tolerance, values below it are truncated to 0 so that scoring agrees with the sparse coverage
+        of calc_sparse_coverage. The exponential is then only evaluated for the pairs within the radius cutoff, whose
+        exponent is at least log(coverage_tolerance), so the pairs of distant towers cost no exponential. The cutoff
+        has a small margin and the truncation is applied as before, so the result is the same as without the cutoff.
+
+        Args:
+            tower_locations (numpy.ndarray): A (pairs, 2) array with the (x, y) location of each tower.
+            cities_location (numpy.ndarray): A (pairs, 2) array with the (x, y) location of each city.
+
+        Returns:
+            numpy.ndarray: The coverage of each tower on its paired city.
+        """
+        diff = cities_location - tower_locations
+        if self.diagonal_sigma:
+            # Same products as the general form without the zero off-diagonal terms, so the result is identical.
+            exp_term = ((-0.5 * diff[:, 0]) * self.sigma_inv[0, 0] * diff[:, 0] +
+                        (-0.5 * diff[:, 1]) * self.sigma_inv[1, 1] * diff[:, 1])
+        else:
+            scaled = (-0.5 * diff) @ self.sigma_inv
+            exp_term = scaled[:, 0] * diff[:, 0] + scaled[:, 1] * diff[:, 1]
+        if self.coverage_tolerance is None:
+            return np.exp(exp_term)
+
+        coverage = np.zeros(len(exp_term), dtype=np.float64)
+        within_cutoff = exp_term >= self.coverage_exponent_cutoff
+        coverage[within_cutoff] = np.exp(exp_term[within_cutoff])
+        coverage[coverage < self.coverage_tolerance] = 0.0
+        return coverage
+
+    def calc_sparse_coverage(self, tower_locations):
+        """
+        Calculates the coverage of every tower on the cities within the coverage radius only.
+
+        A spatial index over the cities restricts each tower to its neighbourhood, so the cost grows with
+        towers × neighbourhood instead of towers × cities. Pairs whose coverage is below the tolerance are dropped.
+
+        Args:
+            tower_locations (numpy.ndarray): A (towers, 2) array with the (x, y) location of each tower.
+
+        Returns:
+            tuple: A (tower_indices, city_indices, coverage) triplet of arrays describing the non-zero coverage pairs,
+                   grouped by tower.
+
+        Raises:
+            ValueError: If no coverage tolerance is set.
+        """
+        if self.coverage_tolerance is None:
+            raise ValueError("Sparse coverage requires a coverage tolerance")
+
+        if self.spatial_index is None:
+            self.spatial_index = SpatialGridIndex(self.cities_location_array, self.coverage_radius)
+
+        tower_locations = np.asarray(tower_locations, dtype=np.float64).reshape(-1, 2)
+        tower_indices, city_indices = self.spatial_index.query_radius(tower_locations, self.coverage_radius)
+        coverage = self.calc_coverages(tower_locations[tower_indices], self.cities_location_array[city_indices])
+
+        covered = coverage > 0
+        return tower_indices[covered], city_indices[covered], coverage[covered]
+
+    def calc_coverage_matrix(self, tower_locations):
+        """
+        Calculates the coverage of every tower on every city.
+
+        With a diagonal covariance on a regular grid the kernel factorizes into exp(-dx²/2σx²)·exp(-dy²/2σy²), so each
+        tower needs one exponential per grid row and per grid column instead of one per city. Otherwise the general
+        form is evaluated for every tower-city pair. The factorized values may differ from calc_coverages in the last
+        bit, so they are meant for comparing towers rather than for scoring.
+
+        Args:
+            tower_locations (numpy.ndarray): A (towers, 2) array with the (x, y) location of each tower.
+
+        Returns:
+            numpy.ndarray: A (towers, cities) array with the coverage of each tower on each city.
+        """
+        tower_locations = np.asarray(tower_locations, dtype=np.float64).reshape(-1, 2)
+        if self.separable_coverage:
+            coverage_x, coverage_y = self.__calc_axis_coverages(tower_locations)
+            coverage = coverage_x[:, self.grid_rows] * coverage_y[:, self.grid_cols]
+            if self.coverage_tolerance is not None:
+                coverage[coverage < self.coverage_tolerance] = 0.0
+            return coverage
+
+        towers_count, cities_count = len(tower_locations), len(self.cities_location_array)
+        coverage = self.calc_coverages(np.repeat(tower_locations, cities_count, axis=0),
+                                       np.tile(self.cities_location_array, (towers_count, 1)))
+        return coverage.reshape(towers_count, cities_count)
+
+    def calc_best_covering_towers(self, towers, bandwidth_weighted: bool = False, max_batch_cells: int = 2 ** 21):
+        """
+        Assigns every city to the tower that covers it best.
+
+        The coverage matrix is computed for blocks of towers of at most max_batch_cells tower-city pairs and reduced
+        to a running maximum, so the memory does not grow with towers × cities. Cities covered by no tower, e.g. when
+        every coverage is below the tolerance, are assigned to the tower nearest in the metric of the kernel, in blocks
+        of cities of at most max_batch_cells city-tower pairs as well.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            bandwidth_weighted (bool): Whether to weigh the coverage of each tower by its bandwidth, which favours
+                                       the towers offering the cities more bandwidth.
+            max_batch_cells (int): The largest number of tower-city pairs scored at once.
+
+        Returns:
+            numpy.ndarray: The int32 index of the best-covering tower of each city.
+        """
+        cities_count = len(self.cities_location_array)
+        best_scores = np.zeros(cities_count, dtype=np.float64)
+        assignment = np.zeros(cities_count, dtype=np.int32)
+        block = max(1, max_batch_cells // cities_count)
+        for start in range(0, len(towers), block):
+            scores = self.calc_coverage_matrix(towers[start:start + block, :2])
+            if bandwidth_weighted:
+                scores *= towers[start:start + block, 2:3]
+            block_best = np.argmax(scores, axis=0)
+            block_scores = scores[block_best, np.arange(cities_count)]
+            better = block_scores > best_scores
+            best_scores[better] = block_scores[better]
+            assignment[better] = block_best[better] + start
+
+        uncovered = np.flatnonzero(best_scores == 0)
+        uncovered_block = max(1, max_batch_cells // len(towers))
+        for start in range(0, len(uncovered), uncovered_block):
+            block_cities = uncovered[start:start + uncovered_block]
+            diff = self.cities_location_array[block_cities, np.newaxis, :] - towers[np.newaxis, :, :2]
+            distances = np.einsum('ctj,jk,ctk->ct', diff, self.sigma_inv, diff)
+            assignment[block_cities] = np.argmin(distances, axis=1)
+        return assignment
+
+    def __calc_axis_coverages(self, tower_locations):
+        """
+        Calculates the per-axis factors of the coverage kernel for a diagonal covariance.
+
+        Returns:
+            tuple: A (towers, len(grid_x)) array and a (towers, len(grid_y)) array of kernel factors.
+        """
+        diff_x = self.grid_x - tower_locations[:, 0:1]
+        diff_y = self.grid_y - tower_locations[:, 1:2]
+        coverage_x = np.exp((-0.5 * diff_x) * self.sigma_inv[0, 0] * diff_x)
+        coverage_y = np.exp((-0.5 * diff_y) * self.sigma_inv[1, 1] * diff_y)
+        return coverage_x, coverage_y
+
+    def calc_city_satisfaction_scores(self, cities_bandwidth, cities_population):
+        """
+        Vectorized version of calc_city_satisfaction_score.
+
+        The satisfaction level of every city is located among user_satisfaction_levels with a single searchsorted
+        call, which maps levels below the first threshold to a score of 0.
+
+        Args:
+            cities_bandwidth (numpy.ndarray): The bandwidth available for each city.
+            cities_population (numpy.ndarray): The population of each city.
+
+        Returns:
+            numpy.ndarray: The satisfaction score of each city.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            user_satisfaction_levels = cities_bandwidth / cities_population
+        level_indices = np.searchsorted(self.satisfaction_levels_array, user_satisfaction_levels, side='right')
+        return self.satisfaction_scores_array[level_indices] * cities_population
+
     @staticmethod
     def group_by(genes):
         """
@@ -123,6 +367,47 @@ class FitnessCalculator:
             groups[tower].append(city_index)
         return groups
 
+    @staticmethod
+    def encode(genes):
+        """
+        Encode a list of genes as arrays for the vectorized fitness path.
+
+        Distinct towers are numbered in order of their first appearance in the genes.
+
+        Args:
+            genes (list): A list of genes representing the tower assigned to each city.
+
+        Returns:
+            tuple: A (towers, assignment) tuple where towers is a (towers, 3) float array of (x, y, bandwidth) rows
+                   and assignment is an int32 array with the tower index of each city.
+        """
+        tower_indices = {}
+        assignment = np.empty(len(genes), dtype=np.int32)
+        for city_index, tower in enumerate(genes):
+            assignment[city_index] = tower_indices.setdefault(tower, len(tower_indices))
+        towers = np.array([(*tower.location, tower.bandwidth) for tower in tower_indices], dtype=np.float64)
+        return towers.reshape(-1, 3), assignment
+
+    @staticmethod
+    def pack(encoded_chromosomes):
+        """
+        Pack several encoded chromosomes into padded arrays for batch evaluation.
+
+        Args:
+            encoded_chromosomes (list): A list of (towers, assignment) tuples as returned by encode.
+
+        Returns:
+            tuple: A (towers, towers_count, assignments) tuple where towers is a (chromosomes, max_towers, 3) array
+                   padded with zero rows, towers_count holds the real number of towers of each chromosome and
+                   assignments is a (chromosomes, cities) int32 array.
+        """
+        towers_count = np.array([len(towers) for towers, _ in encoded_chromosomes], dtype=np.int64)
+        packed_towers = np.zeros((len(encoded_chromosomes), max(towers_count, default=0), 3), dtype=np.float64)
+        for i, (towers, _) in enumerate(encoded_chromosomes):
+            packed_towers[i, :len(towers)] = towers
+        assignments = np.array([assignment for _, assignment in encoded_chromosomes], dtype=np.int32)
+        return packed_towers, towers_count, assignments
+
     def calc_total_cost(self, genes):
         """
         Calculates the total cost of a solution with the given genes.
@@ -134,9 +419,22 @@ class FitnessCalculator:
             float: The total cost of the solution.
 
         """
-        towers = set(genes)
-        return self.tower_construction_cost * len(towers) + sum(
-            [self.tower_maintenance_cost * tower.bandwidth for tower in towers])
+        towers, _ = self.encode(genes)
+        return self.calc_total_cost_vectorized(towers)
+
+    def calc_total_cost_vectorized(self, towers):
+        """
+        Calculates the total cost of a solution from its tower array.
+
+        Maintenance costs are summed with math.fsum so that the result does not depend on the order of the towers.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+
+        Returns:
+            float: The total cost of the solution.
+        """
+        return self.tower_construction_cost * len(towers) + math.fsum(self.tower_maintenance_cost * towers[:, 2])
 
     def calc_total_satisfaction(self, genes):
         """
@@ -149,19 +447,76 @@ class FitnessCalculator:
         Returns:
             float: The total user satisfaction score of the chromosome.
         """
-        cities_by_tower = self.group_by(genes)
+        return self.calc_total_satisfaction_vectorized(*self.encode(genes))
 
-        total_satisfaction = 0.0
+    def calc_total_satisfaction_vectorized(self, towers, assignment):
+        """
+        Calculates the total user satisfaction score from the tower array and the city assignment.
 
-        for city_index, tower in enumerate(genes):
-            city_location = self.cities_location[city_index]
-            city_population = self.cities_population[city_index]
-            associated_cities_population = sum([self.cities_population[i] for i in cities_by_tower[tower]])
-            city_bandwidth = self.calc_bandwidth(tower, city_location, city_population, associated_cities_population)
-            city_satisfaction_score = self.calc_city_satisfaction_score(city_bandwidth, city_population)
-            total_satisfaction += city_satisfaction_score * city_population
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+
+        Returns:
+            float: The total user satisfaction score of the chromosome.
+        """
+        _, towers_satisfaction = self.calc_towers_satisfaction(towers, assignment)
+        return math.fsum(towers_satisfaction)
+
+    def calc_towers_satisfaction(self, towers, assignment, cities=None):
+        """
+        Calculates the associated population and the user satisfaction subtotal of every tower.
 
-        return total_satisfaction
+        The population associated with each tower is computed once with bincount instead of once per city. When
+        cities is given, only those cities are evaluated; the subtotals are then exact for every tower whose cities
+        are all included, which is what incremental evaluation relies on. Subtotals accumulate cities in index order,
+        so they are identical whichever path computes them.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+            cities (numpy.ndarray, optional): The indices of the cities to evaluate. Defaults to all cities.
+
+        Returns:
+            tuple: A (towers_population, towers_satisfaction) tuple of arrays with one entry per tower.
+        """
+        if cities is None:
+            cities = slice(len(assignment))
+        towers_population, _, cities_satisfaction_score = self.calc_cities_satisfaction(towers, assignment, cities)
+
+        towers_satisfaction = np.bincount(assignment[cities],
+                                          weights=cities_satisfaction_score * self.cities_population_array[cities],
+                                          minlength=len(towers))
+        return towers_population, towers_satisfaction
+
+    def calc_cities_satisfaction(self, towers, assignment, cities=slice(None)):
+        """
+        Calculates the associated population of every tower and the bandwidth and satisfaction score of every city.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+            cities (numpy.ndarray, optional): The indices of the cities to evaluate. Defaults to all cities.
+
+        Returns:
+            tuple: The population associated with each tower, and the bandwidth and the satisfaction score, i.e. the
+                   score of the city's satisfaction level times its population, of each evaluated city.
+        """
+        assignment = assignment[cities]
+        cities_location = self.cities_location_array[cities]
+        cities_population = self.cities_population_array[cities]
+
+        towers_population = np.bincount(assignment, weights=cities_population, minlength=len(towers))
+        associated_cities_population = towers_population[assignment]
+        cities_tower = towers[assignment]
+
+        coverage = self.calc_coverages(cities_tower[:, :2], cities_location)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bw_prime = cities_population / associated_cities_population * cities_tower[:, 2]
+        cities_bandwidth = coverage * bw_prime
+
+        return towers_population, cities_bandwidth, self.calc_city_satisfaction_scores(cities_bandwidth,
+                                                                                       cities_population)
 
     def calculate_fitness(self, genes):
         """
@@ -176,6 +531,118 @@ class FitnessCalculator:
         Returns:
             float: The fitness score of the given set of genes.
         """
-        total_cost = self.calc_total_cost(genes)
-        total_satisfaction = self.calc_total_satisfaction(genes)
-        return total_satisfaction / total_cost
+        return self.calculate_fitness_vectorized(*self.encode(genes))
+
+    def calculate_fitness_vectorized(self, towers, assignment):
+        """
+        Calculates the fitness of a solution given as a tower array and a city assignment.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+
+        Returns:
+            float: The fitness score of the solution.
+        """
+        _, towers_satisfaction = self.calc_towers_satisfaction(towers, assignment)
+        return self.calc_fitness_from_towers_satisfaction(towers, towers_satisfaction)
+
+    def calc_fitness_from_towers_satisfaction(self, towers, towers_satisfaction):
+        """
+        Calculates the fitness of a solution from its tower array and the satisfaction subtotal of every tower.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            towers_satisfaction (numpy.ndarray): The user satisfaction subtotal of every tower.
+
+        Returns:
+            float: The fitness score of the solution.
+        """
+        return math.fsum(towers_satisfaction) / self.calc_total_cost_vectorized(towers)
+
+    def calculate_population_fitness(self, towers, towers_count, assignments, max_batch_cells=2 ** 22):
+        """
+        Calculates the fitness of a whole population of packed chromosomes in one vectorized pass.
+
+        Args:
+            towers (numpy.ndarray): A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows padded with zeros.
+            towers_count (numpy.ndarray): The number of towers of each chromosome.
+            assignments (numpy.ndarray): A (chromosomes, cities) array with the tower index of each city.
+            max_batch_cells (int): The maximum number of chromosome-city pairs evaluated at once.
+
+        Returns:
+            numpy.ndarray: The fitness score of each chromosome.
+        """
+        fitness, _, _ = self.evaluate_population(towers, towers_count, assignments, max_batch_cells)
+        return fitness
+
+    def evaluate_population(self, towers, towers_count, assignments, max_batch_cells=2 ** 22):
+        """
+        Evaluates a whole population of packed chromosomes in one vectorized pass.
+
+        Tower indices of every chromosome are offset by its row so that per-tower sums of the entire population come
+        out of a single bincount. Large populations are processed in chunks of at most max_batch_cells
+        chromosome-city pairs to bound the temporary arrays.
+
+        Args:
+            towers (numpy.ndarray): A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows padded with zeros.
+            towers_count (numpy.ndarray): The number of towers of each chromosome.
+            assignments (numpy.ndarray): A (chromosomes, cities) array with the tower index of each city.
+            max_batch_cells (int): The maximum number of chromosome-city pairs evaluated at once.
+
+        Returns:
+            tuple: A (fitness, towers_population, towers_satisfaction) tuple, where the last two are
+                   (chromosomes, max_towers) arrays of per-tower contributions.
+        """
+        chromosomes_count, cities_count = assignments.shape
+        batch_size = max(1, max_batch_cells // max(cities_count, 1))
+        towers_population = np.zeros(towers.shape[:2], dtype=np.float64)
+        towers_satisfaction = np.zeros(towers.shape[:2], dtype=np.float64)
+
+        for start in range(0, chromosomes_count, batch_size):
+            end = min(start + batch_size, chromosomes_count)
+            towers_population[start:end], towers_satisfaction[start:end] = self.calc_population_towers_satisfaction(
+                towers[start:end], assignments[start:end])
+
+        total_satisfaction = np.array([math.fsum(row) for row in towers_satisfaction])
+        maintenance_cost = np.array([math.fsum(row) for row in self.tower_maintenance_cost * towers[:, :, 2]])
+        total_cost = self.tower_construction_cost * towers_count + maintenance_cost
+
+        return total_satisfaction / total_cost, towers_population, towers_satisfaction
+
+    def calc_population_towers_satisfaction(self, towers, assignments):
+        """
+        Calculates the associated population and the user satisfaction subtotal of every tower of a packed population.
+
+        Args:
+            towers (numpy.ndarray): A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows padded with zeros.
+            assignments (numpy.ndarray): A (chromosomes, cities) array with the tower index of each city.
+
+        Returns:
+            tuple: A (towers_population, towers_satisfaction) tuple of (chromosomes, max_towers) arrays.
+        """
+        chromosomes_count, max_towers = towers.shape[:2]
+        cities_count = assignments.shape[1]
+        cities_location = self.cities_location_array[:cities_count]
+        cities_population = self.cities_population_array[:cities_count]
+
+        flat_assignments = assignments + (np.arange(chromosomes_count) * max_towers)[:, None]
+        towers_population = np.bincount(flat_assignments.ravel(),
+                                        weights=np.tile(cities_population, chromosomes_count),
+                                        minlength=chromosomes_count * max_towers)
+        associated_cities_population = towers_population[flat_assignments]
+        cities_tower = towers.reshape(-1, 3)[flat_assignments]
+
+        coverage = self.calc_coverages(cities_tower[:, :, :2].reshape(-1, 2),
+                                       np.tile(cities_location, (chromosomes_count, 1)))
+        coverage = coverage.reshape(chromosomes_count, cities_count)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bw_prime = cities_population / associated_cities_population * cities_tower[:, :, 2]
+        cities_bandwidth = coverage * bw_prime
+
+        cities_satisfaction_score = self.calc_city_satisfaction_scores(cities_bandwidth, cities_population)
+        towers_satisfaction = np.bincount(flat_assignments.ravel(),
+                                          weights=(cities_satisfaction_score * cities_population).ravel(),
+                                          minlength=chromosomes_count * max_towers)
+        return (towers_population.reshape(chromosomes_count, max_towers),
+                towers_satisfaction.reshape(chromosomes_count, max_towers))
@@ -0,0 +1,182 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from common.config import *
+from operators.fitness.fitness_calculator import FitnessCalculator
+
+# Per-process state of the pool workers: the fitness calculator built on the shared problem data and the shared
+# memory block attached for each shared array, keyed by the array's key.
+_worker_fitness_calculator = None
+_worker_blocks = {}
+
+
+def _attach(name):
+    """
+    Attaches to an existing shared memory block. Workers share the parent's resource tracker, so the block is only
+    unlinked by the parent.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _shared_array(key, name, shape, dtype):
+    """
+    Returns a numpy view of a shared memory block, attaching to the block on first use. When the parent has moved the
+    array of a key to a new block, the worker's attachment to the previous block is closed, so the unlinked block is
+    not kept mapped until the pool exits.
+    """
+    block = _worker_blocks.get(key)
+    if block is None or block.name != name:
+        if block is not None:
+            block.close()
+        block = _worker_blocks[key] = _attach(name)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _initialize_worker(problem_arrays, costs):
+    """
+    Builds the worker's fitness calculator on top of the shared problem data.
+    """
+    global _worker_fitness_calculator
+    cities_location, cities_population, user_satisfaction_levels, user_satisfaction_scores = [
+        _shared_array(*array) for array in problem_arrays]
+    _worker_fitness_calculator = FitnessCalculator(cities_location=cities_location,
+                                                   cities_population=cities_population,
+                                                   user_satisfaction_levels=user_satisfaction_levels,
+                                                   user_satisfaction_scores=user_satisfaction_scores,
+                                                   **costs)
+
+
+def _evaluate_chunk(task):
+    """
+    Evaluates the chromosomes [start, end) of the packed population held in shared memory.
+    """
+    start, end, towers_array, towers_count_array, assignments_array = task
+    towers = _shared_array(*towers_array)
+    towers_count = _shared_array(*towers_count_array)
+    assignments = _shared_array(*assignments_array)
+    return _worker_fitness_calculator.evaluate_population(towers[start:end], towers_count[start:end],
+                                                          assignments[start:end])
+
+
+class ParallelFitnessEvaluator:
+    """
+    Evaluates packed populations on a pool of worker processes.
+
+    The problem data and each packed population are placed in shared memory, so tasks only carry block names and
+    chromosome ranges instead of pickled Chromosome and Gene objects. Every chromosome is evaluated exactly as
+    FitnessCalculator.evaluate_population would, so the results are identical to the serial path.
+    """
+
+    def __init__(self, workers: int = PARALLEL_FITNESS_WORKERS, chunk_size: int = PARALLEL_FITNESS_CHUNK_SIZE,
+                 fitness_calculator: FitnessCalculator = None):
+        """
+        Starts the worker pool and shares the problem data with it.
+
+        Args:
+            workers (int): The number of worker processes.
+            chunk_size (int): The number of chromosomes evaluated per task.
+            fitness_calculator (FitnessCalculator): The calculator holding the problem data. Defaults to the calculator
+                                                    shared by the default problem configuration.
+        """
+        fitness_calculator = fitness_calculator or FitnessCalculator.shared()
+        self.chunk_size = chunk_size
+        self.blocks = []
+        self.population_blocks = {}
+
+        problem_arrays = [self.__share(array) for array in (fitness_calculator.cities_location_array,
+                                                             fitness_calculator.cities_population_array,
+                                                             fitness_calculator.satisfaction_levels_array,
+                                                             fitness_calculator.satisfaction_scores_array[1:])]
+        costs = {
+            'tower_construction_cost': fitness_calculator.tower_construction_cost,
+            'tower_maintenance_cost': fitness_calculator.tower_maintenance_cost,
+            'total_satisfaction_ratio': fitness_calculator.total_satisfaction_ratio,
+            'total_cost_ratio': fitness_calculator.total_cost_ratio,
+            'coverage_tolerance': fitness_calculator.coverage_tolerance
+        }
+        self.pool = multiprocessing.Pool(workers, initializer=_initialize_worker, initargs=(problem_arrays, costs))
+
+    def evaluate_population(self, towers, towers_count, assignments):
+        """
+        Evaluates a packed population on the worker pool.
+
+        Args:
+            towers (numpy.ndarray): A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows padded with zeros.
+            towers_count (numpy.ndarray): The number of towers of each chromosome.
+            assignments (numpy.ndarray): A (chromosomes, cities) array with the tower index of each city.
+
+        Returns:
+            tuple: A (fitness, towers_population, towers_satisfaction) tuple as returned by
+                   FitnessCalculator.evaluate_population.
+        """
+        shared = [self.__share_population(key, array) for key, array in (('towers', towers),
+                                                                          ('towers_count', towers_count),
+                                                                          ('assignments', assignments))]
+        chromosomes_count = len(assignments)
+        tasks = [(start, min(start + self.chunk_size, chromosomes_count), *shared)
+                 for start in range(0, chromosomes_count, self.chunk_size)]
+
+        fitness = np.empty(chromosomes_count, dtype=np.float64)
+        towers_population = np.zeros(towers.shape[:2], dtype=np.float64)
+        towers_satisfaction = np.zeros(towers.shape[:2], dtype=np.float64)
+        for (start, end, *_), result in zip(tasks, self.pool.imap(_evaluate_chunk, tasks)):
+            fitness[start:end], towers_population[start:end], towers_satisfaction[start:end] = result
+
+        return fitness, towers_population, towers_satisfaction
+
+    def close(self):
+        """
+        Stops the worker pool and releases the shared memory blocks.
+        """
+        self.pool.close()
+        self.pool.join()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+        self.population_blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __share(self, array):
+        """
+        Copies an array into a new shared memory block.
+
+        Returns:
+            tuple: The (key, name, shape, dtype) description of the shared array, keyed by the block name.
+        """
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        self.blocks.append(block)
+        return block.name, block.name, array.shape, array.dtype.str
+
+    def __share_population(self, key, array):
+        """
+        Copies a population array into shared memory, reusing the previous block of the same key when it is big
+        enough.
+
+        Returns:
+            tuple: The (key, name, shape, dtype) description of the shared array.
+        """
+        array = np.ascontiguousarray(array)
+        block = self.population_blocks.get(key)
+        if block is None or block.size < array.nbytes:
+            if block is not None:
+                self.blocks.remove(block)
+                block.close()
+                block.unlink()
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            self.blocks.append(block)
+            self.population_blocks[key] = block
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return key, block.name, array.shape, array.dtype.str
@@ -0,0 +1,68 @@
+import numpy as np
+
+
+class SpatialGridIndex:
+    """
+    A uniform grid of buckets over a set of 2D locations for fast radius queries.
+
+    Locations are sorted by bucket, so the locations of a run of adjacent buckets in the same bucket row form one
+    contiguous slice. A radius query therefore only touches the buckets overlapping the query square.
+    """
+
+    def __init__(self, locations, cell_size: float):
+        """
+        Builds the index.
+
+        Args:
+            locations (numpy.ndarray): A (locations, 2) array of (x, y) coordinates.
+            cell_size (float): The side length of a bucket, typically the query radius.
+        """
+        self.locations = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+        self.cell_size = float(cell_size)
+        self.origin = self.locations.min(axis=0) if len(self.locations) else np.zeros(2)
+
+        cells = self.__cells_of(self.locations)
+        self.shape = cells.max(axis=0) + 1 if len(cells) else np.ones(2, dtype=np.int64)
+        cell_ids = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(cell_ids, kind='stable')
+        self.cell_starts = np.searchsorted(cell_ids[self.order], np.arange(self.shape[0] * self.shape[1] + 1))
+
+    def query_radius(self, points, radius: float):
+        """
+        Finds all location indices within the given Euclidean radius of each point.
+
+        Args:
+            points (numpy.ndarray): A (points, 2) array of (x, y) query coordinates.
+            radius (float): The query radius.
+
+        Returns:
+            tuple: A (point_indices, location_indices) pair of int arrays listing every point-location pair within
+                   the radius, grouped by point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        low_cells = np.maximum(self.__cells_of(points - radius), 0)
+        high_cells = np.minimum(self.__cells_of(points + radius), self.shape - 1)
+
+        # One segment per point and bucket row: the locations of the buckets [low, high] of that row.
+        rows_count = np.maximum(high_cells[:, 0] - low_cells[:, 0] + 1, 0) * (high_cells[:, 1] >= low_cells[:, 1])
+        segment_points = np.repeat(np.arange(len(points)), rows_count)
+        segment_rows = low_cells[segment_points, 0] + np.arange(len(segment_points)) - \
+            np.repeat(np.cumsum(rows_count) - rows_count, rows_count)
+        segment_starts = self.cell_starts[segment_rows * self.shape[1] + low_cells[segment_points, 1]]
+        segment_ends = self.cell_starts[segment_rows * self.shape[1] + high_cells[segment_points, 1] + 1]
+
+        # Expand the segments into (point, candidate) pairs, keeping the order of the segments.
+        lengths = segment_ends - segment_starts
+        point_indices = np.repeat(segment_points, lengths)
+        positions = np.arange(lengths.sum()) + np.repeat(segment_starts - (np.cumsum(lengths) - lengths), lengths)
+        candidates = self.order[positions]
+
+        diff = self.locations[candidates] - points[point_indices]
+        within = np.einsum('ij,ij->i', diff, diff) <= radius * radius
+        return point_indices[within].astype(np.int64), candidates[within].astype(np.int64)
+
+    def __cells_of(self, locations):
+        """
+        Returns the (row, column) bucket of each location, unclipped.
+        """
+        return np.floor((locations - self.origin) / self.cell_size).astype(np.int64)
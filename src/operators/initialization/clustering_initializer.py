@@ -0,0 +1,197 @@
+import math
+
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+
+
+class ClusteringInitializer:
+    """
+    Seeds chromosomes by clustering the cities with population-weighted k-means.
+
+    Every chromosome gets a random number of towers, placed by k-means++ and refined by Lloyd iterations. The
+    distance is the Mahalanobis distance of the coverage kernel, so the nearest tower of a city is also its
+    best-covering tower, and every city is assigned to it. The bandwidth of a tower is the one at which its cities
+    reach the top satisfaction level at their average coverage, weighted by population squared like the satisfaction.
+
+    All chromosomes are clustered together in (chromosomes, cities, towers) arrays, padded to the largest number of
+    towers, in chunks of chromosomes and, within those, of cities that bound the memory.
+    """
+
+    def __init__(self, towers_max: int = CLUSTERED_TOWERS_MAX, iterations: int = KMEANS_ITERATIONS,
+                 config: ProblemConfig = None, chunk_size: int = 1 << 21):
+        """
+        Initializes the initializer.
+
+        Args:
+            towers_max (int): The largest number of towers of a seeded chromosome. Defaults to the square root of the
+                              number of cities, within the tower limits of the problem.
+            iterations (int): The largest number of Lloyd iterations after the k-means++ placement. The iterations
+                              stop early once no city changes its tower.
+            config (ProblemConfig): The problem to initialize the chromosomes for. Defaults to
+                                    ProblemConfig.default().
+            chunk_size (int): The largest number of (chromosome, city, tower) distances computed at once.
+        """
+        self.config = config or ProblemConfig.default()
+        if towers_max is None:
+            towers_max = round(math.sqrt(self.config.cities_count))
+        self.towers_max = max(self.config.towers_min, min(towers_max, self.config.towers_max))
+        self.iterations = iterations
+        self.chunk_size = chunk_size
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    def initialize(self, chromosome_type, count: int) -> list:
+        """
+        Creates seeded chromosomes.
+
+        Args:
+            chromosome_type (type): The chromosome representation to create, e.g. Chromosome or CompactChromosome.
+            count (int): The number of chromosomes.
+
+        Returns:
+            list: The new chromosomes, with their fitness left unset.
+        """
+        towers_count = np.random.randint(self.config.towers_min, self.towers_max + 1, count)
+        towers, assignments = self.place_towers(towers_count)
+        return [chromosome_type.from_arrays(*MultiPointsCrossoverOperator.compact(chromosome_towers[:tower_count],
+                                                                                  assignment), self.config)
+                for chromosome_towers, tower_count, assignment in zip(towers, towers_count, assignments)]
+
+    def place_towers(self, towers_count):
+        """
+        Places the towers of many chromosomes and assigns every city to its best-covering tower.
+
+        Args:
+            towers_count (numpy.ndarray): The number of towers of each chromosome.
+
+        Returns:
+            tuple: A (chromosomes, max_towers, 3) array of (x, y, bandwidth) rows, where the rows beyond the number
+                   of towers of a chromosome are unused, and a (chromosomes, cities) array with the tower index of
+                   each city. Towers without cities may remain and should be dropped by the caller.
+        """
+        towers_count = np.asarray(towers_count, dtype=np.int64)
+        max_towers = int(towers_count.max(initial=1))
+        towers = np.zeros((len(towers_count), max_towers, 3), dtype=np.float64)
+        assignments = np.empty((len(towers_count), self.config.cities_count), dtype=np.int32)
+
+        # Chromosomes with similar numbers of towers are clustered together, so little of a chunk is padding.
+        order = np.argsort(towers_count, kind='stable')
+        chunk = max(1, self.chunk_size // (self.config.cities_count * max_towers))
+        for start in range(0, len(order), chunk):
+            chromosomes = order[start:start + chunk]
+            chunk_towers = int(towers_count[chromosomes[-1]])
+            towers[chromosomes, :chunk_towers], assignments[chromosomes] = self.__cluster(towers_count[chromosomes],
+                                                                                         chunk_towers)
+        return towers, assignments
+
+    def __cluster(self, towers_count, max_towers):
+        """
+        Places the towers of a chunk of chromosomes by k-means++ and Lloyd iterations.
+        """
+        fitness_calculator = self.fitness_calculator
+        cities_population = fitness_calculator.cities_population_array
+        chromosomes_count, cities_count = len(towers_count), len(cities_population)
+
+        # In whitened coordinates the Mahalanobis distance of the coverage kernel is the Euclidean distance, and the
+        # weighted means of Lloyd's iterations are the same as in the original coordinates.
+        whitening = np.linalg.cholesky(fitness_calculator.sigma_inv).T
+        cities_location = fitness_calculator.cities_location_array @ whitening.T
+        cities_norm = np.einsum('ij,ij->i', cities_location, cities_location)
+        # The distances only choose the nearest tower, so single precision halves their memory traffic.
+        cities_location32, cities_norm32 = cities_location.astype(np.float32), cities_norm.astype(np.float32)
+
+        # k-means++: each further tower is placed on a city drawn with probability population · distance².
+        centers = np.empty((chromosomes_count, max_towers, 2), dtype=np.float64)
+        cumulative_population = np.cumsum(cities_population)
+        first_cities = np.searchsorted(cumulative_population,
+                                       np.random.random(chromosomes_count) * cumulative_population[-1], side='right')
+        centers[:, 0] = cities_location[np.minimum(first_cities, cities_count - 1)]
+        min_distances = self.__distances(cities_location32, cities_norm32, centers[:, :1])[:, :, 0]
+        for tower in range(1, max_towers):
+            cumulative_weights = np.cumsum(cities_population * min_distances, axis=1)
+            thresholds = np.random.random(chromosomes_count) * cumulative_weights[:, -1]
+            cities = np.minimum((cumulative_weights <= thresholds[:, np.newaxis]).sum(axis=1), cities_count - 1)
+            centers[:, tower] = cities_location[cities]
+            min_distances = np.minimum(min_distances, self.__distances(cities_location32, cities_norm32,
+                                                                       centers[:, tower:tower + 1])[:, :, 0])
+
+        unused_towers = (np.arange(max_towers) >= towers_count[:, np.newaxis])[:, np.newaxis, :]
+        cities_block = max(1, self.chunk_size // (chromosomes_count * max_towers))
+        offsets = (np.arange(chromosomes_count) * max_towers)[:, np.newaxis]
+        labels_count = chromosomes_count * max_towers
+        weights = np.tile(cities_population, chromosomes_count)
+        weighted_x = np.tile(cities_population * cities_location[:, 0], chromosomes_count)
+        weighted_y = np.tile(cities_population * cities_location[:, 1], chromosomes_count)
+        flat_centers = centers.reshape(-1, 2)
+        assignments = None
+        for iteration in range(self.iterations + 1):
+            previous_assignments = assignments
+            assignments, assigned_distances = self.__assign(cities_location32, cities_norm32, centers, unused_towers,
+                                                            cities_block)
+            if iteration == self.iterations or np.array_equal(previous_assignments, assignments):
+                break
+
+            labels = (assignments + offsets).ravel()
+            mass = np.bincount(labels, weights=weights, minlength=labels_count)
+            # Towers without population keep their location.
+            occupied = mass > 0
+            flat_centers[occupied, 0] = np.bincount(labels, weights=weighted_x, minlength=labels_count)[occupied] / \
+                mass[occupied]
+            flat_centers[occupied, 1] = np.bincount(labels, weights=weighted_y, minlength=labels_count)[occupied] / \
+                mass[occupied]
+
+        labels = (assignments + offsets).ravel()
+        coverage = np.exp(-0.5 * assigned_distances.ravel())
+        satisfaction_weights = weights * weights
+        towers_population = np.bincount(labels, weights=weights, minlength=labels_count)
+        weights_sum = np.bincount(labels, weights=satisfaction_weights, minlength=labels_count)
+        coverage_sum = np.bincount(labels, weights=satisfaction_weights * coverage, minlength=labels_count)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bandwidths = fitness_calculator.satisfaction_levels_array[-1] * towers_population * weights_sum / \
+                coverage_sum
+        bandwidths = np.clip(np.nan_to_num(bandwidths, nan=self.config.bandwidth_min, posinf=self.config.bandwidth_max),
+                             self.config.bandwidth_min, self.config.bandwidth_max)
+
+        towers = np.empty((chromosomes_count, max_towers, 3), dtype=np.float64)
+        towers[:, :, :2] = np.linalg.solve(whitening, flat_centers.T).T.reshape(chromosomes_count, max_towers, 2)
+        towers[:, :, 2] = bandwidths.reshape(chromosomes_count, max_towers)
+        return towers, assignments.astype(np.int32)
+
+    @classmethod
+    def __assign(cls, cities_location, cities_norm, centers, unused_towers, cities_block):
+        """
+        Returns the nearest used center of every city and its squared distance, as two (chromosomes, cities) arrays.
+
+        The distances are computed for blocks of cities_block cities, so at most chromosomes × cities_block × centers
+        distances are held at once.
+        """
+        chromosomes_count, cities_count = len(centers), len(cities_location)
+        assignments = np.empty((chromosomes_count, cities_count), dtype=np.int64)
+        assigned_distances = np.empty((chromosomes_count, cities_count), dtype=cities_location.dtype)
+        for start in range(0, cities_count, cities_block):
+            stop = start + cities_block
+            distances = cls.__distances(cities_location[start:stop], cities_norm[start:stop], centers)
+            np.copyto(distances, np.inf, where=unused_towers)
+            assignments[:, start:stop] = np.argmin(distances, axis=2)
+            assigned_distances[:, start:stop] = np.take_along_axis(distances, assignments[:, start:stop, np.newaxis],
+                                                                   axis=2)[:, :, 0]
+        return assignments, assigned_distances
+
+    @staticmethod
+    def __distances(cities_location, cities_norm, centers):
+        """
+        Returns the squared distances between every city and every center in whitened coordinates, as a
+        (chromosomes, cities, centers) array.
+        """
+        centers = centers.astype(cities_location.dtype)
+        distances = cities_location @ centers.transpose(0, 2, 1)
+        distances *= -2
+        distances += cities_norm[:, np.newaxis]
+        distances += np.einsum('bkj,bkj->bk', centers, centers)[:, np.newaxis, :]
+        return np.maximum(distances, 0, out=distances)
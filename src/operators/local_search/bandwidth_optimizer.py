@@ -0,0 +1,176 @@
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from operators.fitness.fitness_calculator import FitnessCalculator
+
+
+class BandwidthOptimizer:
+    """
+    Sets the bandwidth of every tower to its best value for the current tower locations and city assignment.
+
+    The satisfaction of a city is a step function of its tower's bandwidth, which reaches the next satisfaction level
+    at bandwidth level · tower population / coverage, and the maintenance cost is linear in the bandwidth. The best
+    bandwidth of a tower is therefore one of these breakpoints, clipped to [bandwidth_min, bandwidth_max].
+
+    The fitness is a ratio of satisfaction to cost, so the towers of a chromosome are optimized together by
+    Dinkelbach's method: for a ratio λ, maximizing satisfaction - λ · cost splits into one choice among the
+    breakpoints per tower, and λ is raised to the resulting fitness until it no longer improves. Many chromosomes are
+    optimized in one batch by numbering their towers consecutively.
+    """
+
+    def __init__(self, max_iterations: int = 20, config: ProblemConfig = None):
+        """
+        Initializes the optimizer.
+
+        Args:
+            max_iterations (int): The largest number of Dinkelbach iterations.
+            config (ProblemConfig): The problem the chromosomes solve. Defaults to ProblemConfig.default().
+        """
+        self.max_iterations = max_iterations
+        self.config = config or ProblemConfig.default()
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    def improve(self, chromosome):
+        """
+        Optimizes the bandwidths of a chromosome.
+
+        Args:
+            chromosome: An evaluated Chromosome or CompactChromosome.
+
+        Returns:
+            tuple: The improved chromosome, a new evaluated object of the same type, or the given chromosome if the
+                   optimized bandwidths do not improve it, and the number of fitness evaluations performed.
+        """
+        improved_chromosomes, evaluations = self.improve_all([chromosome])
+        return improved_chromosomes[0], evaluations
+
+    def improve_all(self, chromosomes: list):
+        """
+        Optimizes the bandwidths of several chromosomes in one batch.
+
+        Args:
+            chromosomes (list): Evaluated Chromosome or CompactChromosome objects.
+
+        Returns:
+            tuple: The list of improved chromosomes, where chromosomes that the optimized bandwidths do not improve are
+                   returned unchanged, and the number of fitness evaluations performed.
+        """
+        if not chromosomes:
+            return [], 0
+
+        encoded_chromosomes = [chromosome.encode() for chromosome in chromosomes]
+        optimized_towers = self.optimize([towers for towers, _ in encoded_chromosomes],
+                                         np.stack([assignment for _, assignment in encoded_chromosomes]),
+                                         np.array([chromosome.fitness for chromosome in chromosomes]))
+
+        fitness_calculator = self.fitness_calculator
+        towers, towers_count, assignments = fitness_calculator.pack(
+            [(towers, assignment) for towers, (_, assignment) in zip(optimized_towers, encoded_chromosomes)])
+        fitness, towers_population, towers_satisfaction = fitness_calculator.evaluate_population(towers, towers_count,
+                                                                                                 assignments)
+
+        improved_chromosomes = []
+        for i, chromosome in enumerate(chromosomes):
+            if fitness[i] > chromosome.fitness:
+                improved_chromosome = type(chromosome).from_arrays(optimized_towers[i], assignments[i],
+                                                                   chromosome.config)
+                improved_chromosome.store_evaluation(float(fitness[i]), towers_population[i, :towers_count[i]],
+                                                     towers_satisfaction[i, :towers_count[i]])
+                chromosome = improved_chromosome
+            improved_chromosomes.append(chromosome)
+        return improved_chromosomes, len(chromosomes)
+
+    def optimize(self, towers_list: list, assignments, fitness):
+        """
+        Optimizes the bandwidths of solutions given as tower arrays and city assignments.
+
+        Args:
+            towers_list (list): The (towers, 3) array of (x, y, bandwidth) rows of each solution.
+            assignments (numpy.ndarray): A (solutions, cities) array with the tower index of each city.
+            fitness (numpy.ndarray): The fitness of each solution.
+
+        Returns:
+            list: A copy of each tower array with the optimized bandwidths.
+        """
+        fitness_calculator = self.fitness_calculator
+        towers_count = np.array([len(towers) for towers in towers_list])
+        tower_offsets = np.concatenate(([0], np.cumsum(towers_count)))
+        towers = np.concatenate(towers_list)
+        tower_solutions = np.repeat(np.arange(len(towers_list)), towers_count)
+        all_towers = np.arange(len(towers))
+
+        pair_towers, pair_bandwidths, pair_gains = self.breakpoints(towers, (assignments +
+                                                                             tower_offsets[:-1, np.newaxis]).ravel())
+
+        # Every tower can also keep the minimum bandwidth and whatever it satisfies there.
+        pair_towers = np.concatenate((all_towers, pair_towers))
+        pair_bandwidths = np.concatenate((np.full(len(towers), float(self.config.bandwidth_min)), pair_bandwidths))
+        pair_gains = np.concatenate((np.zeros(len(towers)), pair_gains))
+
+        # The satisfaction of a tower at each of its breakpoints is the cumulative gain up to that breakpoint.
+        order = np.lexsort((pair_bandwidths, pair_towers))
+        pair_towers, pair_bandwidths = pair_towers[order], pair_bandwidths[order]
+        cumulative_gains = np.concatenate(([0.0], np.cumsum(pair_gains[order])))
+        tower_starts = np.searchsorted(pair_towers, all_towers)
+        pair_satisfaction = cumulative_gains[1:] - cumulative_gains[tower_starts][pair_towers]
+
+        maintenance_cost = fitness_calculator.tower_maintenance_cost
+        construction_cost = fitness_calculator.tower_construction_cost * towers_count
+        ratios = np.array(fitness, dtype=np.float64)
+        bandwidths = towers[:, 2].copy()
+        for _ in range(self.max_iterations):
+            values = pair_satisfaction - (ratios[tower_solutions] * maintenance_cost)[pair_towers] * pair_bandwidths
+            best = np.lexsort((-values, pair_towers))
+            best = best[np.searchsorted(pair_towers[best], all_towers)]
+
+            new_ratios = np.bincount(tower_solutions, weights=pair_satisfaction[best], minlength=len(towers_list)) / (
+                construction_cost + maintenance_cost * np.bincount(tower_solutions, weights=pair_bandwidths[best],
+                                                                   minlength=len(towers_list)))
+            improved = new_ratios > ratios
+            if not improved.any():
+                break
+            ratios[improved] = new_ratios[improved]
+            improved_towers = improved[tower_solutions]
+            bandwidths[improved_towers] = pair_bandwidths[best][improved_towers]
+
+        optimized_towers = towers.copy()
+        optimized_towers[:, 2] = bandwidths
+        return np.split(optimized_towers, tower_offsets[1:-1])
+
+    def breakpoints(self, towers, assignment):
+        """
+        Enumerates the bandwidths at which a city reaches a satisfaction level, for all cities and levels at once.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city. Assignments of several solutions may be
+                                        concatenated, with their tower indices offset into towers.
+
+        Returns:
+            tuple: The tower, the bandwidth and the satisfaction gain of every breakpoint within
+                   [bandwidth_min, bandwidth_max]. Breakpoints below bandwidth_min are moved to bandwidth_min.
+        """
+        fitness_calculator = self.fitness_calculator
+        solutions_count = len(assignment) // len(fitness_calculator.cities_population_array)
+        cities_population = np.tile(fitness_calculator.cities_population_array, solutions_count)
+        cities_location = np.tile(fitness_calculator.cities_location_array, (solutions_count, 1))
+        towers_population = np.bincount(assignment, weights=cities_population, minlength=len(towers))
+        coverage = fitness_calculator.calc_coverages(towers[assignment, :2], cities_location)
+
+        # The satisfaction subtotal of a tower weighs the score of each city by its population twice.
+        levels = fitness_calculator.satisfaction_levels_array
+        score_gains = np.diff(fitness_calculator.satisfaction_scores_array)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bandwidths = np.outer(towers_population[assignment] / coverage, levels)
+        # Just above the breakpoint, so the bandwidth of the fitness formula rounds to the satisfaction level.
+        bandwidths = bandwidths * (1 + 8 * np.finfo(np.float64).eps)
+        gains = np.outer(cities_population * cities_population, score_gains)
+
+        reachable = (bandwidths <= self.config.bandwidth_max) & (gains != 0)
+        cities, level_indices = np.nonzero(reachable)
+        return (assignment[cities], np.maximum(bandwidths[cities, level_indices], self.config.bandwidth_min),
+                gains[cities, level_indices])
@@ -0,0 +1,144 @@
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+
+
+class GreedyReassignmentOperator:
+    """
+    A local search that moves cities to the tower giving the biggest gain in user satisfaction.
+
+    A sweep scores every candidate tower of every city at once from the per-tower population sums and the coverage
+    of the towers, as if the city alone moved. The proposed moves are then applied together and kept only if a full
+    evaluation confirms that the fitness improved; otherwise the better half of the moves is tried, and so on. Towers
+    left without cities are dropped, which also saves their cost.
+    """
+
+    def __init__(self, max_sweeps: int = LOCAL_SEARCH_SWEEPS, config: ProblemConfig = None):
+        """
+        Initializes the operator.
+
+        Args:
+            max_sweeps (int): The largest number of improving sweeps per chromosome.
+            config (ProblemConfig): The problem the chromosomes solve. Defaults to ProblemConfig.default().
+        """
+        self.max_sweeps = max_sweeps
+        self.config = config or ProblemConfig.default()
+
+    @property
+    def fitness_calculator(self) -> FitnessCalculator:
+        return FitnessCalculator.shared(self.config)
+
+    def improve(self, chromosome):
+        """
+        Improves the assignment of a chromosome.
+
+        Args:
+            chromosome: An evaluated Chromosome or CompactChromosome.
+
+        Returns:
+            tuple: The improved chromosome, a new evaluated object of the same type, or the given chromosome if no
+                   move improved it, and the number of fitness evaluations performed.
+        """
+        towers, assignment = chromosome.encode()
+        towers, assignment, fitness, towers_population, towers_satisfaction, evaluations = self.improve_arrays(
+            towers, assignment)
+        if fitness <= chromosome.fitness:
+            return chromosome, evaluations
+
+        improved_chromosome = type(chromosome).from_arrays(towers, assignment, chromosome.config)
+        improved_chromosome.store_evaluation(fitness, towers_population, towers_satisfaction)
+        return improved_chromosome, evaluations
+
+    def improve_arrays(self, towers, assignment):
+        """
+        Improves a solution given as (towers, assignment) arrays.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+
+        Returns:
+            tuple: The improved towers and assignment, their fitness, the population and the satisfaction subtotal of
+                   every tower, and the number of fitness evaluations performed.
+        """
+        fitness_calculator = self.fitness_calculator
+        towers_population, towers_satisfaction = fitness_calculator.calc_towers_satisfaction(towers, assignment)
+        fitness = fitness_calculator.calc_fitness_from_towers_satisfaction(towers, towers_satisfaction)
+        evaluations = 1
+
+        for _ in range(self.max_sweeps):
+            cities, targets = self.best_moves(towers, assignment, towers_population)
+            moves_count = len(cities)
+            improved = False
+
+            while moves_count > 0:
+                candidate_assignment = assignment.copy()
+                candidate_assignment[cities[:moves_count]] = targets[:moves_count]
+                candidate_towers, candidate_assignment = MultiPointsCrossoverOperator.compact(towers,
+                                                                                              candidate_assignment)
+                candidate_population, candidate_satisfaction = fitness_calculator.calc_towers_satisfaction(
+                    candidate_towers, candidate_assignment)
+                candidate_fitness = fitness_calculator.calc_fitness_from_towers_satisfaction(candidate_towers,
+                                                                                            candidate_satisfaction)
+                evaluations += 1
+
+                if candidate_fitness > fitness:
+                    towers, assignment, fitness = candidate_towers, candidate_assignment, candidate_fitness
+                    towers_population, towers_satisfaction = candidate_population, candidate_satisfaction
+                    improved = True
+                    break
+                moves_count //= 2
+
+            if not improved:
+                break
+
+        return towers, assignment, fitness, towers_population, towers_satisfaction, evaluations
+
+    def best_moves(self, towers, assignment, towers_population):
+        """
+        Finds the best other tower of every city whose satisfaction would improve by moving there alone.
+
+        With a coverage tolerance only the towers covering a city are candidates, found through the sparse coverage;
+        otherwise every tower is a candidate.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+            towers_population (numpy.ndarray): The population associated with each tower.
+
+        Returns:
+            tuple: The cities to move and their target towers, ordered by decreasing satisfaction gain.
+        """
+        fitness_calculator = self.fitness_calculator
+        cities_population = fitness_calculator.cities_population_array
+        if fitness_calculator.coverage_tolerance is not None:
+            tower_indices, city_indices, coverage = fitness_calculator.calc_sparse_coverage(towers[:, :2])
+        else:
+            cities_count = len(assignment)
+            tower_indices = np.repeat(np.arange(len(towers)), cities_count)
+            city_indices = np.tile(np.arange(cities_count), len(towers))
+            coverage = fitness_calculator.calc_coverage_matrix(towers[:, :2]).ravel()
+
+        # Same formula as the fitness, with the city's population added to every tower it is not assigned to yet.
+        current = assignment[city_indices] == tower_indices
+        pairs_population = cities_population[city_indices]
+        associated_cities_population = towers_population[tower_indices] + np.where(current, 0.0, pairs_population)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pairs_bandwidth = coverage * (pairs_population / associated_cities_population * towers[tower_indices, 2])
+        pairs_satisfaction = fitness_calculator.calc_city_satisfaction_scores(pairs_bandwidth,
+                                                                             pairs_population) * pairs_population
+
+        cities_satisfaction = np.zeros(len(assignment), dtype=np.float64)
+        cities_satisfaction[city_indices[current]] = pairs_satisfaction[current]
+        gains = pairs_satisfaction - cities_satisfaction[city_indices]
+
+        candidates = np.flatnonzero(~current & (gains > 0))
+        order = candidates[np.lexsort((-gains[candidates], city_indices[candidates]))]
+        first_of_city = np.ones(len(order), dtype=bool)
+        first_of_city[1:] = city_indices[order[1:]] != city_indices[order[:-1]]
+        best = order[first_of_city]
+        best = best[np.argsort(-gains[best], kind='stable')]
+        return city_indices[best], tower_indices[best].astype(assignment.dtype)
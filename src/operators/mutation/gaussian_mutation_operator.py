@@ -1,22 +1,31 @@
 import random
+import weakref
+
+import numpy as np
 
 from common.config import *
+from common.problem_config import ProblemConfig
 
 
 class GaussianMutationOperator:
     """
     A mutation operator that applies Gaussian mutation to a list of genes.
     """
+    shared_instances = weakref.WeakKeyDictionary()
+
     def __init__(self,
-                 location_min_x: float = LOCATION_MIN_X,
-                 location_min_y: float = LOCATION_MIN_Y,
-                 location_max_x: float = LOCATION_MAX_X,
-                 location_max_y: float = LOCATION_MAX_Y,
-                 bandwidth_min: float = BANDWIDTH_MIN,
-                 bandwidth_max: float = BANDWIDTH_MAX):
+                 location_min_x: float = None,
+                 location_min_y: float = None,
+                 location_max_x: float = None,
+                 location_max_y: float = None,
+                 bandwidth_min: float = None,
+                 bandwidth_max: float = None,
+                 config: ProblemConfig = None):
         """
         Initializes the GaussianMutationOperator with config values.
 
+        Bounds left as None are taken from config, which defaults to ProblemConfig.default().
+
         Args:
             location_min_x (float): Minimum value for x-axis location.
             location_min_y (float): Minimum value for y-axis location.
@@ -24,13 +33,33 @@ class GaussianMutationOperator:
             location_max_y (float): Maximum value for y-axis location.
             bandwidth_min (float): Minimum value for bandwidth.
             bandwidth_max (float): Maximum value for bandwidth.
+            config (ProblemConfig): The problem configuration providing the default bounds.
+        """
+        bounds = (location_min_x, location_min_y, location_max_x, location_max_y, bandwidth_min, bandwidth_max)
+        if any(bound is None for bound in bounds):
+            config = config or ProblemConfig.default()
+            default_bounds = (config.location_min_x, config.location_min_y, config.location_max_x,
+                              config.location_max_y, config.bandwidth_min, config.bandwidth_max)
+            bounds = tuple(default if bound is None else bound for bound, default in zip(bounds, default_bounds))
+
+        (self.location_min_x, self.location_min_y, self.location_max_x, self.location_max_y,
+         self.bandwidth_min, self.bandwidth_max) = bounds
+
+    @staticmethod
+    def shared(config: ProblemConfig = None) -> 'GaussianMutationOperator':
         """
-        self.location_min_x = location_min_x
-        self.location_min_y = location_min_y
-        self.location_max_x = location_max_x
-        self.location_max_y = location_max_y
-        self.bandwidth_min = bandwidth_min
-        self.bandwidth_max = bandwidth_max
+        Returns the mutation operator shared by everything working on the given problem configuration.
+
+        Args:
+            config (ProblemConfig): The problem configuration. Defaults to ProblemConfig.default().
+
+        Returns:
+            GaussianMutationOperator: The shared mutation operator of the configuration.
+        """
+        config = config or ProblemConfig.default()
+        if config not in GaussianMutationOperator.shared_instances:
+            GaussianMutationOperator.shared_instances[config] = GaussianMutationOperator(config=config)
+        return GaussianMutationOperator.shared_instances[config]
 
     def mutate(self, genes: list,
                mutation_rate: float = MUTATION_RATE,
@@ -59,3 +88,39 @@ class GaussianMutationOperator:
 
                 gene.bandwidth = max(self.bandwidth_min,
                                      min(self.bandwidth_max, gene.bandwidth + bandwidth_mutation))
+
+    def mutate_towers(self, towers,
+                      mutation_rate: float = MUTATION_RATE,
+                      location_mutation_std: float = LOCATION_MUTATION_STD,
+                      bandwidth_mutation_std: float = BANDWIDTH_MUTATION_STD,
+                      random_generator=None):
+        """
+        Mutates a tower array in place by adding Gaussian-distributed random values to the selected towers.
+
+        Unlike mutate, every tower is drawn once, so a tower shared by many cities is mutated at most once. The towers
+        of a whole population can be mutated at once by stacking them into one array.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows to be mutated.
+            mutation_rate (float): Probability of mutation for each tower.
+            location_mutation_std (float): Standard deviation of the Gaussian distribution for location mutation.
+            bandwidth_mutation_std (float): Standard deviation of the Gaussian distribution for bandwidth mutation.
+            random_generator (numpy.random.Generator): The generator of the mutation masks and noise. Defaults to
+                                                       numpy.random.
+
+        Returns:
+            numpy.ndarray: The indices of the mutated towers.
+        """
+        random_generator = random_generator or np.random
+        mutated = np.flatnonzero(random_generator.random(len(towers)) < mutation_rate)
+        if len(mutated) == 0:
+            return mutated
+
+        location_mutation = random_generator.normal(0, location_mutation_std, len(mutated))
+        bandwidth_mutation = random_generator.normal(0, bandwidth_mutation_std, len(mutated))
+
+        towers[mutated, 0] = np.clip(towers[mutated, 0] + location_mutation, self.location_min_x, self.location_max_x)
+        towers[mutated, 1] = np.clip(towers[mutated, 1] + location_mutation, self.location_min_y, self.location_max_y)
+        towers[mutated, 2] = np.clip(towers[mutated, 2] + bandwidth_mutation, self.bandwidth_min, self.bandwidth_max)
+
+        return mutated
@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 from common.config import MUTATION_RATE
 
 
@@ -23,3 +25,58 @@ class SwapMutationOperator:
             if random.random() < mutation_rate:
                 j = random.randint(0, len(genes) - 1)
                 genes[i], genes[j] = genes[j], genes[i]
+
+    def mutate_assignment(self, assignment, mutation_rate: float = MUTATION_RATE):
+        """
+        Mutates a city assignment array in place by swapping elements with a probability equal to the mutation_rate.
+
+        Args:
+        - assignment: an int array with the tower index of each city
+        - mutation_rate: a float representing the probability that a swap occurs between two elements of the array
+
+        Returns:
+        - numpy.ndarray: The indices of the cities whose tower may have changed.
+        """
+        swapped = np.flatnonzero(np.random.random(len(assignment)) < mutation_rate)
+        partners = np.random.randint(0, len(assignment), len(swapped))
+        for i, j in zip(swapped, partners):
+            assignment[i], assignment[j] = assignment[j], assignment[i]
+        return np.union1d(swapped, partners)
+
+    @staticmethod
+    def shuffle_positions(shape, mutation_rate: float = MUTATION_RATE, random_generator=None):
+        """
+        Draws a batched shuffle mutation for several chromosomes at once.
+
+        Every city is selected with a probability equal to the mutation_rate, and the selected cities of each
+        chromosome are randomly permuted among themselves. Like a sequence of swaps, this keeps the number of cities of
+        every tower, but it is drawn for the whole population in a single pass.
+
+        Args:
+        - shape: the (chromosomes, cities) shape of the population's assignments
+        - mutation_rate: a float representing the probability that a city is selected
+        - random_generator: the numpy.random.Generator drawing the selection. Defaults to numpy.random.
+
+        Returns:
+        - tuple: The chromosome and the city of each selected position, and the city whose tower it receives.
+        """
+        random_generator = random_generator or np.random
+        rows, cities = np.nonzero(random_generator.random(shape) < mutation_rate)
+        order = np.lexsort((random_generator.random(len(rows)), rows))
+        return rows, cities, cities[order]
+
+    def mutate_assignments(self, assignments, mutation_rate: float = MUTATION_RATE, random_generator=None):
+        """
+        Mutates the stacked assignments of a population in place with a batched shuffle mutation.
+
+        Args:
+        - assignments: a (chromosomes, cities) int array with the tower index of each city of each chromosome
+        - mutation_rate: a float representing the probability that a city is selected
+        - random_generator: the numpy.random.Generator drawing the selection. Defaults to numpy.random.
+
+        Returns:
+        - tuple: The chromosome and the city of each position whose tower may have changed.
+        """
+        rows, cities, source_cities = self.shuffle_positions(assignments.shape, mutation_rate, random_generator)
+        assignments[rows, cities] = assignments[rows, source_cities]
+        return rows, cities
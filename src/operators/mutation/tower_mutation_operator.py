@@ -0,0 +1,114 @@
+import weakref
+
+import numpy as np
+
+from common.config import *
+from common.problem_config import ProblemConfig
+from operators.mutation.gaussian_mutation_operator import GaussianMutationOperator
+
+
+class TowerMutationOperator:
+    """
+    A mutation operator for genomes made of towers only: it moves towers, removes towers and adds towers.
+
+    Moves are the Gaussian mutation of the tower locations and bandwidths. With the mutation rate, a chromosome also
+    loses one random tower, as long as it keeps towers_min towers, and gains a tower on a city drawn in proportion to
+    its population, with a uniform random bandwidth, as long as it stays within towers_max towers.
+    """
+
+    shared_instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, config: ProblemConfig = None):
+        """
+        Initializes the operator.
+
+        Args:
+            config (ProblemConfig): The problem the towers are placed in. Defaults to ProblemConfig.default().
+        """
+        self.config = config or ProblemConfig.default()
+        self.cumulative_population = np.cumsum(np.asarray(self.config.cities_population, dtype=np.float64))
+        self.cities_location = np.asarray(self.config.cities_location, dtype=np.float64)
+
+    @staticmethod
+    def shared(config: ProblemConfig = None) -> 'TowerMutationOperator':
+        """
+        Returns the mutation operator shared by everything working on the given problem configuration.
+
+        Args:
+            config (ProblemConfig): The problem configuration. Defaults to ProblemConfig.default().
+
+        Returns:
+            TowerMutationOperator: The shared mutation operator of the configuration.
+        """
+        config = config or ProblemConfig.default()
+        if config not in TowerMutationOperator.shared_instances:
+            TowerMutationOperator.shared_instances[config] = TowerMutationOperator(config=config)
+        return TowerMutationOperator.shared_instances[config]
+
+    def mutate(self, towers, mutation_rate: float = MUTATION_RATE, random_generator=None):
+        """
+        Mutates a tower array.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows. It is not modified.
+            mutation_rate (float): The probability of moving each tower and of removing and adding a tower.
+            random_generator (numpy.random.Generator): The generator of the mutations. Defaults to numpy.random.
+
+        Returns:
+            numpy.ndarray: The mutated tower array.
+        """
+        return self.mutate_population([towers], mutation_rate, random_generator)[0]
+
+    def mutate_population(self, towers_list: list, mutation_rate: float, random_generator=None) -> list:
+        """
+        Mutates the tower arrays of a whole population in one batch.
+
+        Args:
+            towers_list (list): The (towers, 3) array of each chromosome. The arrays are not modified.
+            mutation_rate (float): The probability of moving each tower and of removing and adding a tower.
+            random_generator (numpy.random.Generator): The generator of the mutations. Defaults to numpy.random.
+
+        Returns:
+            list: The mutated tower array of each chromosome.
+        """
+        random_generator = random_generator or np.random
+        if not towers_list:
+            return []
+
+        towers_count = np.array([len(towers) for towers in towers_list])
+        offsets = np.concatenate(([0], np.cumsum(towers_count)))
+        towers = np.concatenate(towers_list)
+        GaussianMutationOperator.shared(self.config).mutate_towers(towers, mutation_rate,
+                                                                   random_generator=random_generator)
+
+        removed = (random_generator.random(len(towers_list)) < mutation_rate) & (towers_count > self.config.towers_min)
+        removed_towers = offsets[:-1] + (random_generator.random(len(towers_list)) * towers_count).astype(np.int64)
+        added = (random_generator.random(len(towers_list)) < mutation_rate) & \
+            (towers_count - removed < self.config.towers_max)
+        added_towers = self.random_towers(int(added.sum()), random_generator)
+
+        kept = np.ones(len(towers), dtype=bool)
+        kept[removed_towers[removed]] = False
+        added_offsets = np.concatenate(([0], np.cumsum(added)))
+        return [np.concatenate((towers[offsets[i]:offsets[i + 1]][kept[offsets[i]:offsets[i + 1]]],
+                                added_towers[added_offsets[i]:added_offsets[i + 1]]))
+                for i in range(len(towers_list))]
+
+    def random_towers(self, count: int, random_generator=None):
+        """
+        Draws new towers on cities chosen in proportion to their population, with uniform random bandwidths.
+
+        Args:
+            count (int): The number of towers.
+            random_generator (numpy.random.Generator): The generator of the towers. Defaults to numpy.random.
+
+        Returns:
+            numpy.ndarray: A (count, 3) array of (x, y, bandwidth) rows.
+        """
+        random_generator = random_generator or np.random
+        cities = np.searchsorted(self.cumulative_population,
+                                 random_generator.random(count) * self.cumulative_population[-1], side='right')
+        towers = np.empty((count, 3), dtype=np.float64)
+        towers[:, :2] = self.cities_location[np.minimum(cities, len(self.cities_location) - 1)]
+        towers[:, 2] = random_generator.uniform(self.config.bandwidth_min, self.config.bandwidth_max, count)
+        return towers
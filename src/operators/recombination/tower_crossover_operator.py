@@ -0,0 +1,84 @@
+import weakref
+
+import numpy as np
+
+from common.problem_config import ProblemConfig
+
+
+class TowerCrossoverOperator:
+    """
+    A geometric crossover for genomes made of towers only.
+
+    A random line cuts the plane in two; each offspring takes the towers of one parent on one side of the line and
+    the towers of the other parent on the other side. Towers close to each other thus stay together, unlike a
+    crossover by position in the tower arrays, whose order carries no meaning. An offspring with more than towers_max
+    towers loses random towers until it is within the bound, as the TowerMutationOperator never adds beyond it.
+    """
+
+    shared_instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, config: ProblemConfig = None):
+        """
+        Initializes the operator.
+
+        Args:
+            config (ProblemConfig): The problem the towers are placed in. Defaults to ProblemConfig.default().
+        """
+        self.config = config or ProblemConfig.default()
+
+    @staticmethod
+    def shared(config: ProblemConfig = None) -> 'TowerCrossoverOperator':
+        """
+        Returns the crossover operator shared by everything working on the given problem configuration.
+
+        Args:
+            config (ProblemConfig): The problem configuration. Defaults to ProblemConfig.default().
+
+        Returns:
+            TowerCrossoverOperator: The shared crossover operator of the configuration.
+        """
+        config = config or ProblemConfig.default()
+        if config not in TowerCrossoverOperator.shared_instances:
+            TowerCrossoverOperator.shared_instances[config] = TowerCrossoverOperator(config=config)
+        return TowerCrossoverOperator.shared_instances[config]
+
+    def crossover(self, towers1, towers2, crossover_rate: float = 1.0, random_generator=None):
+        """
+        Crosses two tower arrays.
+
+        Args:
+            towers1 (numpy.ndarray): The (towers, 3) array of (x, y, bandwidth) rows of the first parent.
+            towers2 (numpy.ndarray): The (towers, 3) array of the second parent.
+            crossover_rate (float): The probability of performing crossover.
+            random_generator (numpy.random.Generator): The generator of the cut. Defaults to numpy.random.
+
+        Returns:
+            tuple: The tower arrays of the two offspring, or None if no crossover was performed. An offspring that
+                   would have no tower is replaced by a copy of its first parent, and one with more than towers_max
+                   towers keeps a random subset of towers_max towers.
+        """
+        random_generator = random_generator or np.random
+        if random_generator.random() > crossover_rate:
+            return None
+
+        # The cut passes through a random point of the box spanned by both parents, so both sides usually get towers.
+        locations = np.concatenate((towers1[:, :2], towers2[:, :2]))
+        point = random_generator.uniform(locations.min(axis=0), locations.max(axis=0))
+        angle = random_generator.uniform(0, np.pi)
+        normal = np.array([np.cos(angle), np.sin(angle)])
+        side1 = (towers1[:, :2] - point) @ normal > 0
+        side2 = (towers2[:, :2] - point) @ normal > 0
+
+        offspring1 = np.concatenate((towers1[side1], towers2[~side2]))
+        offspring2 = np.concatenate((towers2[side2], towers1[~side1]))
+        return (self.__limit_towers(offspring1, random_generator) if len(offspring1) > 0 else towers1.copy(),
+                self.__limit_towers(offspring2, random_generator) if len(offspring2) > 0 else towers2.copy())
+
+    def __limit_towers(self, towers, random_generator):
+        """
+        Drops random towers beyond towers_max, keeping the order of the remaining ones.
+        """
+        if len(towers) <= self.config.towers_max:
+            return towers
+        kept = np.sort(random_generator.permutation(len(towers))[:self.config.towers_max])
+        return towers[kept]
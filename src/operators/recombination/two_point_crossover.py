@@ -1,14 +1,37 @@
 import random
 
+import numpy as np
+
+from common.config import CROSSOVER_METHOD, CROSSOVER_POINTS
 from core.gene import Gene
 
+CROSSOVER_METHODS = ('multi_point', 'k_point', 'uniform')
+
 
 class MultiPointsCrossoverOperator:
 
+    def __init__(self, method: str = CROSSOVER_METHOD, points: int = CROSSOVER_POINTS):
+        """
+        Initializes the operator.
+
+        Args:
+            method (str): How the arrays of two parents are mixed. 'multi_point' exchanges the cities at a random
+                          number of random positions, 'k_point' exchanges every other segment between random cut
+                          points and 'uniform' exchanges every city with probability 0.5.
+            points (int): The number of cut points of the 'k_point' method.
+        """
+        if method not in CROSSOVER_METHODS:
+            raise ValueError(f"Unknown crossover method '{method}', expected one of {CROSSOVER_METHODS}")
+
+        self.method = method
+        self.points = points
+
     def crossover(self, parent1: list['Gene'], parent2: list['Gene'], crossover_rate, num_points=None):
         """
         Performs multipoint crossover between two parent chromosomes.
 
+        The crossover points are kept in a set, so building the children is linear in the number of genes.
+
         Args:
             parent1 (list): The first parent chromosome.
             parent2 (list): The second parent chromosome.
@@ -24,30 +47,159 @@ class MultiPointsCrossoverOperator:
         if num_points is None:
             num_points = random.randint(1, len(parent1))
 
-        crossover_points = sorted(random.sample(range(len(parent1)), num_points))
-
-        child1 = []
-        child2 = []
+        crossover_points = set(random.sample(range(len(parent1)), num_points))
 
-        for i in range(len(parent1)):
-            if i not in crossover_points:
-                child1.append(parent1[i])
-                child2.append(parent2[i])
-            else:
-                child1.append(parent2[i])
-                child2.append(parent1[i])
+        child1 = [gene2 if i in crossover_points else gene1 for i, (gene1, gene2) in enumerate(zip(parent1, parent2))]
+        child2 = [gene1 if i in crossover_points else gene2 for i, (gene1, gene2) in enumerate(zip(parent1, parent2))]
 
         return self.copy(child1), self.copy(child2)
 
     @staticmethod
     def copy(child):
-        child_copy = [None] * len(child)
-        child_indices = {}
-        for i, ch in enumerate(child):
-            if ch not in child_indices.keys():
-                new_tower = ch.copy()
-                child_copy[i] = new_tower
-                child_indices[ch] = new_tower
-            else:
-                child_copy[i] = child_indices[ch]
-        return child_copy
+        """
+        Copies a list of genes, keeping the cities that share a Gene object sharing its copy.
+        """
+        copies = {}
+        for gene in child:
+            if gene not in copies:
+                copies[gene] = gene.copy()
+        return [copies[gene] for gene in child]
+
+    def crossover_masks(self, pairs: int, cities_count: int, num_points=None):
+        """
+        Draws the crossover masks of several pairs at once.
+
+        Args:
+            pairs (int): The number of masks to draw.
+            cities_count (int): The number of cities of each parent.
+            num_points (int): The number of exchanged positions of the 'multi_point' method. Defaults to a random
+                              number per pair.
+
+        Returns:
+            numpy.ndarray: A (pairs, cities) boolean array, True where the children exchange their parents' cities.
+        """
+        if self.method == 'uniform':
+            return np.random.random((pairs, cities_count)) < 0.5
+
+        # The positions with the smallest random keys form a uniformly random subset of each row.
+        if self.method == 'k_point':
+            points = min(self.points, cities_count - 1)
+            if points < 1:
+                # A single city has no position to cut at, so nothing is exchanged.
+                return np.zeros((pairs, cities_count), dtype=bool)
+            keys = np.random.random((pairs, cities_count - 1))
+            thresholds = np.partition(keys, points - 1, axis=1)[:, points - 1:points]
+            cuts = np.zeros((pairs, cities_count), dtype=np.int32)
+            cuts[:, 1:] = keys <= thresholds
+            return (np.cumsum(cuts, axis=1) & 1).astype(bool)
+
+        if num_points is None:
+            num_points = np.random.randint(1, cities_count + 1, pairs)
+        keys = np.random.random((pairs, cities_count))
+        thresholds = np.take_along_axis(np.sort(keys, axis=1), np.reshape(num_points, (-1, 1)) - 1, axis=1)
+        return keys <= thresholds
+
+    def crossover_arrays(self, parent1, parent2, crossover_rate, num_points=None):
+        """
+        Performs crossover between two parents given as (towers, assignment) arrays.
+
+        The crossover mask is drawn in one shot, so both children are built with a single np.where. The towers of both
+        parents are stacked and the towers no longer referenced by a child are dropped.
+
+        Args:
+            parent1 (tuple): The (towers, assignment) arrays of the first parent.
+            parent2 (tuple): The (towers, assignment) arrays of the second parent.
+            crossover_rate (float): The probability of performing crossover.
+            num_points (int): The number of crossover points to be selected.
+
+        Returns:
+            tuple: A tuple containing the (towers, assignment) arrays of the two children.
+        """
+        (towers1, assignment1), (towers2, assignment2) = parent1, parent2
+
+        if np.random.random() > crossover_rate:
+            return (towers1.copy(), assignment1.copy()), (towers2.copy(), assignment2.copy())
+
+        mask = self.crossover_masks(1, len(assignment1), num_points)[0]
+
+        towers = np.concatenate((towers1, towers2))
+        shifted_assignment2 = assignment2 + len(towers1)
+        child1 = self.compact(towers, np.where(mask, shifted_assignment2, assignment1))
+        child2 = self.compact(towers, np.where(mask, assignment1, shifted_assignment2))
+
+        return child1, child2
+
+    def crossover_batch(self, parents1: list, parents2: list, crossover_rate):
+        """
+        Crosses all pairs of parents of a generation in one batch.
+
+        The crossover decisions and masks of all pairs are drawn at once, the children assignments are built with one
+        np.where over a (pairs, cities) array and the unused towers of all children are dropped together.
+
+        Args:
+            parents1 (list): The (towers, assignment) arrays of the first parent of each pair.
+            parents2 (list): The (towers, assignment) arrays of the second parent of each pair.
+            crossover_rate (float): The probability of performing crossover on each pair.
+
+        Returns:
+            list: For each pair, the (towers, assignment) arrays of its two children, or None if the pair was not
+                  crossed and its children are copies of the parents.
+        """
+        crossed = np.flatnonzero(np.random.random(len(parents1)) <= crossover_rate)
+        children = [None] * len(parents1)
+        if len(crossed) == 0:
+            return children
+
+        towers1 = [parents1[i][0] for i in crossed]
+        towers2 = [parents2[i][0] for i in crossed]
+        towers_count1 = np.array([len(towers) for towers in towers1])
+        assignments1 = np.stack([parents1[i][1] for i in crossed])
+        shifted_assignments2 = np.stack([parents2[i][1] for i in crossed]) + towers_count1[:, np.newaxis]
+
+        towers_count = towers_count1 + np.array([len(towers) for towers in towers2])
+
+        masks = self.crossover_masks(len(crossed), assignments1.shape[1])
+        used, assignments = self.__compact_batch(
+            np.concatenate((np.where(masks, shifted_assignments2, assignments1),
+                            np.where(masks, assignments1, shifted_assignments2))), int(towers_count.max()))
+
+        for row, i in enumerate(crossed):
+            towers = np.concatenate((towers1[row], towers2[row]))
+            children[i] = tuple((towers[used[child][:len(towers)]], assignments[child])
+                                for child in (row, row + len(crossed)))
+        return children
+
+    @staticmethod
+    def __compact_batch(assignments, towers_count):
+        """
+        Renumbers the referenced towers of each row of assignments, as compact does for a single assignment.
+
+        Args:
+            assignments (numpy.ndarray): A (rows, cities) array with the tower index of each city.
+            towers_count (int): The largest number of stacked towers of a row, so that every row of the returned
+                                mask covers its towers even when its last towers have no cities.
+
+        Returns:
+            tuple: A (rows, towers) boolean array of the referenced towers and the compacted assignments.
+        """
+        rows, width = len(assignments), max(int(assignments.max()) + 1, towers_count)
+        flat_indices = assignments + (np.arange(rows) * width)[:, np.newaxis]
+        used = np.bincount(flat_indices.ravel(), minlength=rows * width).reshape(rows, width) > 0
+        new_indices = (np.cumsum(used, axis=1) - 1).astype(np.int32)
+        return used, np.take_along_axis(new_indices, assignments, axis=1)
+
+    @staticmethod
+    def compact(towers, assignment):
+        """
+        Drops the towers not referenced by the assignment and renumbers the remaining ones.
+
+        Args:
+            towers (numpy.ndarray): A (towers, 3) array of (x, y, bandwidth) rows.
+            assignment (numpy.ndarray): The tower index of each city.
+
+        Returns:
+            tuple: The compacted (towers, assignment) arrays.
+        """
+        used = np.bincount(assignment, minlength=len(towers)) > 0
+        new_indices = (np.cumsum(used) - 1).astype(np.int32)
+        return towers[used], new_indices[assignment]
@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 
 class FitnessProportionateOperator:
@@ -10,6 +10,9 @@ class FitnessProportionateOperator:
         """
         Selects parents from a list of chromosomes based on their fitness using the fitness proportionate selection algorithm.
 
+        The cumulative fitness is computed once and all parents are drawn in a single batch, so a selection costs
+        O(N + num_parents log N) instead of rebuilding the cumulative weights for every parent.
+
         Args:
             chromosomes (list): List of Chromosome objects to select parents from.
             num_parents (int): The number of parents to select.
@@ -17,13 +20,13 @@ class FitnessProportionateOperator:
         Returns:
             list: List of selected parents.
         """
-        total_fitness = sum([chromosome.fitness for chromosome in chromosomes])
-
-        probabilities = [chromosome.fitness / total_fitness for chromosome in chromosomes]
+        cumulative_fitness = np.cumsum([chromosome.fitness for chromosome in chromosomes], dtype=np.float64)
+        total_fitness = cumulative_fitness[-1]
 
-        parents = []
-        for i in range(num_parents):
-            parent = random.choices(chromosomes, weights=probabilities)[-1]
-            parents.append(parent)
+        # Without any fitness, e.g. when no tower covers any city yet, every chromosome is equally likely.
+        if total_fitness > 0:
+            indices = np.searchsorted(cumulative_fitness, np.random.random(num_parents) * total_fitness, side='right')
+        else:
+            indices = np.random.randint(0, len(chromosomes), num_parents)
 
-        return parents
+        return [chromosomes[index] for index in np.minimum(indices, len(chromosomes) - 1)]
@@ -1,6 +1,27 @@
+import numpy as np
+
+
 class MuPlusLambdaOperator:
 
     def select(self, parents, offsprings):
+        """
+        Keeps the len(parents) fittest chromosomes among the parents and the offspring.
+
+        The survivors are found by partial selection with argpartition in linear time instead of sorting all
+        chromosomes.
+
+        Args:
+            parents (list): The current population.
+            offsprings (list): The offspring chromosomes.
+
+        Returns:
+            list: The surviving chromosomes, in no particular order.
+        """
         combined_chromosomes = parents + offsprings
-        sorted_chromosomes = sorted(combined_chromosomes, key=lambda chromosome: chromosome.fitness, reverse=True)
-        return sorted_chromosomes[:len(parents)]
+        survivors_count = len(parents)
+        if survivors_count >= len(combined_chromosomes):
+            return combined_chromosomes
+
+        fitness = np.array([chromosome.fitness for chromosome in combined_chromosomes], dtype=np.float64)
+        survivors = np.argpartition(-fitness, survivors_count - 1)[:survivors_count]
+        return [combined_chromosomes[index] for index in survivors]
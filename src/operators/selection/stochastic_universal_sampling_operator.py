@@ -0,0 +1,33 @@
+import numpy as np
+
+
+class StochasticUniversalSamplingOperator:
+    """
+    Fitness proportionate selection with evenly spaced pointers over the cumulative fitness.
+
+    A single random offset places num_parents pointers at equal distances, so every chromosome is selected either
+    floor or ceil of its expected number of times, with much lower variance than independent draws.
+    """
+
+    def select(self, chromosomes, num_parents):
+        """
+        Selects parents from a list of chromosomes by stochastic universal sampling.
+
+        Args:
+            chromosomes (list): List of Chromosome objects to select parents from.
+            num_parents (int): The number of parents to select.
+
+        Returns:
+            list: List of selected parents, in random order.
+        """
+        cumulative_fitness = np.cumsum([chromosome.fitness for chromosome in chromosomes], dtype=np.float64)
+        total_fitness = cumulative_fitness[-1]
+        if total_fitness <= 0:
+            cumulative_fitness = np.arange(1, len(chromosomes) + 1, dtype=np.float64)
+            total_fitness = cumulative_fitness[-1]
+
+        pointers = (np.random.random() + np.arange(num_parents)) * (total_fitness / num_parents)
+        indices = np.minimum(np.searchsorted(cumulative_fitness, pointers, side='right'), len(chromosomes) - 1)
+
+        # The pointers select chromosomes in population order; shuffle them so that pairing stays random.
+        return [chromosomes[index] for index in np.random.permutation(indices)]
@@ -0,0 +1,34 @@
+import numpy as np
+
+from common.config import TOURNAMENT_SIZE
+
+
+class TournamentOperator:
+    """
+    Selects each parent as the fittest of tournament_size chromosomes drawn uniformly with replacement.
+    """
+
+    def __init__(self, tournament_size: int = TOURNAMENT_SIZE):
+        """
+        Initializes the operator.
+
+        Args:
+            tournament_size (int): The number of chromosomes competing for each parent.
+        """
+        self.tournament_size = tournament_size
+
+    def select(self, chromosomes, num_parents):
+        """
+        Selects parents from a list of chromosomes by running all tournaments in one batch.
+
+        Args:
+            chromosomes (list): List of Chromosome objects to select parents from.
+            num_parents (int): The number of parents to select.
+
+        Returns:
+            list: List of selected parents.
+        """
+        fitness = np.array([chromosome.fitness for chromosome in chromosomes], dtype=np.float64)
+        contestants = np.random.randint(0, len(chromosomes), (num_parents, self.tournament_size))
+        winners = contestants[np.arange(num_parents), np.argmax(fitness[contestants], axis=1)]
+        return [chromosomes[index] for index in winners]
@@ -0,0 +1,17 @@
+import argparse
+import time
+
+from core.algorithm import EvolutionaryAlgorithm
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Resume an interrupted evolution from its checkpoint.")
+    parser.add_argument('checkpoint', help="the checkpoint file of the run, e.g. ../resources/checkpoints/run-1.npz")
+    arguments = parser.parse_args()
+
+    start_time = time.time()
+
+    EvolutionaryAlgorithm.from_checkpoint(arguments.checkpoint).run_resume(arguments.checkpoint)
+
+    end_time = time.time()
+    runtime = end_time - start_time
+    print("\nRuntime: {} seconds".format(runtime))
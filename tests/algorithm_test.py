@@ -0,0 +1,41 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from common.results_store import ResultsStore
+from core.algorithm import EvolutionaryAlgorithm
+from core.compact_chromosome import CompactChromosome
+
+
+class TestEvolutionaryAlgorithm(unittest.TestCase):
+    def test_runs_do_not_depend_on_evolution_workers(self):
+        runs = []
+        for evolution_workers in (1, 2):
+            with tempfile.TemporaryDirectory() as directory:
+                algorithm = EvolutionaryAlgorithm(3, CompactChromosome, fitness_workers=0,
+                                                  evolution_workers=evolution_workers, seed=21,
+                                                  results_store=ResultsStore(directory))
+                with mock.patch('core.algorithm.Helper.show_plot'), contextlib.redirect_stdout(io.StringIO()):
+                    algorithm.run_evolve(times=2)
+                index = {entry['seed']: entry for entry in algorithm.results_store.index()}
+                runs.append((algorithm, index))
+
+        (serial_algorithm, serial_index), (parallel_algorithm, parallel_index) = runs
+        self.assertEqual(2, len(serial_index))
+        self.assertEqual(sorted(serial_index), sorted(parallel_index))
+        for seed, entry in serial_index.items():
+            self.assertEqual(entry['fitness'], parallel_index[seed]['fitness'])
+            self.assertEqual(entry['num_of_towers'], parallel_index[seed]['num_of_towers'])
+
+        # With two runs, the minimum and maximum of each generation are the average fitness of both runs.
+        np.testing.assert_array_equal(serial_algorithm.min_of_avg_fitness, parallel_algorithm.min_of_avg_fitness)
+        np.testing.assert_array_equal(serial_algorithm.max_of_avg_fitness, parallel_algorithm.max_of_avg_fitness)
+        np.testing.assert_array_equal(serial_algorithm.sum_of_avg_fitness, parallel_algorithm.sum_of_avg_fitness)
+
+
+if __name__ == '__main__':
+    unittest.main()
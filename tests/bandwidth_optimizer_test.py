@@ -0,0 +1,84 @@
+import contextlib
+import io
+import itertools
+import random
+import unittest
+
+import numpy as np
+
+from common.problem_config import ProblemConfig
+from core.algorithm import EvolutionaryAlgorithm
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.population import Population
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.local_search.bandwidth_optimizer import BandwidthOptimizer
+
+
+class TestBandwidthOptimizer(unittest.TestCase):
+    def test_optimize_matches_exhaustive_search(self):
+        config = ProblemConfig([[3, 9, 1], [4, 12, 2], [7, 1, 5]], ProblemConfig.default().problem_config,
+                               bandwidth_max=100)
+        fitness_calculator = FitnessCalculator(config=config)
+        optimizer = BandwidthOptimizer(config=config)
+        towers = np.array([[0.5, 0.5, 50.0], [2.0, 2.0, 50.0]])
+        assignment = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1])
+
+        # The best bandwidth of a tower is the minimum, the maximum or a breakpoint of one of its cities.
+        pair_towers, pair_bandwidths, _ = optimizer.breakpoints(towers, assignment)
+        candidates = [np.concatenate(([config.bandwidth_min, config.bandwidth_max],
+                                      pair_bandwidths[pair_towers == tower])) for tower in range(len(towers))]
+        best_fitness = 0.0
+        for bandwidths in itertools.product(*candidates):
+            towers[:, 2] = bandwidths
+            best_fitness = max(best_fitness, fitness_calculator.calculate_fitness_vectorized(towers, assignment))
+
+        towers[:, 2] = 50.0
+        fitness = fitness_calculator.calculate_fitness_vectorized(towers, assignment)
+        optimized_towers, = optimizer.optimize([towers], assignment[np.newaxis], np.array([fitness]))
+        self.assertEqual(best_fitness, fitness_calculator.calculate_fitness_vectorized(optimized_towers, assignment))
+        np.testing.assert_array_equal(towers[:, :2], optimized_towers[:, :2])
+
+    def test_improve_all_keeps_exact_evaluations(self):
+        random.seed(6)
+        np.random.seed(6)
+        optimizer = BandwidthOptimizer()
+        fitness_calculator = FitnessCalculator.shared()
+
+        for chromosome_type in (Chromosome, CompactChromosome):
+            chromosomes = [chromosome_type.initialize() for _ in range(4)]
+            for chromosome in chromosomes:
+                chromosome.calculate_fitness()
+            improved_chromosomes, evaluations = optimizer.improve_all(chromosomes)
+
+            self.assertEqual(len(chromosomes), evaluations)
+            for chromosome, improved_chromosome in zip(chromosomes, improved_chromosomes):
+                self.assertIsInstance(improved_chromosome, chromosome_type)
+                self.assertGreater(improved_chromosome.fitness, chromosome.fitness)
+                towers, assignment = improved_chromosome.encode()
+                self.assertEqual(fitness_calculator.calculate_fitness_vectorized(towers, assignment),
+                                 improved_chromosome.fitness)
+
+    def test_bandwidth_repair_and_final_optimization(self):
+        random.seed(7)
+        np.random.seed(7)
+        population = Population.initialize(CompactChromosome)
+        population.evaluate_fitness()
+        fitness = np.array([chromosome.fitness for chromosome in population.chromosomes])
+        evaluations = population.evaluations
+
+        population.local_search(BandwidthOptimizer(), len(population.chromosomes))
+        self.assertTrue(np.all(population.fitness_values >= fitness))
+        self.assertEqual(evaluations + len(population.chromosomes), population.evaluations)
+
+        algorithm = EvolutionaryAlgorithm(2, CompactChromosome, fitness_workers=0, evolution_workers=1,
+                                          bandwidth_repair=True, bandwidth_final=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution_info, _, _, _ = algorithm.evolve_replicate(seed=7)
+        self.assertEqual(solution_info['num_of_towers'], len(solution_info['towers']))
+        self.assertTrue(all(algorithm.config.bandwidth_min <= tower['bw'] <= algorithm.config.bandwidth_max
+                            for tower in solution_info['towers']))
+
+
+if __name__ == '__main__':
+    unittest.main()
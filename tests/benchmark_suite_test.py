@@ -0,0 +1,34 @@
+import copy
+import unittest
+
+from benchmarks.benchmark_suite import BenchmarkSuite
+from benchmarks.synthetic_grid import SyntheticGridGenerator
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_synthetic_grid_is_reproducible(self):
+        generator = SyntheticGridGenerator()
+        config = generator.generate(4, 7, seed=2)
+
+        self.assertEqual(28, config.cities_count)
+        self.assertEqual((4, 7), (config.location_max_x, config.location_max_y))
+        self.assertEqual(config.cities_population.tolist(), generator.generate(4, 7, seed=2).cities_population.tolist())
+
+    def test_run_and_compare_with_baseline(self):
+        suite = BenchmarkSuite(sizes=((6, 6),), tower_counts=(3,), repeats=1, run_generations=1)
+        results = suite.run()
+
+        self.assertIn('fitness.calculate_fitness[6x6,towers=3]', results['benchmarks'])
+        self.assertIn('evolution.run.CompactChromosome[6x6,towers=3]', results['benchmarks'])
+        self.assertTrue(all(result['throughput'] > 0 and result['peak_memory_bytes'] > 0
+                            for result in results['benchmarks'].values()))
+        self.assertEqual([], BenchmarkSuite.compare(results, results))
+
+        baseline = copy.deepcopy(results)
+        baseline['benchmarks']['fitness.calculate_fitness[6x6,towers=3]']['throughput'] *= 2
+        regressions = BenchmarkSuite.compare(results, baseline, tolerance=0.1)
+        self.assertEqual(['fitness.calculate_fitness[6x6,towers=3]'], [regression['name'] for regression in regressions])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from core.algorithm import EvolutionaryAlgorithm
+from core.checkpoint import Checkpoint
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_resumed_run_matches_uninterrupted_run(self):
+        for chromosome_type in (Chromosome, CompactChromosome):
+            with tempfile.TemporaryDirectory() as directory:
+                algorithm = EvolutionaryAlgorithm(5, chromosome_type, fitness_workers=0, evolution_workers=1,
+                                                  checkpoint_interval=2, checkpoint_dir=directory)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    solution_info, avg_fitness, _, _ = algorithm.evolve_replicate(seed=8)
+
+                checkpoint_file = os.path.join(directory, 'run-8.npz')
+                self.assertEqual(['run-8.npz'], os.listdir(directory))
+                checkpoint = Checkpoint.load(checkpoint_file)
+                self.assertEqual(4, checkpoint.generation)
+
+                resumed_algorithm = EvolutionaryAlgorithm.from_checkpoint(
+                    checkpoint_file, fitness_workers=0, evolution_workers=1, checkpoint_dir=directory)
+                self.assertIs(chromosome_type, resumed_algorithm.chromosome_type)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    resumed_info, resumed_avg_fitness, _, _ = resumed_algorithm.evolve_replicate(
+                        checkpoint=checkpoint)
+
+                np.testing.assert_array_equal(avg_fitness, resumed_avg_fitness)
+                self.assertEqual(solution_info, resumed_info)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from common.config import *
+from core.algorithm import EvolutionaryAlgorithm
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.population import Population
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.initialization.clustering_initializer import ClusteringInitializer
+
+
+class TestClusteringInitializer(unittest.TestCase):
+    def test_cities_are_assigned_to_their_best_covering_tower(self):
+        np.random.seed(8)
+        initializer = ClusteringInitializer()
+        fitness_calculator = FitnessCalculator.shared()
+        towers_count = np.array([1, 4, 7, initializer.towers_max])
+
+        towers, assignments = initializer.place_towers(towers_count)
+        for chromosome_towers, tower_count, assignment in zip(towers, towers_count, assignments):
+            chromosome_towers = chromosome_towers[:tower_count]
+            self.assertTrue(np.all(assignment < tower_count))
+            self.assertTrue(np.all(chromosome_towers[:, 2] >= initializer.config.bandwidth_min))
+            self.assertTrue(np.all(chromosome_towers[:, 2] <= initializer.config.bandwidth_max))
+
+            coverage = np.stack([fitness_calculator.calc_coverages(np.broadcast_to(tower[:2], (len(assignment), 2)),
+                                                                   fitness_calculator.cities_location_array)
+                                 for tower in chromosome_towers])
+            assigned_coverage = coverage[assignment, np.arange(len(assignment))]
+            np.testing.assert_allclose(coverage.max(axis=0), assigned_coverage, rtol=1e-4)
+
+    def test_city_chunks_do_not_change_the_clustering(self):
+        towers_count = np.array([6])
+        np.random.seed(9)
+        towers, assignments = ClusteringInitializer().place_towers(towers_count)
+        np.random.seed(9)
+        chunked_towers, chunked_assignments = ClusteringInitializer(chunk_size=50).place_towers(towers_count)
+
+        np.testing.assert_array_equal(assignments, chunked_assignments)
+        np.testing.assert_allclose(towers, chunked_towers, rtol=1e-6)
+
+    def test_seeded_chromosomes_beat_random_ones(self):
+        random.seed(9)
+        np.random.seed(9)
+        fitness_calculator = FitnessCalculator.shared()
+
+        for chromosome_type in (Chromosome, CompactChromosome):
+            seeded_chromosomes = ClusteringInitializer().initialize(chromosome_type, 10)
+            random_chromosomes = [chromosome_type.initialize() for _ in range(10)]
+            for chromosome in seeded_chromosomes + random_chromosomes:
+                chromosome.calculate_fitness()
+
+            self.assertTrue(all(isinstance(chromosome, chromosome_type) for chromosome in seeded_chromosomes))
+            self.assertGreater(np.mean([chromosome.fitness for chromosome in seeded_chromosomes]),
+                               np.mean([chromosome.fitness for chromosome in random_chromosomes]))
+            towers, assignment = seeded_chromosomes[0].encode()
+            self.assertEqual(len(towers), len(np.unique(assignment)))
+            self.assertEqual(fitness_calculator.calculate_fitness_vectorized(towers, assignment),
+                             seeded_chromosomes[0].fitness)
+
+    def test_population_mixes_seeded_and_random_chromosomes(self):
+        random.seed(10)
+        np.random.seed(10)
+        population = Population.initialize(CompactChromosome, clustered_ratio=0.2)
+        towers_count = [len(chromosome.towers) for chromosome in population.chromosomes]
+        clustered_count = round(0.2 * POPULATION_SIZE)
+
+        self.assertEqual(POPULATION_SIZE, len(population.chromosomes))
+        self.assertTrue(all(count <= ClusteringInitializer().towers_max for count in towers_count[:clustered_count]))
+
+        algorithm = EvolutionaryAlgorithm(2, CompactChromosome, fitness_workers=0, evolution_workers=1,
+                                          clustered_ratio=0.5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution_info, _, _, _ = algorithm.evolve_replicate(seed=10)
+        self.assertEqual(solution_info['num_of_towers'], len(solution_info['towers']))
+
+
+if __name__ == '__main__':
+    unittest.main()
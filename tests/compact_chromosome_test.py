@@ -0,0 +1,61 @@
+import random
+import unittest
+
+import numpy as np
+
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from operators.fitness.fitness_cache import FitnessCache
+
+
+class TestCompactChromosome(unittest.TestCase):
+    def test_same_fitness_as_gene_representation(self):
+        random.seed(5)
+        chromosome = Chromosome.initialize()
+
+        compact = CompactChromosome.from_genes(chromosome.genes)
+        fitness_cache = FitnessCache.shared(compact.config)
+
+        fitness_cache.clear()
+        fitness = chromosome.calculate_fitness()
+        fitness_cache.clear()
+        self.assertEqual(fitness, compact.calculate_fitness())
+        fitness_cache.clear()
+        self.assertEqual(compact.fitness, Chromosome(compact.genes).calculate_fitness())
+        self.assertEqual(0, fitness_cache.hits)
+        self.assertEqual(compact.fitness_calculator.calculate_fitness_vectorized(*compact.encode()), compact.fitness)
+
+    def test_genome_hash_changes_with_mutation_only(self):
+        np.random.seed(9)
+        chromosome = CompactChromosome.initialize()
+        copy = chromosome.copy()
+
+        self.assertEqual(chromosome.genome_hash(), CompactChromosome.from_genes(chromosome.genes).genome_hash())
+        copy.mutate(mutation_rate=1.0)
+        self.assertNotEqual(chromosome.genome_hash(), copy.genome_hash())
+
+    def test_crossover_keeps_only_referenced_towers(self):
+        np.random.seed(5)
+        parent1 = CompactChromosome.initialize()
+        parent2 = CompactChromosome.initialize()
+
+        for child in parent1.crossover(parent2, crossover_rate=1.0):
+            self.assertEqual(len(child.assignment), len(parent1.assignment))
+            self.assertEqual(len(child.towers), len(np.unique(child.assignment)))
+            self.assertEqual(child.assignment.max(), len(child.towers) - 1)
+
+    def test_incremental_fitness_matches_full_evaluation(self):
+        np.random.seed(11)
+        chromosome = CompactChromosome.initialize()
+        chromosome.calculate_fitness()
+
+        for _ in range(20):
+            chromosome.mutate(mutation_rate=0.1)
+            chromosome.calculate_fitness()
+            expected_fitness = chromosome.fitness_calculator.calculate_fitness_vectorized(chromosome.towers,
+                                                                                          chromosome.assignment)
+            self.assertEqual(expected_fitness, chromosome.fitness)
+
+
+if __name__ == '__main__':
+    unittest.main()
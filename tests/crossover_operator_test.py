@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.population import Population
+from operators.recombination.two_point_crossover import MultiPointsCrossoverOperator
+
+
+class TestCrossoverOperator(unittest.TestCase):
+    @staticmethod
+    def random_arrays(tower_count, cities_count):
+        towers = np.random.uniform(0, 100, (tower_count, 3))
+        assignment = np.random.randint(0, tower_count, cities_count).astype(np.int32)
+        return MultiPointsCrossoverOperator.compact(towers, assignment)
+
+    def test_gene_crossover_exchanges_the_crossover_points(self):
+        random.seed(3)
+        parent1, parent2 = Chromosome.initialize().genes, Chromosome.initialize().genes
+        child1, child2 = MultiPointsCrossoverOperator().crossover(parent1, parent2, 1.0, num_points=7)
+
+        exchanged = [i for i, gene in enumerate(child1) if gene.location == parent2[i].location
+                     and gene.location != parent1[i].location]
+        self.assertEqual(7, len(exchanged))
+        for i in range(len(parent1)):
+            self.assertIsNot(parent1[i], child1[i])
+            self.assertEqual({parent1[i].location, parent2[i].location}, {child1[i].location, child2[i].location})
+
+        self.assertLessEqual(len(set(map(id, child1))), len(set(map(id, parent1 + parent2))))
+
+    def test_masks(self):
+        np.random.seed(5)
+        masks = MultiPointsCrossoverOperator('k_point', points=3).crossover_masks(50, 40)
+        self.assertEqual((50, 40), masks.shape)
+        self.assertFalse(masks[:, 0].any())
+        self.assertTrue(np.all(np.count_nonzero(np.diff(masks.astype(np.int8), axis=1), axis=1) == 3))
+        masks = MultiPointsCrossoverOperator('k_point', points=3).crossover_masks(4, 1)
+        np.testing.assert_array_equal(np.zeros((4, 1), dtype=bool), masks)
+
+        masks = MultiPointsCrossoverOperator('multi_point').crossover_masks(20, 40, num_points=6)
+        self.assertTrue(np.all(masks.sum(axis=1) == 6))
+
+        masks = MultiPointsCrossoverOperator('uniform').crossover_masks(200, 40)
+        self.assertAlmostEqual(0.5, masks.mean(), delta=0.02)
+
+        with self.assertRaises(ValueError):
+            MultiPointsCrossoverOperator('two_point')
+
+    def test_batch_crossover_exchanges_cities_and_drops_unused_towers(self):
+        np.random.seed(7)
+        for method in ('multi_point', 'k_point', 'uniform'):
+            operator = MultiPointsCrossoverOperator(method)
+            parents1 = [self.random_arrays(count, 60) for count in (3, 8, 1, 5)]
+            parents2 = [self.random_arrays(count, 60) for count in (6, 2, 4, 5)]
+            children = operator.crossover_batch(parents1, parents2, crossover_rate=1.0)
+
+            for (towers1, assignment1), (towers2, assignment2), pair_children in zip(parents1, parents2, children):
+                (child_towers1, child_assignment1), (child_towers2, child_assignment2) = pair_children
+                cities1, cities2 = child_towers1[child_assignment1], child_towers2[child_assignment2]
+                from_parent1 = np.all(cities1 == towers1[assignment1], axis=1)
+                np.testing.assert_array_equal(np.where(from_parent1[:, np.newaxis], towers1[assignment1],
+                                                       towers2[assignment2]), cities1)
+                np.testing.assert_array_equal(np.where(from_parent1[:, np.newaxis], towers2[assignment2],
+                                                       towers1[assignment1]), cities2)
+                self.assertEqual(len(child_towers1), len(np.unique(child_assignment1)))
+                self.assertEqual(len(child_towers2), len(np.unique(child_assignment2)))
+
+    def test_batch_crossover_accepts_towers_without_cities(self):
+        np.random.seed(11)
+        towers1 = np.arange(9, dtype=np.float64).reshape(3, 3)
+        towers2 = towers1 + 100
+        children = MultiPointsCrossoverOperator().crossover_batch([(towers1, np.array([0, 1, 0, 1]))],
+                                                                  [(towers2, np.array([0, 0, 1, 1]))], 1.0)
+
+        for child_towers, child_assignment in children[0]:
+            self.assertEqual(len(child_towers), len(np.unique(child_assignment)))
+            self.assertFalse(np.any(np.all(child_towers == towers1[2], axis=1)))
+            self.assertFalse(np.any(np.all(child_towers == towers2[2], axis=1)))
+
+    def test_population_crosses_compact_pairs_in_one_batch(self):
+        np.random.seed(9)
+        random.seed(9)
+        population = Population.initialize(CompactChromosome)
+        population.evaluate_fitness()
+
+        offspring = population.crossover(0.0)
+        self.assertEqual(len(population.chromosomes), len(offspring.chromosomes))
+        for parent, child in zip(population.chromosomes, offspring.chromosomes):
+            self.assertIsNot(parent, child)
+            self.assertEqual(parent.fitness, child.fitness)
+            np.testing.assert_array_equal(parent.assignment, child.assignment)
+
+        offspring = population.crossover(1.0)
+        self.assertEqual(len(population.chromosomes), len(offspring.chromosomes))
+        self.assertTrue(all(not child.can_update_fitness() for child in offspring.chromosomes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import contextlib
+import io
+import json
+import unittest
+
+from core.algorithm import EvolutionaryAlgorithm
+from core.compact_chromosome import CompactChromosome
+from core.evolution_metrics import PHASES
+
+
+class TestEvolutionMetrics(unittest.TestCase):
+    def test_every_phase_is_timed_each_generation(self):
+        algorithm = EvolutionaryAlgorithm(3, CompactChromosome, fitness_workers=0, evolution_workers=1, profile=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, _, _, metrics = algorithm.evolve_replicate(seed=4)
+
+        json.dumps(metrics)
+        self.assertEqual(3, metrics['generations'])
+        self.assertEqual(set(PHASES), set(metrics['phases']))
+        self.assertTrue(all(phase['calls'] == 3 for phase in metrics['phases'].values()))
+        self.assertGreater(metrics['initialization_seconds']['evaluation'], 0)
+        phases_seconds = sum(phase['seconds'] for phase in metrics['phases'].values())
+        self.assertLessEqual(phases_seconds, metrics['total_seconds'])
+        self.assertTrue(metrics['profile'])
+        self.assertIsNone(metrics['memory'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
+import random
 import unittest
 
+import numpy as np
+
 from core.gene import Gene
 from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.fitness.spatial_index import SpatialGridIndex
 
 
 class TestFitnessCalculator(unittest.TestCase):
@@ -27,6 +31,81 @@ class TestFitnessCalculator(unittest.TestCase):
 
         self.assertEqual(expected_fitness, actual_fitness)
 
+    def test_vectorized_satisfaction_matches_per_city_loop(self):
+        random.seed(7)
+        calculator = FitnessCalculator()
+        towers = [Gene.initialize() for _ in range(5)]
+        genes = [random.choice(towers) for _ in range(len(calculator.cities_location))]
+
+        groups = calculator.group_by(genes)
+        expected_satisfaction = 0.0
+        for city_index, tower in enumerate(genes):
+            city_location = calculator.cities_location[city_index]
+            city_population = calculator.cities_population[city_index]
+            associated_cities_population = sum([calculator.cities_population[i] for i in groups[tower]])
+            city_bandwidth = calculator.calc_bandwidth(tower, city_location, city_population,
+                                                       associated_cities_population)
+            city_satisfaction = calculator.calc_city_satisfaction_score(city_bandwidth, city_population)
+            expected_satisfaction += city_satisfaction * city_population
+        expected_cost = calculator.tower_construction_cost * len(towers) + sum(
+            [calculator.tower_maintenance_cost * tower.bandwidth for tower in towers])
+
+        self.assertEqual(expected_satisfaction, calculator.calc_total_satisfaction(genes))
+        self.assertAlmostEqual(expected_satisfaction / expected_cost, calculator.calculate_fitness(genes), places=9)
+
+    def test_separable_coverage_matches_general_form(self):
+        calculator = FitnessCalculator()
+        tower_locations = [(0.5, 3.25), (12.0, 7.5), (19.9, 0.1)]
+
+        separable = calculator.calc_coverage_matrix(tower_locations)
+        calculator.separable_coverage = False
+        general = calculator.calc_coverage_matrix(tower_locations)
+
+        for tower_index, tower_location in enumerate(tower_locations):
+            for city_index in (0, 57, 399):
+                expected = calculator.calc_coverage(tower_location, calculator.cities_location[city_index])
+                self.assertAlmostEqual(expected, separable[tower_index, city_index], places=12)
+                self.assertAlmostEqual(expected, general[tower_index, city_index], places=12)
+
+    def test_sparse_coverage_matches_truncated_dense_coverage(self):
+        calculator = FitnessCalculator(coverage_tolerance=1e-3)
+        tower_locations = [(0.5, 3.25), (12.0, 7.5), (19.9, 0.1)]
+
+        tower_indices, city_indices, coverage = calculator.calc_sparse_coverage(tower_locations)
+        sparse = [[0.0] * len(calculator.cities_location) for _ in tower_locations]
+        for tower_index, city_index, value in zip(tower_indices, city_indices, coverage):
+            sparse[tower_index][city_index] = value
+
+        dense = calculator.calc_coverage_matrix(tower_locations)
+        for tower_index in range(len(tower_locations)):
+            for city_index in range(len(calculator.cities_location)):
+                self.assertAlmostEqual(dense[tower_index, city_index], sparse[tower_index][city_index], places=12)
+
+    def test_coverage_cutoff_matches_truncated_kernel(self):
+        calculator = FitnessCalculator(coverage_tolerance=1e-3)
+        np.random.seed(18)
+        tower_locations = np.random.uniform(0, 20, (len(calculator.cities_location_array), 2))
+
+        coverage = calculator.calc_coverages(tower_locations, calculator.cities_location_array)
+        diff = calculator.cities_location_array - tower_locations
+        expected = np.exp(np.einsum('ij,jk,ik->i', -0.5 * diff, calculator.sigma_inv, diff))
+        expected[expected < 1e-3] = 0.0
+        self.assertTrue(np.any(coverage == 0) and np.any(coverage > 0))
+        np.testing.assert_allclose(expected, coverage, rtol=1e-12)
+
+    def test_radius_query_matches_brute_force(self):
+        np.random.seed(19)
+        locations = np.random.uniform(0, 30, (500, 2))
+        points = np.concatenate((np.random.uniform(-5, 35, (40, 2)), [[-100.0, -100.0]]))
+        index = SpatialGridIndex(locations, 2.5)
+
+        point_indices, location_indices = index.query_radius(points, 2.5)
+        self.assertTrue(np.all(np.diff(point_indices) >= 0))
+        distances = np.linalg.norm(points[:, np.newaxis, :] - locations[np.newaxis, :, :], axis=2)
+        for point_index in range(len(points)):
+            self.assertEqual(set(np.flatnonzero(distances[point_index] <= 2.5)),
+                             set(location_indices[point_indices == point_index]))
+
 
 if __name__ == '__main__':
     unittest.main()
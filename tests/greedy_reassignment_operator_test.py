@@ -0,0 +1,71 @@
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from core.algorithm import EvolutionaryAlgorithm
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.population import Population
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.local_search.greedy_reassignment_operator import GreedyReassignmentOperator
+
+
+class TestGreedyReassignmentOperator(unittest.TestCase):
+    def test_improve_keeps_an_exact_evaluation(self):
+        random.seed(2)
+        np.random.seed(2)
+        operator = GreedyReassignmentOperator()
+        fitness_calculator = FitnessCalculator.shared()
+
+        for chromosome_type in (Chromosome, CompactChromosome):
+            chromosome = chromosome_type.initialize()
+            chromosome.calculate_fitness()
+            improved_chromosome, evaluations = operator.improve(chromosome)
+
+            self.assertIsInstance(improved_chromosome, chromosome_type)
+            self.assertGreater(improved_chromosome.fitness, chromosome.fitness)
+            self.assertGreater(evaluations, 1)
+            towers, assignment = improved_chromosome.encode()
+            self.assertEqual(fitness_calculator.calculate_fitness_vectorized(towers, assignment),
+                             improved_chromosome.fitness)
+            self.assertEqual(len(towers), len(np.unique(assignment)))
+
+    def test_best_moves_only_propose_gains(self):
+        random.seed(3)
+        np.random.seed(3)
+        operator = GreedyReassignmentOperator()
+        fitness_calculator = FitnessCalculator.shared()
+        chromosome = CompactChromosome.initialize()
+        towers_population, _ = fitness_calculator.calc_towers_satisfaction(chromosome.towers, chromosome.assignment)
+
+        cities, targets = operator.best_moves(chromosome.towers, chromosome.assignment, towers_population)
+        self.assertGreater(len(cities), 0)
+        self.assertEqual(len(cities), len(np.unique(cities)))
+        self.assertTrue(np.all(chromosome.assignment[cities] != targets))
+
+    def test_local_search_improves_the_best_chromosomes(self):
+        random.seed(4)
+        np.random.seed(4)
+        population = Population.initialize(CompactChromosome)
+        population.evaluate_fitness()
+        best_fitness = population.statistics()['best_fitness']
+        evaluations = population.evaluations
+
+        population.local_search(GreedyReassignmentOperator(), 3)
+        self.assertGreater(population.statistics()['best_fitness'], best_fitness)
+        self.assertGreater(population.evaluations, evaluations + 3)
+
+        algorithm = EvolutionaryAlgorithm(2, CompactChromosome, fitness_workers=0, evolution_workers=1,
+                                          local_search_top_k=2, local_search_final=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution_info, _, _, metrics = algorithm.evolve_replicate(seed=4)
+        # One local search per generation and the final one, recorded in the last generation.
+        self.assertEqual(3, metrics['phases']['local_search']['calls'])
+        self.assertEqual(solution_info['num_of_towers'], len(solution_info['towers']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import multiprocessing
+import os
+import unittest
+
+import numpy as np
+
+from core.algorithm import EvolutionaryAlgorithm
+from core.compact_chromosome import CompactChromosome
+from core.island_model import IslandModel
+
+
+class FailingAlgorithm(EvolutionaryAlgorithm):
+    """
+    Raises an error in island 1 during the first generation, or exits its process without a result if crash is set.
+    """
+    crash = False
+
+    def evolve_generation(self, population, metrics=None):
+        if multiprocessing.current_process().name == 'island-1':
+            if self.crash:
+                os._exit(3)
+            raise ValueError('island failure')
+        return super().evolve_generation(population, metrics)
+
+
+class TestIslandModel(unittest.TestCase):
+    def test_migrants_round_trip_through_wire_format(self):
+        np.random.seed(2)
+        chromosomes = [CompactChromosome.initialize() for _ in range(3)]
+        for chromosome in chromosomes:
+            chromosome.calculate_fitness()
+
+        decoded = IslandModel.decode_migrants(IslandModel.encode_migrants(chromosomes), CompactChromosome)
+
+        for expected, actual in zip(chromosomes, decoded):
+            np.testing.assert_array_equal(expected.towers, actual.towers)
+            np.testing.assert_array_equal(expected.assignment, actual.assignment)
+            self.assertEqual(expected.fitness, actual.fitness)
+
+    def test_topologies(self):
+        ring = IslandModel(islands=4, topology='ring')
+        full = IslandModel(islands=4, topology='full')
+
+        self.assertEqual([1], ring.targets(0))
+        self.assertEqual([3], ring.sources(0))
+        self.assertEqual([0, 2, 3], full.sources(1))
+
+    def test_evolve_islands(self):
+        algorithm = EvolutionaryAlgorithm(2, CompactChromosome, fitness_workers=0, evolution_workers=1)
+        island_model = IslandModel(islands=2, migration_interval=1, migrants=1)
+
+        best_chromosome, avg_fitness, fitness_cache_stats, metrics = island_model.evolve(algorithm, seed=3)
+        self.assertIsInstance(best_chromosome, CompactChromosome)
+        self.assertEqual(best_chromosome.fitness_calculator.calculate_fitness_vectorized(*best_chromosome.encode()),
+                         best_chromosome.fitness)
+        self.assertEqual((2,), avg_fitness.shape)
+        self.assertEqual(2, len(fitness_cache_stats))
+        self.assertEqual([2, 2], [island_metrics['generations'] for island_metrics in metrics])
+
+    def test_failing_island_is_reported(self):
+        island_model = IslandModel(islands=2, migration_interval=1, migrants=1)
+
+        algorithm = FailingAlgorithm(2, CompactChromosome, fitness_workers=0, evolution_workers=1)
+        with self.assertRaisesRegex(RuntimeError, 'Island 1 failed:(.|\n)*island failure'):
+            island_model.evolve(algorithm, seed=4)
+
+        algorithm.crash = True
+        with self.assertRaisesRegex(RuntimeError, 'Island 1 exited with code 3'):
+            island_model.evolve(algorithm, seed=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from common.config import *
+from core.chromosome import Chromosome
+from core.compact_chromosome import CompactChromosome
+from core.gene import Gene
+from core.population import Population
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.mutation.swap_mutation_operator import SwapMutationOperator
+
+
+class TestMutationOperator(unittest.TestCase):
+    def test_shared_gene_is_mutated_once(self):
+        gene = Gene((10.0, 20.0), 1000.0)
+        chromosome = Chromosome([gene] * 50)
+
+        Chromosome.mutate_population([chromosome], 1.0, np.random.default_rng(3))
+
+        expected_generator = np.random.default_rng(3)
+        expected_generator.random(1)
+        location_mutation = expected_generator.normal(0, LOCATION_MUTATION_STD, 1)[0]
+        bandwidth_mutation = expected_generator.normal(0, BANDWIDTH_MUTATION_STD, 1)[0]
+        self.assertAlmostEqual(10.0 + location_mutation, gene.location[0])
+        self.assertAlmostEqual(20.0 + location_mutation, gene.location[1])
+        self.assertAlmostEqual(min(BANDWIDTH_MAX, max(BANDWIDTH_MIN, 1000.0 + bandwidth_mutation)), gene.bandwidth)
+        self.assertTrue(all(city_gene is gene for city_gene in chromosome.genes))
+
+    def test_shuffle_keeps_the_cities_of_every_tower(self):
+        assignments = np.random.default_rng(1).integers(0, 7, (20, 300)).astype(np.int32)
+        original = assignments.copy()
+        rows, cities = SwapMutationOperator().mutate_assignments(assignments, 0.2, np.random.default_rng(2))
+
+        selected = np.zeros(assignments.shape, dtype=bool)
+        selected[rows, cities] = True
+        changed = assignments != original
+        self.assertTrue(changed.any())
+        self.assertFalse((changed & ~selected).any())
+        for row in range(len(assignments)):
+            np.testing.assert_array_equal(np.bincount(original[row], minlength=7),
+                                          np.bincount(assignments[row], minlength=7))
+
+    @mock.patch('core.population.BATCHED_MUTATION', True)
+    def test_batched_mutation_keeps_incremental_fitness_exact(self):
+        np.random.seed(4)
+        random.seed(4)
+        population = Population.initialize(CompactChromosome)
+        population.evaluate_fitness()
+        population.mutate(0.2, np.random.default_rng(5))
+        population.evaluate_fitness()
+
+        fitness_calculator = FitnessCalculator.shared()
+        for chromosome in population.chromosomes:
+            self.assertEqual(fitness_calculator.calculate_fitness_vectorized(chromosome.towers, chromosome.assignment),
+                             chromosome.fitness)
+
+    @mock.patch('core.population.BATCHED_MUTATION', True)
+    def test_batched_mutation_is_reproducible(self):
+        def mutated_population(chromosome_type):
+            random.seed(6)
+            np.random.seed(6)
+            population = Population.initialize(chromosome_type)
+            population.mutate(0.3)
+            return [chromosome.encode() for chromosome in population.chromosomes]
+
+        for chromosome_type in (Chromosome, CompactChromosome):
+            for (towers1, assignment1), (towers2, assignment2) in zip(mutated_population(chromosome_type),
+                                                                      mutated_population(chromosome_type)):
+                np.testing.assert_array_equal(towers1, towers2)
+                np.testing.assert_array_equal(assignment1, assignment2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.compact_chromosome import CompactChromosome
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.fitness import parallel_fitness_evaluator
+from operators.fitness.parallel_fitness_evaluator import ParallelFitnessEvaluator
+
+
+def attached_blocks(_):
+    return {key: block.name for key, block in parallel_fitness_evaluator._worker_blocks.items()}
+
+
+class TestParallelFitnessEvaluator(unittest.TestCase):
+    def test_results_match_serial_evaluation_and_blocks_are_released(self):
+        np.random.seed(17)
+        fitness_calculator = FitnessCalculator.shared()
+        batches = [fitness_calculator.pack([CompactChromosome.initialize().encode() for _ in range(count)])
+                   for count in (5, 19)]
+
+        with ParallelFitnessEvaluator(workers=2, chunk_size=4, fitness_calculator=fitness_calculator) as evaluator:
+            for towers, towers_count, assignments in batches:
+                expected = fitness_calculator.evaluate_population(towers, towers_count, assignments)
+                actual = evaluator.evaluate_population(towers, towers_count, assignments)
+                for expected_array, actual_array in zip(expected, actual):
+                    np.testing.assert_array_equal(expected_array, actual_array)
+            block_names = [block.name for block in evaluator.blocks]
+
+        self.assertGreater(len(block_names), 4)
+        self.assertEqual([], evaluator.blocks)
+        for name in block_names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_workers_drop_replaced_population_blocks(self):
+        np.random.seed(18)
+        fitness_calculator = FitnessCalculator.shared()
+        chromosomes = [CompactChromosome.initialize().encode() for _ in range(4)]
+        with ParallelFitnessEvaluator(workers=1, fitness_calculator=fitness_calculator) as evaluator:
+            evaluator.evaluate_population(*fitness_calculator.pack(chromosomes))
+            first_blocks = evaluator.pool.apply(attached_blocks, (None,))
+            # A larger population outgrows the blocks, so the parent moves it to new ones.
+            evaluator.evaluate_population(*fitness_calculator.pack(chromosomes * 10))
+            second_blocks = evaluator.pool.apply(attached_blocks, (None,))
+            population_names = {evaluator.population_blocks[key].name for key in evaluator.population_blocks}
+
+        self.assertEqual(len(first_blocks), len(second_blocks))
+        self.assertEqual(population_names, {second_blocks[key] for key in ('towers', 'towers_count', 'assignments')})
+        self.assertNotEqual(first_blocks['assignments'], second_blocks['assignments'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from core.chromosome import Chromosome
+from core.population import Population
+from operators.fitness.fitness_cache import FitnessCache
+
+
+class TestPopulation(unittest.TestCase):
+    def test_batch_evaluation_matches_single_evaluation(self):
+        random.seed(3)
+        population = Population.initialize()
+        fitness_cache = FitnessCache.shared(population.config)
+        fitness_cache.clear()
+
+        population.evaluate_fitness()
+        batch_fitness = [chromosome.fitness for chromosome in population.chromosomes]
+        fitness_cache.clear()
+        single_fitness = [chromosome.calculate_fitness() for chromosome in population.chromosomes]
+
+        self.assertEqual(0, fitness_cache.hits)
+        self.assertEqual(single_fitness, batch_fitness)
+        self.assertEqual([population.fitness_calculator.calculate_fitness_vectorized(*chromosome.encode())
+                          for chromosome in population.chromosomes], batch_fitness)
+
+    def test_cached_evaluations_are_not_counted(self):
+        random.seed(4)
+        population = Population.initialize()
+        fitness_cache = FitnessCache.shared(population.config)
+        fitness_cache.clear()
+        population.evaluate_fitness()
+        evaluations = population.evaluations
+        self.assertGreater(evaluations, 0)
+
+        rebuilt_population = Population([Chromosome.from_arrays(*chromosome.encode(), population.config)
+                                         for chromosome in population.chromosomes], population.config)
+        rebuilt_population.evaluations = evaluations
+        hits = fitness_cache.hits
+        rebuilt_population.evaluate_fitness()
+
+        self.assertEqual(evaluations, rebuilt_population.evaluations)
+        self.assertEqual(hits + len(population.chromosomes), fitness_cache.hits)
+        self.assertEqual([chromosome.fitness for chromosome in population.chromosomes],
+                         [chromosome.fitness for chromosome in rebuilt_population.chromosomes])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from common.config import *
+from common.helper import Helper
+from common.problem_config import ProblemConfig
+from core.chromosome import Chromosome
+from core.population import Population
+from operators.fitness.fitness_calculator import FitnessCalculator
+
+
+class TestProblemConfig(unittest.TestCase):
+    def test_problem_instances_coexist(self):
+        default_config = ProblemConfig.default()
+        small_config = ProblemConfig([[10, 20], [30, 40]], default_config.problem_config)
+
+        random.seed(5)
+        population = Population.initialize(Chromosome, small_config)
+        population.evaluate_fitness()
+
+        self.assertEqual(4, small_config.cities_count)
+        self.assertTrue(all(len(chromosome.genes) == 4 for chromosome in population.chromosomes))
+        self.assertIsNot(FitnessCalculator.shared(small_config), FitnessCalculator.shared(default_config))
+        self.assertEqual(len(default_config.cities_location), Chromosome.initialize().config.cities_count)
+
+        chromosome = population.chromosomes[0]
+        expected_fitness = FitnessCalculator(config=small_config).calculate_fitness(chromosome.genes)
+        self.assertEqual(expected_fitness, chromosome.fitness)
+
+    def test_memory_mapped_grid_matches_text_grid(self):
+        text_config = ProblemConfig.default()
+        with tempfile.TemporaryDirectory() as directory:
+            grid_file = Helper.convert_blocks_population(BLOCKS_POPULATION_FILE,
+                                                         os.path.join(directory, 'blocks_population.npy'))
+            binary_config = ProblemConfig.from_files(grid_file)
+
+            self.assertIsInstance(binary_config.cities_population, np.memmap)
+            np.testing.assert_array_equal(text_config.cities_population, binary_config.cities_population)
+            np.testing.assert_array_equal(text_config.cities_location, binary_config.cities_location)
+
+            random.seed(11)
+            genes = Chromosome.initialize(text_config).genes
+            self.assertEqual(FitnessCalculator(config=text_config).calculate_fitness(genes),
+                             FitnessCalculator(config=binary_config).calculate_fitness(genes))
+
+
+if __name__ == '__main__':
+    unittest.main()
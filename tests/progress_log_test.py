@@ -0,0 +1,47 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from common.helper import Helper
+from common.progress_log import ProgressLog
+from core.population import Population
+
+
+class TestProgressLog(unittest.TestCase):
+    def test_records_are_buffered_and_appended(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'progress', 'run-1.jsonl')
+            with ProgressLog(path, flush_interval=3) as progress_log:
+                for generation in range(4):
+                    progress_log.write({'generation': generation})
+                with open(path) as file:
+                    self.assertEqual(3, len(file.readlines()))
+
+            with ProgressLog(path) as progress_log:
+                progress_log.write({'generation': 4})
+            with open(path) as file:
+                self.assertEqual(list(range(5)), [json.loads(line)['generation'] for line in file])
+
+    def test_population_statistics_and_saved_plot(self):
+        random.seed(2)
+        population = Population.initialize()
+        population.evaluate_fitness()
+        statistics = population.statistics()
+
+        fitness = [chromosome.fitness for chromosome in population.chromosomes]
+        self.assertEqual(max(fitness), statistics['best_fitness'])
+        self.assertEqual(min(fitness), statistics['min_fitness'])
+        self.assertAlmostEqual(sum(fitness) / len(fitness), statistics['mean_fitness'])
+        self.assertEqual(len(set(population.get_best_chromosome().genes)), statistics['towers_count'])
+        self.assertEqual(1.0, statistics['diversity'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Helper.save_plot([0, 1], [1, 2], [0, 1], [2, 3], "generation", "fitness", "Test",
+                                    os.path.join(directory, 'plot.png'))
+            self.assertGreater(os.path.getsize(path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
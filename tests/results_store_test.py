@@ -0,0 +1,27 @@
+import tempfile
+import unittest
+
+from common.results_store import ResultsStore
+
+
+class TestResultsStore(unittest.TestCase):
+    def test_append_and_query_best_runs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ResultsStore(directory)
+            self.assertEqual([], store.index())
+
+            run_ids = [store.append({'fitness': fitness, 'seed': seed, 'towers': [{'loc': (seed, 0)}]},
+                                    metrics={'generations': 3})
+                       for seed, fitness in enumerate([5.0, 9.0, 7.0])]
+
+            self.assertEqual(3, len(set(run_ids)))
+            self.assertEqual(run_ids, [entry['run_id'] for entry in store.index()])
+            self.assertEqual([9.0, 7.0], [record['solution']['fitness'] for record in store.best(2)])
+            record = store.get(run_ids[2])
+            self.assertEqual({'fitness': 7.0, 'seed': 2, 'towers': [{'loc': [2, 0]}]}, record['solution'])
+            self.assertEqual({'generations': 3}, record['metrics'])
+            self.assertIsNone(store.get('missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
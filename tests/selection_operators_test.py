@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from core.chromosome import Chromosome
+from core.population import Population
+from operators.selection.fitness_proportionate_operator import FitnessProportionateOperator
+from operators.selection.mu_plus_lambda_operator import MuPlusLambdaOperator
+from operators.selection.stochastic_universal_sampling_operator import StochasticUniversalSamplingOperator
+from operators.selection.tournament_operator import TournamentOperator
+
+
+class TestSelectionOperators(unittest.TestCase):
+    @staticmethod
+    def chromosomes(fitness_values):
+        chromosomes = [Chromosome(genes=[]) for _ in fitness_values]
+        for chromosome, fitness in zip(chromosomes, fitness_values):
+            chromosome.fitness = fitness
+        return chromosomes
+
+    def test_fitness_proportionate_follows_fitness(self):
+        np.random.seed(1)
+        chromosomes = self.chromosomes([0.0, 1.0, 3.0])
+        selected = FitnessProportionateOperator().select(chromosomes, 20000)
+
+        counts = np.array([sum(parent is chromosome for parent in selected) for chromosome in chromosomes])
+        self.assertEqual(0, counts[0])
+        self.assertAlmostEqual(0.75, counts[2] / len(selected), delta=0.02)
+
+    def test_zero_fitness_selects_uniformly(self):
+        np.random.seed(2)
+        chromosomes = self.chromosomes([0.0, 0.0, 0.0, 0.0])
+        for operator in (FitnessProportionateOperator(), StochasticUniversalSamplingOperator()):
+            selected = operator.select(chromosomes, 400)
+            self.assertEqual(400, len(selected))
+            self.assertEqual(set(map(id, chromosomes)), set(map(id, selected)))
+
+    def test_stochastic_universal_sampling_is_within_one_of_expectation(self):
+        np.random.seed(3)
+        fitness_values = [1.0, 2.0, 3.5, 0.5, 3.0]
+        chromosomes = self.chromosomes(fitness_values)
+        selected = StochasticUniversalSamplingOperator().select(chromosomes, 40)
+
+        expected = np.array(fitness_values) / sum(fitness_values) * 40
+        counts = np.array([sum(parent is chromosome for parent in selected) for chromosome in chromosomes])
+        self.assertTrue(np.all(np.abs(counts - expected) < 1))
+
+    def test_tournament_selects_the_fittest_contestant(self):
+        np.random.seed(4)
+        chromosomes = self.chromosomes([5.0, 1.0, 4.0, 2.0])
+        selected = TournamentOperator(tournament_size=40).select(chromosomes, 100)
+        self.assertTrue(all(parent is chromosomes[0] for parent in selected))
+
+        selected = TournamentOperator(tournament_size=2).select(chromosomes, 4000)
+        counts = [sum(parent is chromosome for parent in selected) for chromosome in chromosomes]
+        self.assertAlmostEqual(7 / 16, counts[0] / len(selected), delta=0.03)
+        self.assertAlmostEqual(1 / 16, counts[1] / len(selected), delta=0.02)
+
+    def test_mu_plus_lambda_keeps_the_fittest(self):
+        parents = self.chromosomes([3.0, 9.0, 1.0, 7.0])
+        offsprings = self.chromosomes([8.0, 2.0, 6.0])
+        survivors = MuPlusLambdaOperator().select(parents, offsprings)
+
+        self.assertEqual([9.0, 8.0, 7.0, 6.0], sorted((chromosome.fitness for chromosome in survivors), reverse=True))
+
+    def test_population_rejects_unknown_selection(self):
+        with self.assertRaises(ValueError):
+            Population(selection='roulette')
+
+
+if __name__ == '__main__':
+    unittest.main()
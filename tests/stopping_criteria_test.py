@@ -0,0 +1,70 @@
+import contextlib
+import io
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from core.algorithm import EvolutionaryAlgorithm
+from core.checkpoint import Checkpoint
+from core.compact_chromosome import CompactChromosome
+from core.stopping_criteria import StoppingCriteria
+
+
+class TestStoppingCriteria(unittest.TestCase):
+    @staticmethod
+    def evolve(generation_count, stopping_criteria, **kwargs):
+        algorithm = EvolutionaryAlgorithm(generation_count, CompactChromosome, fitness_workers=0, evolution_workers=1,
+                                          stopping_criteria=stopping_criteria, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return algorithm.evolve_replicate(seed=3)
+
+    def test_stop_reasons(self):
+        criteria = StoppingCriteria(stagnation_generations=2, stagnation_tolerance=0.5, target_fitness=10.0,
+                                    max_evaluations=100, time_budget=0)
+        criteria.start()
+        self.assertIsNone(criteria.stop_reason([1.0, 2.0], 50))
+        self.assertIsNone(criteria.stop_reason([1.0, 2.0, 3.0], 50))
+        self.assertEqual('stagnation', criteria.stop_reason([1.0, 2.0, 3.0, 2.5], 50))
+        self.assertEqual('max_evaluations', criteria.stop_reason([1.0, 2.0], 100))
+        self.assertEqual('target_fitness', criteria.stop_reason([1.0, 12.0], 100))
+
+        criteria = StoppingCriteria(time_budget=1e-9)
+        criteria.start()
+        self.assertEqual('time_budget', criteria.stop_reason([1.0], 0))
+
+    def test_stagnation_ends_the_run(self):
+        solution_info, avg_fitness, _, metrics = self.evolve(
+            50, StoppingCriteria(stagnation_generations=2, stagnation_tolerance=math.inf))
+
+        self.assertEqual('stagnation', solution_info['stop_reason'])
+        self.assertEqual(3, solution_info['generations'])
+        self.assertEqual(3, len(avg_fitness))
+        self.assertEqual(3, metrics['generations'])
+
+    def test_generation_limit_is_reported(self):
+        solution_info, avg_fitness, _, _ = self.evolve(2, StoppingCriteria())
+        self.assertEqual('generations', solution_info['stop_reason'])
+        self.assertEqual(2, len(avg_fitness))
+
+    def test_unlimited_run_stops_at_evaluation_budget(self):
+        with self.assertRaises(ValueError):
+            EvolutionaryAlgorithm(None, CompactChromosome)
+
+        with tempfile.TemporaryDirectory() as directory:
+            solution_info, avg_fitness, _, _ = self.evolve(None, StoppingCriteria(max_evaluations=120),
+                                                           checkpoint_interval=1, checkpoint_dir=directory)
+            checkpoint = Checkpoint.load(os.path.join(directory, 'run-3.npz'))
+
+        self.assertEqual('max_evaluations', solution_info['stop_reason'])
+        self.assertEqual(len(avg_fitness), checkpoint.generation + 1)
+        self.assertIsNone(checkpoint.generation_count)
+        self.assertLess(checkpoint.evaluations, 120)
+        np.testing.assert_array_equal(avg_fitness[:-1], checkpoint.avg_fitness)
+        self.assertEqual(len(avg_fitness) - 1, len(checkpoint.best_fitness))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import contextlib
+import io
+import random
+import unittest
+
+import numpy as np
+
+from common.problem_config import ProblemConfig
+from core.algorithm import EvolutionaryAlgorithm
+from core.checkpoint import Checkpoint
+from core.population import Population
+from core.tower_chromosome import TowerChromosome
+from operators.fitness.fitness_calculator import FitnessCalculator
+from operators.mutation.tower_mutation_operator import TowerMutationOperator
+from operators.recombination.tower_crossover_operator import TowerCrossoverOperator
+
+
+class TestTowerChromosome(unittest.TestCase):
+    def test_best_covering_towers_match_the_coverage_matrix(self):
+        np.random.seed(12)
+        fitness_calculator = FitnessCalculator.shared()
+        towers = TowerChromosome.initialize().towers[:30]
+
+        coverage = fitness_calculator.calc_coverage_matrix(towers[:, :2])
+        np.testing.assert_array_equal(np.argmax(coverage, axis=0),
+                                      fitness_calculator.calc_best_covering_towers(towers, max_batch_cells=1000))
+        np.testing.assert_array_equal(np.argmax(coverage * towers[:, 2:3], axis=0),
+                                      fitness_calculator.calc_best_covering_towers(towers, bandwidth_weighted=True))
+
+    def test_uncovered_cities_go_to_the_nearest_tower(self):
+        config = ProblemConfig.default()
+        fitness_calculator = FitnessCalculator(config=config, coverage_tolerance=0.9)
+        towers = np.array([[0.0, 0.0, 100.0], [config.location_max_x - 1, config.location_max_y - 1, 100.0]])
+
+        assignment = fitness_calculator.calc_best_covering_towers(towers)
+        diff = fitness_calculator.cities_location_array[:, np.newaxis, :] - towers[:, :2]
+        distances = np.einsum('ctj,jk,ctk->ct', diff, fitness_calculator.sigma_inv, diff)
+        coverage = fitness_calculator.calc_coverage_matrix(towers[:, :2])
+        uncovered = coverage.max(axis=0) == 0
+        self.assertTrue(uncovered.any())
+        np.testing.assert_array_equal(np.argmin(distances[uncovered], axis=1), assignment[uncovered])
+        np.testing.assert_array_equal(assignment,
+                                      fitness_calculator.calc_best_covering_towers(towers, max_batch_cells=3))
+
+    def test_decoding_drops_unused_towers(self):
+        random.seed(13)
+        np.random.seed(13)
+        fitness_calculator = FitnessCalculator.shared()
+        chromosome = TowerChromosome.initialize()
+        chromosome.towers = np.concatenate((chromosome.towers, chromosome.towers[:1]))
+
+        towers, assignment = chromosome.encode()
+        self.assertEqual(len(towers), len(np.unique(assignment)))
+        self.assertEqual(fitness_calculator.calculate_fitness_vectorized(towers, assignment),
+                         chromosome.calculate_fitness())
+
+        restored_chromosome = TowerChromosome.from_arrays(towers, assignment)
+        self.assertEqual(chromosome.genome_hash(), restored_chromosome.genome_hash())
+
+    def test_mutation_adds_removes_and_moves_towers(self):
+        np.random.seed(14)
+        operator = TowerMutationOperator()
+        config = operator.config
+        towers_list = [TowerChromosome.initialize().towers for _ in range(200)]
+        original_towers = [towers.copy() for towers in towers_list]
+
+        mutated_towers = operator.mutate_population(towers_list, 0.5, np.random.default_rng(14))
+        for towers, original, mutated in zip(towers_list, original_towers, mutated_towers):
+            np.testing.assert_array_equal(original, towers)
+            self.assertLessEqual(abs(len(mutated) - len(towers)), 1)
+            self.assertGreaterEqual(len(mutated), config.towers_min)
+            self.assertTrue(np.all((mutated[:, 2] >= config.bandwidth_min) & (mutated[:, 2] <= config.bandwidth_max)))
+        towers_delta = [len(mutated) - len(towers) for towers, mutated in zip(towers_list, mutated_towers)]
+        self.assertEqual({-1, 0, 1}, set(towers_delta))
+
+    def test_crossover_splits_the_parents_towers(self):
+        np.random.seed(15)
+        operator = TowerCrossoverOperator()
+        towers1, towers2 = TowerChromosome.initialize().towers, TowerChromosome.initialize().towers
+
+        self.assertIsNone(operator.crossover(towers1, towers2, crossover_rate=0.0))
+        offspring1, offspring2 = operator.crossover(towers1, towers2)
+        parent_rows = np.concatenate((towers1, towers2))
+        offspring_rows = np.concatenate((offspring1, offspring2))
+        np.testing.assert_array_equal(parent_rows[np.lexsort(parent_rows.T)],
+                                      offspring_rows[np.lexsort(offspring_rows.T)])
+
+    def test_crossover_keeps_offspring_within_towers_max(self):
+        default_config = ProblemConfig.default()
+        config = ProblemConfig(default_config.blocks_population, default_config.problem_config, towers_max=4)
+        operator = TowerCrossoverOperator(config)
+        rng = np.random.default_rng(20)
+        towers1 = np.column_stack((rng.uniform(0, 10, (4, 2)), np.full(4, 100.0)))
+        towers2 = np.column_stack((rng.uniform(0, 10, (4, 2)), np.full(4, 200.0)))
+        parent_rows = np.concatenate((towers1, towers2))
+
+        for _ in range(20):
+            for offspring in operator.crossover(towers1, towers2, random_generator=rng):
+                self.assertLessEqual(len(offspring), config.towers_max)
+                self.assertTrue(all(np.any(np.all(parent_rows == row, axis=1)) for row in offspring))
+
+    def test_evolution_and_checkpoint_round_trip(self):
+        random.seed(16)
+        np.random.seed(16)
+        population = Population.initialize(TowerChromosome)
+        population.evaluate_fitness()
+        checkpoint = Checkpoint.capture(16, 0, 2, population, [], [])
+        restored_chromosomes = checkpoint.chromosomes(TowerChromosome)
+        self.assertEqual([chromosome.genome_hash() for chromosome in population.chromosomes],
+                         [chromosome.genome_hash() for chromosome in restored_chromosomes])
+
+        algorithm = EvolutionaryAlgorithm(3, TowerChromosome, fitness_workers=0, evolution_workers=1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution_info, _, _, _ = algorithm.evolve_replicate(seed=16)
+        self.assertEqual(solution_info['num_of_towers'], len(solution_info['towers']))
+
+
+if __name__ == '__main__':
+    unittest.main()